@@ -28,6 +28,8 @@ import time
 class BreakoutGame(App):
     """Arkanoid-style Breakout game for 256×192."""
     
+    fixed_timestep = 1.0 / 60.0  # Balls move per step, so simulate at a steady 60Hz
+    
     def __init__(self):
         super().__init__("Breakout")
         # Screen layout - 256×192 with side panels
@@ -41,6 +43,7 @@ class BreakoutGame(App):
         self.paddle_width = 30
         self.paddle_height = 6
         self.paddle_x = 0
+        self.prev_paddle_x = 0  # paddle_x at the start of the last step (for render())
         self.paddle_y = 0
         self.paddle_speed = 6
         self.paddle_normal_width = 30
@@ -81,6 +84,7 @@ class BreakoutGame(App):
         # Paddle
         self.paddle_width = self.paddle_normal_width
         self.paddle_x = self.play_left + (self.play_width - self.paddle_width) // 2
+        self.prev_paddle_x = self.paddle_x
         self.paddle_y = 170
         
         # Ball
@@ -238,14 +242,19 @@ class BreakoutGame(App):
         
         return False
     
-    def on_update(self, delta_time):
-        """Update game logic."""
+    def on_fixed_update(self, dt):
+        """Update game logic (one fixed 60Hz step)."""
         if self.game_over or self.won:
             return
         
         self.dirty = True
         self.frame_count += 1
         
+        # Remember where things were, so render() can interpolate
+        self.prev_paddle_x = self.paddle_x
+        for ball in self.balls:
+            ball['px'], ball['py'] = ball['x'], ball['y']
+        
         # Update power-up timers
         current_time = time.time()
         expired = []
@@ -407,8 +416,8 @@ class BreakoutGame(App):
                 self.high_score = self.score
                 storage.set('breakout.high_score', self.high_score)
     
-    def render(self, matrix):
-        """Render game at 256×192."""
+    def render(self, matrix, alpha=0.0):
+        """Render game at 256×192, alpha of the way into the next step."""
         # Clear screen
         matrix.clear()
         
@@ -438,20 +447,23 @@ class BreakoutGame(App):
                     matrix.rect(px, py, 3, 3, (255, 255, 255), fill=True)
         
         # Draw paddle with gradient
+        paddle_x = int(self.prev_paddle_x + (self.paddle_x - self.prev_paddle_x) * alpha)
         for i in range(self.paddle_height):
             gray = 150 + i * 15
-            matrix.line(self.paddle_x, self.paddle_y + i,
-                       self.paddle_x + self.paddle_width - 1, self.paddle_y + i,
+            matrix.line(paddle_x, self.paddle_y + i,
+                       paddle_x + self.paddle_width - 1, self.paddle_y + i,
                        (gray, gray, gray))
         
         # Laser mode - add gun turrets
         if 'laser' in self.active_powerups:
-            matrix.rect(self.paddle_x + 3, self.paddle_y - 4, 4, 4, (255, 0, 0), fill=True)
-            matrix.rect(self.paddle_x + self.paddle_width - 7, self.paddle_y - 4, 4, 4, (255, 0, 0), fill=True)
+            matrix.rect(paddle_x + 3, self.paddle_y - 4, 4, 4, (255, 0, 0), fill=True)
+            matrix.rect(paddle_x + self.paddle_width - 7, self.paddle_y - 4, 4, 4, (255, 0, 0), fill=True)
         
-        # Draw balls with glow
+        # Draw balls with glow (new balls have no previous position yet)
         for ball in self.balls:
-            bx, by = int(ball['x']), int(ball['y'])
+            px, py = ball.get('px', ball['x']), ball.get('py', ball['y'])
+            bx = int(px + (ball['x'] - px) * alpha)
+            by = int(py + (ball['y'] - py) * alpha)
             # Glow
             matrix.rect(bx - 1, by - 1, self.ball_size + 2, self.ball_size + 2, (255, 255, 100), fill=True)
             # Ball
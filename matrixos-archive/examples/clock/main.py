@@ -37,6 +37,8 @@ GREY = (128, 128, 128)
 class ClockApp(App):
     """ZX Spectrum clock with multiple display modes."""
     
+    target_fps = 20  # Enough for the pulsing second hand
+    
     def __init__(self):
         super().__init__("Clock")
         self.mode = 0  # 0: digital, 1: analog, 2: both
@@ -65,7 +67,7 @@ class ClockApp(App):
     
     def on_update(self, delta_time):
         """Update app state."""
-        self.pulse_counter += 1
+        self.pulse_counter += delta_time * 60  # Pulse speed in 60fps frames
         # Redraw every frame for smooth pulsing
         self.dirty = True
     
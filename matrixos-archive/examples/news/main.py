@@ -28,6 +28,8 @@ GREEN = (0, 255, 0)
 class NewsApp(App):
     """Mock news reader with Spectrum aesthetic"""
     
+    target_fps = App.ON_DEMAND  # Static screens: redraw on input only
+    
     def __init__(self):
         super().__init__("News")
         # Mock news articles
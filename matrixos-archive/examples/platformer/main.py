@@ -46,15 +46,25 @@ PINK = (255, 100, 200)
 LIME = (200, 255, 0)
 BLACK = (0, 0, 0)
 
+
+def lerp(prev, cur, alpha):
+    """Position alpha of the way from the last step's prev to cur."""
+    return prev + (cur - prev) * alpha
+
+
 class ManicMatrix(App):
     """Epic ZX Spectrum platformer with multiple rooms"""
     
+    fixed_timestep = 1.0 / 60.0  # Gravity and friction apply per step, so simulate at 60Hz
+    
     def __init__(self):
         super().__init__("Manic Matrix")
         
         # Player state
         self.player_x = 32
         self.player_y = 150
+        self.prev_player_x = self.player_x  # Position before the last step (for render())
+        self.prev_player_y = self.player_y
         self.player_vx = 0
         self.player_vy = 0
         self.player_width = 8
@@ -352,16 +362,19 @@ class ManicMatrix(App):
             return True
         return False
     
-    def on_update(self, delta_time):
+    def on_fixed_update(self, delta_time):
         if self.game_over or self.won:
             return
         
+        self.prev_player_x = self.player_x
+        self.prev_player_y = self.player_y
+        
         if self.death_timer > 0:
             self.death_timer -= delta_time
             if self.death_timer <= 0:
                 # Respawn
-                self.player_x = self.spawn_x
-                self.player_y = self.spawn_y
+                self.player_x = self.prev_player_x = self.spawn_x
+                self.player_y = self.prev_player_y = self.spawn_y
                 self.player_vx = 0
                 self.player_vy = 0
                 self.death_timer = 0
@@ -413,6 +426,7 @@ class ManicMatrix(App):
             for platform in room["moving_platforms"]:
                 if "start_x" not in platform:
                     platform["start_x"] = platform["x"]
+                platform["prev_x"] = platform["x"]
                 platform["x"] += platform["vx"] * delta_time
                 # Bounce at range
                 if abs(platform["x"] - platform["start_x"]) > platform["range"]:
@@ -423,6 +437,7 @@ class ManicMatrix(App):
             for enemy in room["enemies"]:
                 if "start_x" not in enemy:
                     enemy["start_x"] = enemy["x"]
+                enemy["prev_x"] = enemy["x"]
                 enemy["x"] += enemy["vx"] * delta_time
                 if abs(enemy["x"] - enemy["start_x"]) > enemy["range"]:
                     enemy["vx"] *= -1
@@ -433,6 +448,7 @@ class ManicMatrix(App):
                 if "y_start" not in crusher:
                     crusher["y_start"] = crusher["y"]
                     crusher["moving_down"] = True
+                crusher["prev_y"] = crusher["y"]
                 
                 if crusher["moving_down"]:
                     crusher["y"] += crusher["speed"] * delta_time
@@ -462,8 +478,8 @@ class ManicMatrix(App):
                 elif next_room >= 0:
                     self.current_room = next_room
                     spawn = self.rooms[self.current_room]["spawn"]
-                    self.player_x = spawn["x"]
-                    self.player_y = spawn["y"]
+                    self.player_x = self.prev_player_x = spawn["x"]
+                    self.player_y = self.prev_player_y = spawn["y"]
                     self.spawn_x = spawn["x"]
                     self.spawn_y = spawn["y"]
                     self.player_vx = 0
@@ -568,7 +584,8 @@ class ManicMatrix(App):
         else:
             self.death_timer = 1.0  # 1 second death animation
     
-    def render(self, matrix):
+    def render(self, matrix, alpha=0.0):
+        """Draw the room, moving things alpha of the way into the next step"""
         matrix.clear()
         
         if self.show_map:
@@ -607,13 +624,14 @@ class ManicMatrix(App):
         
         # Moving platforms
         for platform in room.get("moving_platforms", []):
-            matrix.rect(int(platform["x"]), int(platform["y"]),
+            x = lerp(platform.get("prev_x", platform["x"]), platform["x"], alpha)
+            matrix.rect(int(x), int(platform["y"]),
                        platform["width"], platform["height"], ORANGE, fill=True)
             # Checkerboard pattern
             for i in range(0, platform["width"], 4):
                 for j in range(0, platform["height"], 4):
                     if (i + j) % 8 == 0:
-                        matrix.rect(int(platform["x"] + i), int(platform["y"] + j),
+                        matrix.rect(int(x + i), int(platform["y"] + j),
                                    2, 2, DARK_BLUE, fill=True)
         
         # Spikes
@@ -626,7 +644,7 @@ class ManicMatrix(App):
         
         # Enemies
         for enemy in room.get("enemies", []):
-            ex = int(enemy["x"])
+            ex = int(lerp(enemy.get("prev_x", enemy["x"]), enemy["x"], alpha))
             ey = int(enemy["y"])
             matrix.circle(ex, ey, 5, enemy["color"], fill=True)
             # Evil eyes
@@ -637,12 +655,13 @@ class ManicMatrix(App):
         
         # Crushers
         for crusher in room.get("crushers", []):
-            matrix.rect(int(crusher["x"]), int(crusher["y"]),
+            y = lerp(crusher.get("prev_y", crusher["y"]), crusher["y"], alpha)
+            matrix.rect(int(crusher["x"]), int(y),
                        20, int(crusher["height"]), RED, fill=True)
             # Spikes on bottom
             for i in range(0, 20, 6):
                 sx = int(crusher["x"] + i)
-                sy = int(crusher["y"] + crusher["height"])
+                sy = int(y + crusher["height"])
                 matrix.line(sx, sy, sx + 3, sy + 4, YELLOW)
         
         # Lasers
@@ -687,7 +706,7 @@ class ManicMatrix(App):
                 matrix.circle(px + 4, py + 6, 6, YELLOW, fill=False)
         else:
             # Normal player
-            self.render_player(matrix)
+            self.render_player(matrix, alpha)
         
         # HUD - Top bar overlay
         matrix.rect(0, 0, 256, 14, room["color"], fill=True)
@@ -722,10 +741,10 @@ class ManicMatrix(App):
         
         self.dirty = False
     
-    def render_player(self, matrix):
+    def render_player(self, matrix, alpha=0.0):
         """Draw the player sprite"""
-        px = int(self.player_x)
-        py = int(self.player_y)
+        px = int(lerp(self.prev_player_x, self.player_x, alpha))
+        py = int(lerp(self.prev_player_y, self.player_y, alpha))
         
         # Body
         matrix.rect(px, py, self.player_width, self.player_height, YELLOW, fill=True)
@@ -30,6 +30,8 @@ logger = get_logger("Invaders")
 class SpaceInvadersGame(App):
     """Classic Space Invaders - ENHANCED!"""
     
+    fixed_timestep = 1.0 / 60.0  # Everything moves per step, so simulate at a steady 60Hz
+    
     def __init__(self):
         super().__init__("Invaders")
         
@@ -42,6 +44,7 @@ class SpaceInvadersGame(App):
         self.player_width = 16
         self.player_height = 10
         self.player_x = self.play_left + (self.play_width - self.player_width) // 2
+        self.prev_player_x = self.player_x  # player_x before the last step (for render())
         self.player_y = 170  # Near bottom
         self.player_speed = 4
         
@@ -77,6 +80,7 @@ class SpaceInvadersGame(App):
         """Initialize game."""
         logger.info("Game starting - prepare for invasion!")
         self.player_x = self.play_left + (self.play_width - self.player_width) // 2
+        self.prev_player_x = self.player_x
         self.bullets = []
         self.alien_bullets = []
         self.init_aliens()
@@ -123,6 +127,7 @@ class SpaceInvadersGame(App):
     def reset_game(self):
         """Reset for new game."""
         self.player_x = self.play_left + (self.play_width - self.player_width) // 2
+        self.prev_player_x = self.player_x
         self.bullets = []
         self.alien_bullets = []
         self.init_aliens()
@@ -174,13 +179,18 @@ class SpaceInvadersGame(App):
             
         return False
     
-    def on_update(self, delta_time):
-        """Update game state."""
+    def on_fixed_update(self, delta_time):
+        """Update game state (one fixed 60Hz step)."""
         if self.game_over:
             return
         
         self.frame_count += 1
         
+        # Remember where things were, so render() can interpolate
+        self.prev_player_x = self.player_x
+        for bullet in self.bullets + self.alien_bullets:
+            bullet['py'] = bullet['y']
+        
         # Update bullets
         for bullet in self.bullets[:]:
             bullet['y'] -= self.bullet_speed
@@ -279,8 +289,11 @@ class SpaceInvadersGame(App):
                     self.game_over = True
                     logger.info(f"Game Over! Final Score: {self.score}")
     
-    def render(self, matrix):
-        """Draw game state - Enhanced 256×192 with side panels!"""
+    def render(self, matrix, alpha=0.0):
+        """Draw game state - Enhanced 256×192 with side panels!
+        
+        The ship and bullets are drawn alpha of the way into the next step.
+        """
         # Background
         matrix.fill((0, 0, 28))  # Dark blue space
         
@@ -353,20 +366,21 @@ class SpaceInvadersGame(App):
         # === GAME OBJECTS ===
         
         # Draw player ship - Enhanced with details!
+        px = int(self.prev_player_x + (self.player_x - self.prev_player_x) * alpha)
         # Main body
-        matrix.rect(self.player_x, self.player_y, 
+        matrix.rect(px, self.player_y, 
                    self.player_width, self.player_height, (0, 255, 0), fill=True)
         # Cockpit
-        matrix.rect(self.player_x + 6, self.player_y + 2, 
+        matrix.rect(px + 6, self.player_y + 2, 
                    4, 4, (0, 200, 0), fill=True)
         # Gun turret
-        matrix.rect(self.player_x + self.player_width // 2 - 1, self.player_y - 4, 
+        matrix.rect(px + self.player_width // 2 - 1, self.player_y - 4, 
                    2, 4, (0, 255, 0), fill=True)
         # Engine glow (pulsing)
         glow = 150 + int(50 * abs((self.frame_count % 20) / 10.0 - 1))
-        matrix.rect(self.player_x + 2, self.player_y + self.player_height, 
+        matrix.rect(px + 2, self.player_y + self.player_height, 
                    4, 2, (glow, glow, 0), fill=True)
-        matrix.rect(self.player_x + 10, self.player_y + self.player_height, 
+        matrix.rect(px + 10, self.player_y + self.player_height, 
                    4, 2, (glow, glow, 0), fill=True)
         
         # Draw aliens - Different sprites for different types!
@@ -404,19 +418,27 @@ class SpaceInvadersGame(App):
         
         # Draw player bullets (bright yellow lasers)
         for bullet in self.bullets:
-            matrix.rect(bullet['x'], bullet['y'], 
+            by = self._bullet_y(bullet, alpha)
+            matrix.rect(bullet['x'], by, 
                        2, 6, (255, 255, 0), fill=True)
             # Bright tip
-            matrix.set_pixel(bullet['x'], bullet['y'] - 1, (255, 255, 255))
+            matrix.set_pixel(bullet['x'], by - 1, (255, 255, 255))
         
         # Draw alien bullets (red plasma)
         for bullet in self.alien_bullets:
-            matrix.rect(bullet['x'], bullet['y'], 
+            by = self._bullet_y(bullet, alpha)
+            matrix.rect(bullet['x'], by, 
                        2, 6, (255, 0, 0), fill=True)
             # Dark trail
-            matrix.set_pixel(bullet['x'], bullet['y'] + 6, (100, 0, 0))
+            matrix.set_pixel(bullet['x'], by + 6, (100, 0, 0))
         
         self.dirty = False
+    
+    @staticmethod
+    def _bullet_y(bullet, alpha):
+        """Bullet y alpha of the way into the next step (new bullets: as is)."""
+        py = bullet.get('py', bullet['y'])
+        return int(py + (bullet['y'] - py) * alpha)
 
 
 def run(os_context):
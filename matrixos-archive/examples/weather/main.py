@@ -29,6 +29,8 @@ GREEN = (0, 255, 0)
 class WeatherApp(App):
     """Mock weather display with Spectrum aesthetic"""
     
+    target_fps = App.ON_DEMAND  # Static screens: redraw on input only
+    
     def __init__(self):
         super().__init__("Weather")
         # Mock weather data
@@ -0,0 +1,229 @@
+"""
+Warm App Cache for MatrixOS
+
+Keeps recently used apps resident after the user leaves them, so
+launching them again skips the import and __init__ and resumes them
+where they were left. Suspended apps stay registered with the OS (they
+keep their background ticks) and are resumed with switch_to_app(), which
+calls on_activate().
+
+Two limits decide when an app is evicted - unregistered and dropped,
+so its next launch starts fresh:
+
+- max_resident: at most this many apps stay resident (least recently
+  used goes first)
+- Memory: while the process is over memory_limit_mb, or the system has
+  less than min_free_mb available, the least recently used apps go
+
+Usage:
+    cache = os_context.app_cache
+    entry = cache.get(key)
+    if entry:
+        cache.resume(entry)  # switch_to_app + os_context.run()
+    else:
+        ...import and run the app...
+        cache.put(key, module, new_apps)
+"""
+
+import gc
+import os
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+
+def _read_meminfo_kb(field: str) -> Optional[int]:
+    """A field from /proc/meminfo in kB (None if unavailable)."""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def resident_memory_mb() -> Optional[float]:
+    """This process's resident set size in MB (None if unknown)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def available_memory_mb() -> Optional[float]:
+    """Memory the system can still hand out, in MB (None if unknown)."""
+    kb = _read_meminfo_kb('MemAvailable')
+    if kb is not None:
+        return kb / 1024
+    try:
+        import psutil
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class CachedApp:
+    """A resident app: its module and the App instances it registered."""
+
+    def __init__(self, key: str, module, apps: List):
+        self.key = key
+        self.module = module  # Keeps the app's module globals alive
+        self.apps = apps
+        self.last_used = time.monotonic()
+        self.launches = 1
+
+    @property
+    def main_app(self):
+        """The app to resume (the first one its run() registered)."""
+        return self.apps[0]
+
+
+class AppCache:
+    """LRU cache of suspended apps with a memory-based eviction policy."""
+
+    def __init__(self, os_context, max_resident: int = 3,
+                 memory_limit_mb: Optional[float] = None, min_free_mb: float = 64.0):
+        """
+        Args:
+            os_context: OSContext the apps are registered with
+            max_resident: Suspended apps kept (0 disables the cache)
+            memory_limit_mb: Evict while this process's RSS is above this
+            min_free_mb: Evict while the system has less memory available
+        """
+        self.os = os_context
+        self.max_resident = max_resident
+        self.memory_limit_mb = memory_limit_mb
+        self.min_free_mb = min_free_mb
+        self._entries = OrderedDict()  # key -> CachedApp, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[CachedApp]:
+        """Resident entry for key (marked most recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry.last_used = time.monotonic()
+        entry.launches += 1
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, module, apps: List) -> Optional[CachedApp]:
+        """
+        Keep an app resident after it has run.
+
+        Args:
+            key: Unique app key (e.g. its folder path)
+            module: The app's module
+            apps: App instances its run() registered
+
+        Returns:
+            The entry, or None if there was nothing to cache
+        """
+        if not apps or self.max_resident <= 0:
+            self._unregister(apps)
+            return None
+        entry = CachedApp(key, module, list(apps))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self.enforce_limits()
+        return entry
+
+    def resume(self, entry: CachedApp):
+        """Bring a suspended app back to the foreground and run the OS loop."""
+        self.os.switch_to_app(entry.main_app)
+        self.os.run()
+
+    def suspend(self, entry_or_apps):
+        """Deactivate an app that has left the foreground."""
+        apps = entry_or_apps.apps if isinstance(entry_or_apps, CachedApp) else entry_or_apps
+        for app in apps:
+            self.os.suspend_app(app)
+
+    def under_memory_pressure(self) -> bool:
+        """True if the memory policy wants apps evicted."""
+        if self.memory_limit_mb is not None:
+            rss = resident_memory_mb()
+            if rss is not None and rss > self.memory_limit_mb:
+                return True
+        if self.min_free_mb:
+            available = available_memory_mb()
+            if available is not None and available < self.min_free_mb:
+                return True
+        return False
+
+    def enforce_limits(self) -> int:
+        """
+        Evict least recently used apps until both limits are met. The most
+        recently used app is never evicted for memory.
+
+        Returns:
+            Number of apps evicted
+        """
+        evicted = 0
+        while len(self._entries) > self.max_resident:
+            if not self._evict_oldest():
+                break
+            evicted += 1
+
+        freed = False
+        while len(self._entries) > 1 and self.under_memory_pressure():
+            if not self._evict_oldest():
+                break
+            evicted += 1
+            gc.collect()  # Actually release the app before measuring again
+            freed = True
+        if evicted and not freed:
+            gc.collect()
+        return evicted
+
+    def evict(self, key: str) -> bool:
+        """Drop an app so its next launch starts fresh."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._unregister(entry.apps)
+        self.evictions += 1
+        return True
+
+    def clear(self):
+        """Evict every resident app."""
+        for key in list(self._entries):
+            self.evict(key)
+
+    def get_stats(self) -> dict:
+        """Hit/miss/eviction counters and the resident apps (oldest first)."""
+        return {
+            'resident': [entry.main_app.name for entry in self._entries.values()],
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def _evict_oldest(self) -> bool:
+        for key, entry in self._entries.items():
+            if not any(app.active for app in entry.apps):
+                return self.evict(key)
+        return False  # Everything resident is in use
+
+    def _unregister(self, apps):
+        for app in apps or ():
+            self.os.unregister_app(app)
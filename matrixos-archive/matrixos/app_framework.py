@@ -6,21 +6,17 @@ Provides OS-level app lifecycle management, event handling, and multitasking.
 
 import time
 import sys
+import heapq
+import itertools
+import selectors
 from matrixos import async_tasks
+from matrixos.app_cache import AppCache
+from matrixos.display import DamageTracker
 from matrixos.input import InputEvent
-
-# Debug logging to file
-DEBUG_LOG = None
-def debug_log(msg):
-    global DEBUG_LOG
-    if DEBUG_LOG is None:
-        try:
-            DEBUG_LOG = open('/tmp/matrixos_debug.log', 'w')
-        except:
-            DEBUG_LOG = False
-    if DEBUG_LOG:
-        DEBUG_LOG.write(f"{msg}\n")
-        DEBUG_LOG.flush()
+from matrixos.logger import debug_log, default_log_dir, flush_logs
+from matrixos.profiler import FrameProfiler, PHASES
+from matrixos.ui import Widget
+from matrixos.watchdog import Watchdog
 
 
 class App:
@@ -28,14 +24,67 @@ class App:
 
     Apps don't manage their own event loops - the OS does that.
     Instead, apps implement lifecycle methods that the OS calls.
+
+    Set target_fps to choose how often the OS runs frames for the app:
+    None (default) runs ~60fps while the app is redrawing and sleeps when
+    it's idle, a number runs that many frames per second, and ON_DEMAND
+    only runs a frame for input, task results and timers. With the
+    default, the rate drops to the OS idle rate after a while without
+    input; set idle_throttle to True to drop an explicit target_fps too,
+    or False to never drop.
+
+    Set fixed_timestep (seconds) to simulate in fixed steps: the OS then
+    calls on_fixed_update(dt) zero or more times per frame and passes
+    render() an interpolation alpha, so game speed doesn't depend on the
+    frame rate.
+
+    Set background_interval (seconds) to choose how often
+    on_background_tick() runs while the app is in the background, or None
+    for never. Apps that don't override on_background_tick() are never
+    ticked.
+
+    Set partial_render to True to repaint only what changed: call
+    invalidate(rect) for each region that needs redrawing and the OS
+    clears just those regions and calls render(matrix, clip=rect) with
+    drawing clipped to each one. invalidate() with no rect (or setting
+    dirty directly) still redraws the whole screen. UI widgets stored on
+    the app (or in a list on it) when it is registered or activated are
+    bound to it (see bind_widgets()) and invalidate their own area when
+    they change.
     """
 
+    ON_DEMAND = 0
+    target_fps = None
+    fixed_timestep = None  # e.g. 1.0 / 60.0 to enable on_fixed_update()
+    max_fixed_steps = 5  # Catch-up cap per frame (avoids a spiral of death)
+    background_interval = 1.0  # Seconds between background ticks (None = never)
+    partial_render = False  # Repaint only invalidated regions (see invalidate())
+    idle_throttle = None  # Drop to IDLE_FPS without input (None = only automatic-rate apps)
+
     def __init__(self, name="App"):
         self.name = name
         self.os = None  # Set by OS when registered
         self.active = False
         self.dirty = True  # Needs redraw?
         self.needs_keyboard = False  # Request on-screen keyboard
+        self.fixed_accumulator = 0.0  # Unsimulated time (fixed timestep mode)
+        self.interpolation_alpha = 0.0  # fixed_accumulator / fixed_timestep
+        self.invalid_rects = []  # Regions to repaint (None = whole screen)
+
+    def bind_widgets(self):
+        """Bind the UI widgets stored on the app (directly or in a list).
+
+        The OS calls this when the app is registered and after
+        on_activate(); call it after creating widgets anywhere else.
+        """
+        for value in vars(self).values():
+            if isinstance(value, Widget):
+                if value.app is None:
+                    value.bind(self)
+            elif isinstance(value, (list, tuple)):
+                for widget in value:
+                    if isinstance(widget, Widget) and widget.app is None:
+                        widget.bind(self)
 
     def get_help_text(self):
         """Return list of (key, description) tuples for app-specific controls.
@@ -51,7 +100,7 @@ class App:
 
         Use this to initialize UI, start animations, etc.
         """
-        self.dirty = True  # Always redraw on activation
+        self.invalidate()  # Always redraw everything on activation
 
     def on_deactivate(self):
         """Called when app goes to background.
@@ -61,25 +110,44 @@ class App:
         pass
 
     def on_update(self, delta_time):
-        """Called every frame when app is active (~60fps).
+        """Called every frame when app is active (~60fps while redrawing).
 
         Args:
             delta_time: Time since last frame in seconds
 
         Use this for animations, game logic, etc.
         Keep this fast - return quickly!
+
+        Once the app stops setting dirty, the OS sleeps until input, a
+        task result, a timer or a background tick, so frames arrive less
+        often - use delta_time rather than counting calls.
+        """
+        pass
+
+    def on_fixed_update(self, dt):
+        """Advance the simulation by one fixed step (fixed_timestep mode).
+
+        Args:
+            dt: The app's fixed_timestep in seconds - always the same
+
+        Called zero or more times per frame, before on_update(). Put
+        physics and game logic here so they run at the same speed
+        however fast frames are rendered.
         """
         pass
 
     def on_background_tick(self):
-        """Called periodically when app is in background (~1 second).
+        """Called periodically when app is in background (every
+        background_interval seconds, ~1 second by default).
 
         Use this for background tasks like:
         - Checking timers
         - Fetching data
         - Monitoring for alerts
 
-        Keep this VERY fast - other apps are waiting!
+        Keep this VERY fast - other apps are waiting! Ticks that take
+        longer than OSContext.BACKGROUND_TICK_BUDGET several times in a row
+        get the app ticked less often.
         """
         pass
 
@@ -96,6 +164,22 @@ class App:
         self.dirty = True
         return False
 
+    def invalidate(self, rect=None):
+        """Mark part of the screen as needing a redraw.
+
+        Args:
+            rect: (x, y, width, height) that changed, or None for the
+                  whole screen
+
+        Sets dirty. With partial_render the OS repaints only the
+        invalidated regions; otherwise the whole app is redrawn.
+        """
+        self.dirty = True
+        if rect is None:
+            self.invalid_rects = None
+        elif self.invalid_rects is not None:
+            self.invalid_rects.append(tuple(rect))
+
     def render(self, matrix):
         """Draw the app's UI to the matrix.
 
@@ -104,6 +188,15 @@ class App:
 
         Called by OS after on_update(). Draw your UI here.
         Don't call matrix.show() - OS does that!
+
+        Apps with a fixed_timestep are called as render(matrix, alpha),
+        where alpha (0.0-1.0) is how far the current time is between the
+        last simulation step and the next one, for interpolating positions.
+
+        Apps with partial_render are called as render(matrix, clip=rect)
+        (after alpha, if any). rect is the (x, y, width, height) region
+        being repainted - already cleared, with drawing clipped to it - or
+        None for a full redraw. Skipping what lies outside it is optional.
         """
         self.dirty = False  # Clear dirty flag after render
 
@@ -122,8 +215,111 @@ class App:
             self.os.request_app_switch(self, priority)
 
 
+def run_fixed_steps(app, delta_time):
+    """Run an app's on_fixed_update() steps for a frame of delta_time.
+
+    Adds delta_time to the app's accumulator, runs one fixed step per
+    fixed_timestep it holds (at most max_fixed_steps) and updates
+    app.interpolation_alpha for render().
+
+    Returns:
+        Number of steps run
+    """
+    step = app.fixed_timestep
+    app.fixed_accumulator += delta_time
+    steps = 0
+    while app.fixed_accumulator >= step:
+        if steps >= app.max_fixed_steps:
+            # Too far behind: drop the backlog rather than spiral
+            debug_log(f"[FIXED] {app.name} dropped "
+                      f"{int(app.fixed_accumulator / step)} steps")
+            app.fixed_accumulator %= step
+            break
+        app.on_fixed_update(step)
+        app.fixed_accumulator -= step
+        steps += 1
+    app.interpolation_alpha = app.fixed_accumulator / step
+    return steps
+
+
+MAX_INVALID_REGIONS = 4  # Merge into one bounding box beyond this
+
+
+def take_invalid_regions(app, width, height):
+    """Collect (and reset) the regions a partial_render app invalidated.
+
+    Overlapping regions are merged and everything is clipped to the
+    screen.
+
+    Returns:
+        List of (x, y, width, height), or None for a full redraw
+    """
+    rects = app.invalid_rects
+    app.invalid_rects = []
+    if not app.partial_render or not rects:
+        return None
+    tracker = DamageTracker(width, height, max_rects=MAX_INVALID_REGIONS)
+    for rect in rects:
+        tracker.add(*rect)
+    return tracker.get_rects() or None  # All off-screen: just redraw
+
+
+def render_app(app, matrix, regions=None):
+    """Clear and redraw an app: the whole screen, or just the given regions.
+
+    Each region is cleared and rendered with the matrix clipped to it.
+    Falls back to a full redraw if the matrix can't clip.
+    """
+    args = (app.interpolation_alpha,) if app.fixed_timestep else ()
+    set_clip = getattr(matrix, 'set_clip', None)
+    if regions is None or set_clip is None or not set_clip(None):
+        matrix.clear()
+        if app.partial_render:
+            app.render(matrix, *args, clip=None)
+        else:
+            app.render(matrix, *args)
+        return
+    try:
+        for rect in regions:
+            set_clip(rect)
+            matrix.clear()
+            app.render(matrix, *args, clip=rect)
+    finally:
+        set_clip(None)
+
+
 class OSContext:
-    """The MatrixOS runtime - manages apps, events, and multitasking."""
+    """The MatrixOS runtime - manages apps, events, and multitasking.
+
+    The main loop sleeps in a selector until there is something to do:
+    input on the input driver's fd, a finished async task, a due timer,
+    the next background tick, or - only while the active app is
+    animating - the next frame deadline.
+
+    Background ticks are kept in their own heap, one entry per app, due
+    every app.background_interval seconds. Each frame runs the due ticks
+    until BACKGROUND_FRAME_BUDGET is used up and leaves the rest for the
+    next frame, so a dozen apps never tick in one burst. An app whose tick
+    overruns BACKGROUND_TICK_BUDGET BACKGROUND_OVERRUN_LIMIT times in a
+    row is logged and has its interval doubled (up to
+    BACKGROUND_MAX_THROTTLE times); a tick within budget halves it again.
+
+    App callbacks run under self.watchdog, which logs a stack sample when
+    one stalls and sends the app back to the launcher if it hangs.
+    """
+
+    DEFAULT_FPS = 60  # Frame rate for animating apps without a target_fps
+    ANIMATION_HOLD = 1.0  # Keep frame deadlines this long after the last render
+    IDLE_TIMEOUT = 30.0  # Seconds without input before dropping to IDLE_FPS
+    IDLE_FPS = 2
+    BACKGROUND_TICK_INTERVAL = 1.0  # Used for apps with no background_interval attribute
+    BACKGROUND_FRAME_BUDGET = 0.004  # Seconds of background ticks per frame
+    BACKGROUND_TICK_BUDGET = 0.002  # A single tick longer than this overruns
+    BACKGROUND_OVERRUN_LIMIT = 3  # Consecutive overruns before throttling
+    BACKGROUND_MAX_THROTTLE = 16  # Max multiple of an app's interval
+    TASK_CALLBACK_BUDGET = 0.004  # Seconds of async task callbacks per frame
+    WATCHDOG_INTERRUPT = False  # Raise AppHangError inside hung callbacks (see Watchdog)
+    INPUT_POLL_INTERVAL = 0.01  # Wake-up interval for inputs without an fd
 
     def __init__(self, matrix, input_handler):
         """Initialize the OS.
@@ -141,6 +337,232 @@ class OSContext:
         self.attention_queue = []  # Apps requesting attention
         self.showing_help = False  # Help overlay visible?
         self.help_scroll = 0  # Help scroll position
+        self.showing_profiler = False  # Performance overlay visible? (F3)
+        self._profiler_drawn = 0.0
+        # Per-app frame phase timings, dumped to the log directory periodically
+        self.profiler = FrameProfiler(dump_path=default_log_dir() / "frame_profile.json")
+        # Logs stack samples of stalled app callbacks and sends hung apps home
+        self.watchdog = Watchdog(interrupt=self.WATCHDOG_INTERRUPT)
+        self._timers = []  # Heap of [when, seq, callback]
+        self._background = []  # Heap of [when, seq, app]
+        self._background_seq = {}  # app -> seq of its live heap entry (older ones are stale)
+        self.background_stats = {}  # app name -> tick/overrun/throttle counters
+        self.app_cache = AppCache(self)  # Suspended apps kept warm between launches
+        self._timer_seq = itertools.count()
+        self._selector = None
+        self._input_selectable = False
+        self._last_render = 0.0
+        self._frame_start = 0.0
+        self._last_input = time.monotonic()
+        self.wakeups = 0  # Loop iterations, for measuring idle behaviour
+        self.scheduled_fps = 0  # Frame rate the loop is currently running at
+
+    def call_later(self, delay, callback):
+        """Run callback on the main thread after delay seconds.
+
+        The loop wakes for the timer even when nothing is animating.
+
+        Args:
+            delay: Seconds from now
+            callback: Function called with no arguments
+
+        Returns:
+            Handle for cancel_timer()
+        """
+        timer = [time.monotonic() + delay, next(self._timer_seq), callback]
+        heapq.heappush(self._timers, timer)
+        return timer
+
+    def cancel_timer(self, timer):
+        """Cancel a timer returned by call_later()."""
+        timer[2] = None
+
+    def _run_due_timers(self, now):
+        """Fire every timer whose deadline has passed."""
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback = heapq.heappop(self._timers)
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                debug_log(f"[ERROR] Timer callback crashed: {e}")
+                import traceback
+                debug_log(traceback.format_exc())
+
+    def _schedule_background_tick(self, app, now):
+        """Queue the app's next background tick (if it wants them)."""
+        interval = getattr(app, 'background_interval', self.BACKGROUND_TICK_INTERVAL)
+        if interval is None:
+            return
+        # The default on_background_tick() does nothing - don't schedule it
+        if (getattr(type(app), 'on_background_tick', None) is App.on_background_tick
+                and 'on_background_tick' not in vars(app)):
+            return
+        stats = self.background_stats.get(app.name)
+        throttle = stats['throttle'] if stats else 1
+        seq = next(self._timer_seq)
+        self._background_seq[app] = seq  # Supersedes any entry already queued
+        heapq.heappush(self._background, [now + interval * throttle, seq, app])
+
+    def _record_background_tick(self, app, elapsed):
+        """Count a background tick and throttle apps that keep overrunning."""
+        stats = self.background_stats.get(app.name)
+        if stats is None:
+            stats = self.background_stats[app.name] = {
+                'ticks': 0, 'overruns': 0, 'consecutive': 0, 'throttle': 1
+            }
+        stats['ticks'] += 1
+        if elapsed <= self.BACKGROUND_TICK_BUDGET:
+            stats['consecutive'] = 0
+            if stats['throttle'] > 1:
+                stats['throttle'] //= 2
+            return
+        stats['overruns'] += 1
+        stats['consecutive'] += 1
+        if (stats['consecutive'] >= self.BACKGROUND_OVERRUN_LIMIT
+                and stats['throttle'] < self.BACKGROUND_MAX_THROTTLE):
+            stats['throttle'] *= 2
+            stats['consecutive'] = 0
+            debug_log(f"[BACKGROUND] {app.name} tick took {elapsed * 1000:.1f}ms "
+                      f"(budget {self.BACKGROUND_TICK_BUDGET * 1000:.1f}ms) - "
+                      f"ticking every {stats['throttle']}x interval")
+
+    def _run_background_ticks(self, now):
+        """Run due background ticks within this frame's budget.
+
+        Returns:
+            Number of ticks run
+        """
+        perf = time.perf_counter
+        start = perf()
+        ran = 0
+        while self._background and self._background[0][0] <= now:
+            if ran and perf() - start >= self.BACKGROUND_FRAME_BUDGET:
+                break  # The rest are still due - next frame
+            entry = heapq.heappop(self._background)
+            app = entry[2]
+            if app.os is not self or self._background_seq.get(app) != entry[1]:
+                continue  # Unregistered, or re-registered since - drop it
+            if app is not self.active_app:
+                t0 = perf()
+                try:
+                    self.watchdog.enter(app, 'background')
+                    try:
+                        app.on_background_tick()
+                    finally:
+                        self.watchdog.exit()
+                except Exception as e:
+                    debug_log(f"[ERROR] {app.name}.on_background_tick() crashed: {e}")
+                    import traceback
+                    debug_log(traceback.format_exc())
+                self.watchdog.consume_flag(app)  # Overruns are throttled below
+                elapsed = perf() - t0
+                self.profiler.record(app.name, 'background', elapsed)
+                self._record_background_tick(app, elapsed)
+                ran += 1
+            self._schedule_background_tick(app, now)
+        return ran
+
+    def get_background_stats(self, app_name=None):
+        """Background tick counters: ticks, overruns and current throttle.
+
+        Args:
+            app_name: One app's counters, or None for {app: counters}
+        """
+        if app_name is not None:
+            return self.background_stats.get(app_name)
+        return self.background_stats
+
+    def _open_selector(self):
+        """Register the input and async task wakeup fds with a selector."""
+        self._selector = selectors.DefaultSelector()
+        self._input_selectable = False
+
+        fileno = getattr(self.input, 'fileno', None)
+        fd = fileno() if fileno else None
+        if fd is not None:
+            try:
+                self._selector.register(fd, selectors.EVENT_READ, 'input')
+                self._input_selectable = True
+            except (OSError, ValueError):
+                pass  # Not selectable (e.g. a regular file) - poll instead
+
+        wakeup_fd = async_tasks.get_task_manager().wakeup_fileno()
+        if wakeup_fd is not None:
+            try:
+                self._selector.register(wakeup_fd, selectors.EVENT_READ, 'tasks')
+            except (OSError, ValueError):
+                pass
+
+    def _close_selector(self):
+        """Release the selector."""
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
+    def get_frame_rate(self, now=None):
+        """Frames per second to schedule for the active app (0 = none).
+
+        Uses the app's target_fps; apps without one get DEFAULT_FPS while
+        they are redrawing. After IDLE_TIMEOUT seconds without input the
+        rate is capped at IDLE_FPS until the next event - for apps with
+        an automatic rate, unless the app's idle_throttle says otherwise.
+        Apps with a target_fps or fixed_timestep keep their rate (a game
+        would otherwise slow down while the player just watches).
+        """
+        app = self.active_app
+        if app is None:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        fps = getattr(app, 'target_fps', None)
+        throttle = getattr(app, 'idle_throttle', None)
+        if throttle is None:
+            throttle = fps is None and not getattr(app, 'fixed_timestep', None)
+        if fps is None:
+            # Automatic: animating if it drew this frame or recently
+            animating = (app.dirty or now - self._last_render < self.ANIMATION_HOLD
+                         or self._last_render >= self._frame_start)
+            fps = self.DEFAULT_FPS if animating else 0
+        if fps and throttle and now - self._last_input >= self.IDLE_TIMEOUT:
+            fps = min(fps, self.IDLE_FPS)
+        return fps
+
+    def _next_wait(self, now, frame_start):
+        """Seconds the loop may sleep before the next thing it must do."""
+        deadline = now + self.BACKGROUND_TICK_INTERVAL
+        if self._timers:
+            deadline = min(deadline, self._timers[0][0])
+        if self._background:
+            deadline = min(deadline, self._background[0][0])
+        tasks = async_tasks.get_task_manager()
+        task_deadline = tasks.next_deadline()
+        if task_deadline is not None:
+            deadline = min(deadline, task_deadline)  # Deliver the timeout on time
+        if tasks.has_ready_callbacks():
+            # Callbacks left over from this frame's budget run next frame
+            deadline = min(deadline, frame_start + 1.0 / self.DEFAULT_FPS)
+        self.scheduled_fps = self.get_frame_rate(now)
+        if self.scheduled_fps:
+            deadline = min(deadline, frame_start + 1.0 / self.scheduled_fps)
+        if not self._input_selectable:
+            deadline = min(deadline, now + self.INPUT_POLL_INTERVAL)
+        return max(0.0, deadline - now)
+
+    def _wait_for_work(self, timeout):
+        """Sleep until an fd is ready or the timeout expires.
+
+        Returns:
+            True if input became readable
+        """
+        if timeout <= 0:
+            return False
+        if not self._selector or not self._selector.get_map():
+            time.sleep(timeout)
+            return False
+        ready = self._selector.select(timeout)
+        return any(key.data == 'input' for key, _ in ready)
 
     def register_app(self, app):
         """Register an app with the OS.
@@ -149,7 +571,44 @@ class OSContext:
             app: App instance
         """
         app.os = self
-        self.apps.append(app)
+        if app not in self.apps:
+            self.apps.append(app)
+        app.bind_widgets()
+        self._schedule_background_tick(app, time.monotonic())
+
+    def unregister_app(self, app):
+        """Remove an app from the OS (it gets no more ticks or events).
+
+        Args:
+            app: App instance
+        """
+        if app not in self.apps:
+            return
+        if app.active:
+            self.suspend_app(app)
+        self.apps.remove(app)
+        self._background_seq.pop(app, None)
+        self.attention_queue = [item for item in self.attention_queue if item[1] is not app]
+        app.os = None
+
+    def suspend_app(self, app):
+        """Move an app out of the foreground without switching to another.
+
+        It stays registered (and keeps its background ticks) until it is
+        resumed with switch_to_app(), which calls on_activate() again.
+
+        Args:
+            app: App instance
+        """
+        if not app.active:
+            return
+        app.active = False
+        try:
+            app.on_deactivate()
+        except Exception as e:
+            debug_log(f"[ERROR] {app.name}.on_deactivate() crashed: {e}")
+        if self.active_app is app:
+            self.active_app = None
 
     def set_launcher(self, launcher):
         """Set the launcher app (shown when user presses BACK).
@@ -181,12 +640,16 @@ class OSContext:
         # Activate new app
         self.active_app = app
         app.active = True
+        self._last_input = time.monotonic()  # New app starts at full rate
+        app.fixed_accumulator = 0.0  # Don't simulate the time spent inactive
+        self.watchdog.consume_flag(app)  # Fresh start after a forced return
         try:
             app.on_activate()
         except Exception as e:
             debug_log(f"[ERROR] on_activate() crashed: {e}")
             import traceback
             debug_log(traceback.format_exc())
+        app.bind_widgets()  # Including any on_activate() created
 
         # Clear screen for new app
         self.matrix.clear()
@@ -233,6 +696,7 @@ class OSContext:
         help_items.append(("ESC", "EXIT APP", False))
         help_items.append(("BKSP", "GO BACK", False))
         help_items.append(("TAB", "THIS HELP", False))
+        help_items.append(("F3", "PERF STATS", False))
 
         # Calculate visible range based on scroll
         start_y = 14
@@ -268,6 +732,41 @@ class OSContext:
         # Footer
         self.matrix.centered_text("TAB/BKSP TO CLOSE", self.matrix.height - 8, (100, 100, 100))
 
+    def render_profiler_overlay(self):
+        """Draw frame phase timings (p50/p95 in ms) over the app's UI."""
+        name = self.active_app.name if self.active_app else 'OS'
+        stats = self.profiler.get_stats(name)
+        lines = [f"FPS {self.profiler.get_fps():.0f}"]
+        for phase in PHASES:
+            if phase in stats and phase != 'background':
+                summary = stats[phase]
+                lines.append(f"{phase[:3].upper()} {summary['p50'] * 1000:.1f}/"
+                             f"{summary['p95'] * 1000:.1f}")
+
+        width = min(self.matrix.width, 2 + 8 * max(len(line) for line in lines))
+        self.matrix.rect(0, 0, width, 2 + 8 * len(lines), (0, 0, 0), fill=True)
+        for i, line in enumerate(lines):
+            self.matrix.text(line, 1, 1 + 8 * i, (0, 255, 0) if i == 0 else (255, 255, 0))
+
+    def _check_watchdog_flag(self):
+        """Send the active app to the launcher if the watchdog flagged it.
+
+        Returns:
+            True if the app was flagged
+        """
+        app = self.active_app
+        if not self.watchdog.consume_flag(app):
+            return False
+        debug_log(f"[WATCHDOG] {app.name} overran {self.watchdog.hard_threshold}s "
+                  f"- returning to launcher")
+        if self.launcher:
+            self.switch_to_app(self.launcher)
+        return True
+
+    def get_profile(self, app_name=None):
+        """Frame phase timing summaries in seconds (see FrameProfiler.get_stats)."""
+        return self.profiler.get_stats(app_name)
+
     def run(self):
         """Main OS event loop.
 
@@ -280,29 +779,50 @@ class OSContext:
         # Start async task manager
         async_tasks.get_task_manager().start()
 
-        last_time = time.time()
-        last_background_tick = time.time()
-        frame_time = 1.0 / 60.0  # Target 60fps
+        self._open_selector()
+        self.watchdog.start()
+        last_time = time.monotonic()
+        self._last_input = last_time
+        input_ready = False
+        profiler = self.profiler
+        perf = time.perf_counter
 
         while self.running:
-            frame_start = time.time()
+            self.wakeups += 1
+            frame_start = time.monotonic()
+            self._frame_start = frame_start
             current_time = frame_start
             delta_time = current_time - last_time
             last_time = current_time
+            app_name = self.active_app.name if self.active_app else 'OS'
             
             # Process completed async tasks (invoke callbacks on main thread)
-            async_tasks.process_completed_tasks()
+            t0 = perf()
+            async_tasks.process_completed_tasks(
+                self.TASK_CALLBACK_BUDGET,
+                self.active_app.name if self.active_app else None)
+            t1 = perf()
+            self._run_due_timers(current_time)
+            t2 = perf()
+            profiler.record(app_name, 'tasks', t1 - t0)
+            profiler.record(app_name, 'timers', t2 - t1)
 
             # Handle system-level input events
-            event = self.input.get_key(timeout=0.001)
+            event = self.input.get_key(timeout=0)
+            profiler.record(app_name, 'input', perf() - t2)
             if event:
-                if event.key == InputEvent.HELP:  # TAB = toggle help
+                self._last_input = current_time  # Back to full frame rate
+                if event.key == InputEvent.PROFILER:  # F3 = toggle perf overlay
+                    self.showing_profiler = not self.showing_profiler
+                    if self.active_app:
+                        self.active_app.invalidate()
+                elif event.key == InputEvent.HELP:  # TAB = toggle help
                     self.showing_help = not self.showing_help
                     if not self.showing_help:
                         self.help_scroll = 0
                     # Mark active app as needing redraw
                     if self.active_app:
-                        self.active_app.dirty = True
+                        self.active_app.invalidate()
                 elif self.showing_help:
                     # Handle scrolling in help screen
                     if event.key == 'UP':
@@ -312,7 +832,7 @@ class OSContext:
                     elif event.key == 'DOWN':
                         # Calculate max scroll based on help content
                         app_help_count = len(self.active_app.get_help_text()) if self.active_app else 0
-                        total_items = app_help_count + 6  # App items + spacing + universal (6 items)
+                        total_items = app_help_count + 7  # App items + spacing + universal (7 items)
                         visible_lines = (self.matrix.height - 14 - 16) // 8
                         max_scroll = max(0, total_items - visible_lines)
                         self.help_scroll = min(max_scroll, self.help_scroll + 1)
@@ -323,7 +843,7 @@ class OSContext:
                         self.showing_help = False
                         self.help_scroll = 0
                         if self.active_app:
-                            self.active_app.dirty = True
+                            self.active_app.invalidate()
                 else:
                     # HOME always returns to launcher (like iOS home button) - check FIRST
                     if event.key == InputEvent.HOME:
@@ -340,7 +860,19 @@ class OSContext:
                         # DEBUG: Log what event the app is receiving
                         if event.key in ['c', 'C', 'r', 'R']:
                             debug_log(f"[APP EVENT] App={self.active_app.name} event={event.key}")
-                        handled = self.active_app.on_event(event)
+                        try:
+                            self.watchdog.enter(self.active_app, 'event')
+                            try:
+                                handled = self.active_app.on_event(event)
+                            finally:
+                                self.watchdog.exit()
+                        except Exception as e:
+                            debug_log(f"[ERROR] {self.active_app.name}.on_event() crashed: {e}")
+                            import traceback
+                            debug_log(traceback.format_exc())
+                            if self.launcher:
+                                self.switch_to_app(self.launcher)
+                            continue
                         if event.key in ['c', 'C', 'r', 'R']:
                             debug_log(f"[APP RESULT] handled={handled} needs_keyboard={getattr(self.active_app, 'needs_keyboard', False)}")
                     
@@ -368,17 +900,26 @@ class OSContext:
                     # Weather app special handling (blocking keyboard)
                     debug_log(f"[KEYBOARD] Calling handle_city_input")
                     self.active_app.handle_city_input(self.matrix, self.input)
-                    self.active_app.dirty = True
+                    self.active_app.invalidate()
                     debug_log(f"[KEYBOARD] Returned from handle_city_input")
                 elif hasattr(self.active_app, 'handle_keyboard_input'):
                     # Generic keyboard handling (blocking)
                     self.active_app.handle_keyboard_input(self.matrix, self.input)
-                    self.active_app.dirty = True
+                    self.active_app.invalidate()
 
             # Update active app
             if self.active_app:
+                app_name = self.active_app.name
                 try:
-                    self.active_app.on_update(delta_time)
+                    t0 = perf()
+                    self.watchdog.enter(self.active_app, 'update')
+                    try:
+                        if self.active_app.fixed_timestep:
+                            run_fixed_steps(self.active_app, delta_time)
+                        self.active_app.on_update(delta_time)
+                    finally:
+                        self.watchdog.exit()
+                    profiler.record(app_name, 'update', perf() - t0)
                 except Exception as e:
                     debug_log(f"[ERROR] {self.active_app.name}.on_update() crashed: {e}")
                     import traceback
@@ -388,16 +929,31 @@ class OSContext:
                         self.switch_to_app(self.launcher)
                     continue
 
+                if self._check_watchdog_flag():
+                    continue
+
+                # Keep the performance overlay's numbers moving
+                if self.showing_profiler and current_time - self._profiler_drawn >= 0.5:
+                    self.active_app.dirty = True
+
                 # Only render if something changed (dirty flag)
                 if self.active_app.dirty:
-                    self.matrix.clear()
+                    t0 = perf()
+                    regions = take_invalid_regions(self.active_app, self.matrix.width,
+                                                   self.matrix.height)
                     if self.showing_help:
                         # Show help overlay
+                        self.matrix.clear()
                         self.render_help_overlay()
                     else:
-                        # Show normal app UI
+                        # Show normal app UI (only the invalidated regions
+                        # for partial_render apps)
                         try:
-                            self.active_app.render(self.matrix)
+                            self.watchdog.enter(self.active_app, 'render')
+                            try:
+                                render_app(self.active_app, self.matrix, regions)
+                            finally:
+                                self.watchdog.exit()
                         except Exception as e:
                             debug_log(f"[ERROR] {self.active_app.name}.render() crashed: {e}")
                             import traceback
@@ -406,20 +962,40 @@ class OSContext:
                             if self.launcher:
                                 self.switch_to_app(self.launcher)
                             continue
+                    if self.showing_profiler:
+                        self.render_profiler_overlay()
+                        self._profiler_drawn = current_time
+                    t1 = perf()
                     self.matrix.show()
-
-            # Background tasks (~1 per second)
-            if current_time - last_background_tick >= 1.0:
-                for app in self.apps:
-                    if app != self.active_app:
-                        app.on_background_tick()
-                last_background_tick = current_time
-
-            # Frame rate limiting
-            frame_elapsed = time.time() - frame_start
-            sleep_time = max(0, frame_time - frame_elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+                    t2 = perf()
+                    profiler.record(app_name, 'render', t1 - t0)
+                    profiler.record(app_name, 'show', t2 - t1)
+                    self._last_render = time.monotonic()
+                    profiler.record_present(self._last_render)
+                    if self._check_watchdog_flag():
+                        continue
+
+            # Background ticks that are due, within the frame budget
+            self._run_background_ticks(current_time)
+            profiler.maybe_dump(current_time)
+
+            # Sleep until input, a task result, a timer or the next frame
+            if event or self.attention_queue or not self.running:
+                input_ready = False
+                continue  # More input may be queued (or we're exiting) - don't sleep
+            now = time.monotonic()
+            timeout = self._next_wait(now, frame_start)
+            if input_ready:
+                # Input was readable but produced no event (EOF or a
+                # partial sequence): don't spin on it
+                timeout = min(timeout, self.INPUT_POLL_INTERVAL)
+                time.sleep(timeout)
+                input_ready = False
+            else:
+                input_ready = self._wait_for_work(timeout)
         
+        self._close_selector()
+        self.watchdog.stop()
+        flush_logs()  # Everything the session logged is on disk
         # Clean up async tasks when exiting
         async_tasks.get_task_manager().stop()
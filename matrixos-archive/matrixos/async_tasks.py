@@ -7,15 +7,97 @@ the main 60fps event loop.
 
 Apps can schedule tasks that run in worker threads and receive results
 via callbacks on the main thread.
+
+Scheduling:
+- Tasks run in priority order ('high', 'normal', 'low'), oldest first
+  within a priority.
+- Each app runs at most max_per_app tasks at once (one fewer than the
+  number of workers by default), so one app's slow fetches can never
+  hold every worker while other apps' tasks wait.
+- A task scheduled with a timeout that hasn't finished by its deadline
+  completes with TaskTimeoutError, and its cancellation token is set.
+
+schedule_task() returns the BackgroundTask, which works like a future:
+
+    task = schedule_task(fetch, on_complete, self.name, priority='high', timeout=5.0)
+    task.done()                               # Finished yet?
+    task.result(timeout=1.0)                  # Wait for the value (raises its error)
+    task.add_done_callback(lambda t: ...)     # Called on the main thread
+    task.cancel()                             # Never runs / callback not called
+
+Identical requests can share one run. Tasks scheduled with the same key
+while the first is still queued or running attach to it instead of
+queueing again - each gets its own callback with the shared result. With
+a ttl, a successful result is also reused for ttl seconds after it
+finished, and the task returned is already done:
+
+    schedule_task(fetch_forecast, self.on_forecast, self.name,
+                  key="weather:london", ttl=60.0)
+
+Long-running tasks can stop early when they're cancelled or time out by
+checking the token of the task running on their thread:
+
+    def crunch():
+        token = current_token()
+        for chunk in chunks:
+            token.raise_if_cancelled()
+            ...
+
+Callbacks are delivered by process_completed_tasks(), which the OS calls
+once per frame with a time budget: the foreground app's callbacks go
+first, and whatever doesn't fit in the budget waits for the next frame,
+so a burst of results can't blow a frame. get_callback_stats() reports
+per app how long results waited for delivery and how long callbacks ran.
+
+CPU-bound work (image decoding, resizing) holds the GIL and slows the
+render loop even on a worker thread. schedule_cpu_task() runs it in a
+process pool instead, started on first use. The function and arguments
+are pickled, so the function must be importable (module level - not a
+lambda or closure); the callback still runs on the main thread:
+
+    from matrixos.icon_utils import png_to_rgb
+    schedule_cpu_task(png_to_rgb, ("icon.png", 32), on_pixels, self.name)
+
+Many concurrent I/O operations would each hold a worker thread.
+schedule_coroutine() runs a coroutine on an asyncio event loop in its own
+thread instead (started on first use), so dozens can wait at once; the
+callback still runs on the main thread. Cancelling or timing out the task
+cancels the coroutine:
+
+    async def ping(host):
+        reader, writer = await asyncio.open_connection(host, 80)
+        ...
+    for host in hosts:
+        schedule_coroutine(ping(host), self.on_ping, self.name, timeout=5.0)
 """
 
+import asyncio
+import heapq
+import itertools
+import multiprocessing
+import os
+import pickle
 import threading
 import queue
 import time
-from typing import Callable, Any, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Any, Hashable, Optional, Union
 from dataclasses import dataclass
 
 
+PRIORITIES = {'high': 0, 'normal': 1, 'low': 2}
+
+
+class TaskCancelledError(Exception):
+    """The task was cancelled before it finished."""
+
+
+class TaskTimeoutError(TimeoutError):
+    """The task didn't finish before its timeout."""
+
+
 @dataclass
 class TaskResult:
     """Result from a completed background task."""
@@ -25,21 +107,67 @@ class TaskResult:
     error: Exception = None
 
 
+class CancellationToken:
+    """Tells a cooperative task that it should stop early."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the task was cancelled or timed out."""
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+    def raise_if_cancelled(self):
+        """Raise TaskCancelledError if the task should stop."""
+        if self._event.is_set():
+            raise TaskCancelledError("Task cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout seconds, waking early on cancellation.
+
+        Returns:
+            True if cancelled
+        """
+        return self._event.wait(timeout)
+
+
+_local = threading.local()
+
+
+def current_token() -> CancellationToken:
+    """Cancellation token of the task running on this thread.
+
+    Outside a task this is a fresh token that is never cancelled.
+    """
+    token = getattr(_local, 'token', None)
+    return token if token is not None else CancellationToken()
+
+
 class BackgroundTask:
-    """Represents a background task to be executed."""
+    """A background task to be executed, and a future for its result."""
     
     _next_id = 1
     _id_lock = threading.Lock()
     
     def __init__(self, func: Callable, callback: Optional[Callable] = None, 
-                 app_name: str = "Unknown"):
+                 app_name: str = "Unknown", priority: str = 'normal',
+                 timeout: Optional[float] = None):
         """Create a background task.
         
         Args:
             func: Function to execute in background (should be self-contained)
             callback: Function to call on main thread with TaskResult
             app_name: Name of app scheduling this task (for debugging)
+            priority: 'high', 'normal' or 'low'
+            timeout: Seconds from now until the task fails with
+                     TaskTimeoutError (None = no limit)
         """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority!r}")
         with BackgroundTask._id_lock:
             self.id = BackgroundTask._next_id
             BackgroundTask._next_id += 1
@@ -47,53 +175,211 @@ class BackgroundTask:
         self.func = func
         self.callback = callback
         self.app_name = app_name
-        self.result = None
+        self.priority = PRIORITIES[priority]
+        self.scheduled_at = time.monotonic()
+        self.deadline = self.scheduled_at + timeout if timeout is not None else None
+        self.started_at = None
+        self.completed_at = None
+        self.token = CancellationToken()
+        self.value = None
         self.error = None
-        self.completed = False
+        self.completed = False  # Outcome decided (finished, failed, timed out or cancelled)
         self.success = False
+        self.running = False
+        self._cancelled = False
+        self._delivered = False  # Callbacks have run on the main thread
+        self._done_callbacks = []
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+        self._manager = None
+        self._pool_future = None  # concurrent.futures.Future of a CPU task or coroutine
+        self.key = None  # Coalescing key (see AsyncTaskManager.schedule_task())
+        self.ttl = None  # Seconds a successful keyed result is reused
+        self._followers = []  # Tasks with the same key sharing this one's outcome
     
-    def execute(self):
-        """Execute the task (called by worker thread)."""
+    def execute(self) -> bool:
+        """Execute the task (called by worker thread).
+
+        Returns:
+            True if this run decided the outcome (False if the task was
+            cancelled or timed out meanwhile)
+        """
+        _local.token = self.token
         try:
-            self.result = self.func()
-            self.success = True
+            return self._finish(True, self.func(), None)
         except Exception as e:
-            self.error = e
-            self.success = False
+            return self._finish(False, None, e)
         finally:
+            _local.token = None
+
+    def _finish(self, success: bool, value, error, cancelled: bool = False) -> bool:
+        """Record the outcome unless one was recorded already."""
+        with self._lock:
+            if self.completed:
+                return False
+            self.success = success
+            self.value = value
+            self.error = error
+            self._cancelled = cancelled
+            self.completed_at = time.monotonic()
             self.completed = True
+        self._done_event.set()
+        return True
     
     def get_result(self) -> TaskResult:
         """Get the task result."""
         return TaskResult(
             task_id=self.id,
             success=self.success,
-            result=self.result,
+            result=self.value,
             error=self.error
         )
 
+    # === Future interface ===
+
+    def done(self) -> bool:
+        """True once the task finished, failed, timed out or was cancelled."""
+        return self.completed
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        """Cancel the task (see AsyncTaskManager.cancel_task())."""
+        if self._manager is None:
+            return False
+        return self._manager.cancel_task(self)
+
+    def result(self, timeout: Optional[float] = None):
+        """Wait for the task and return its value.
+
+        Args:
+            timeout: Seconds to wait (None = until done)
+
+        Raises:
+            TimeoutError: If it isn't done within timeout
+            The task's own exception, TaskTimeoutError or TaskCancelledError
+        """
+        if not self._done_event.wait(timeout):
+            raise TimeoutError(f"Task {self.id} still running")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[Exception]:
+        """Wait for the task and return its exception (None on success)."""
+        if not self._done_event.wait(timeout):
+            raise TimeoutError(f"Task {self.id} still running")
+        return self.error
+
+    def add_done_callback(self, fn: Callable):
+        """Call fn(task) on the main thread once the task is done.
+
+        Runs straight away if the task was already delivered.
+        """
+        if self._delivered:
+            fn(self)
+        else:
+            self._done_callbacks.append(fn)
+
 
 class AsyncTaskManager:
     """Manages background task execution with thread pool."""
     
-    def __init__(self, num_workers: int = 2):
+    def __init__(self, num_workers: int = 2, max_per_app: Optional[int] = None,
+                 cpu_workers: Optional[int] = None):
         """Initialize task manager.
         
         Args:
             num_workers: Number of worker threads (default 2 for MatrixOS)
+            max_per_app: Tasks one app may run at once (default: one fewer
+                         than num_workers, so another app can always run)
+            cpu_workers: Processes for schedule_cpu_task() (default: the
+                         cores left over by the OS process, at most 2)
         """
         self.num_workers = num_workers
-        self.task_queue = queue.Queue()
+        if cpu_workers is None:
+            cpu_workers = min(2, max(1, (os.cpu_count() or 2) - 1))
+        self.cpu_workers = cpu_workers
+        self._cpu_pool = None  # Started on first schedule_cpu_task()
+        self._cpu_tasks = set()  # CPU tasks in flight
+        self._event_loop = None  # asyncio loop for schedule_coroutine(), started on first use
+        self._event_loop_thread = None
+        self._coroutines = set()  # Coroutine tasks in flight
+        self.max_per_app = max_per_app if max_per_app is not None else max(1, num_workers - 1)
+        self.app_limits = {}  # app_name -> max_per_app override
         self.result_queue = queue.Queue()
+        self.callback_stats = {}  # app_name -> delivery counters (see get_callback_stats())
+        self._ready = deque()  # Completed tasks whose callbacks are still to run
         self.workers = []
         self.running = False
-        self.tasks = {}  # task_id -> BackgroundTask
+        self.tasks = {}  # task_id -> BackgroundTask (until its callbacks ran)
+        self._queues = {}  # app_name -> heap of (priority, seq, task)
+        self._active = {}  # app_name -> tasks running now
+        self._deadlines = []  # Heap of (deadline, seq, task)
+        self._keyed = {}  # key -> task that will produce its result
+        self._results = {}  # key -> (expires_at, task) for results within their ttl
+        self._result_expiry = []  # Heap of (expires_at, seq, key) for pruning _results
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        # Pipe written whenever a result is queued, so the OS loop can
+        # sleep in select() until there is work for the main thread
+        self._wakeup_r, self._wakeup_w = self._create_wakeup_pipe()
+
+    @staticmethod
+    def _create_wakeup_pipe():
+        """Create a non-blocking (read_fd, write_fd) pair, or (None, None)."""
+        try:
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            return r, w
+        except (OSError, AttributeError):
+            return None, None
+
+    def _close_wakeup_pipe(self):
+        """Close the wakeup pipe (start() opens a new one)."""
+        fds = (self._wakeup_r, self._wakeup_w)
+        self._wakeup_r = self._wakeup_w = None
+        for fd in fds:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def wakeup_fileno(self) -> Optional[int]:
+        """File descriptor that becomes readable when results are waiting.
+
+        Returns:
+            Readable fd for select()/selectors, or None if unsupported
+        """
+        return self._wakeup_r
+
+    def _wake(self):
+        """Signal the main thread that a result is ready."""
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b'\0')
+            except (BlockingIOError, OSError):
+                pass  # Pipe already full - the reader will wake anyway
+
+    def _drain_wakeup(self):
+        """Empty the wakeup pipe before processing results."""
+        if self._wakeup_r is not None:
+            try:
+                while os.read(self._wakeup_r, 512):
+                    pass
+            except (BlockingIOError, OSError):
+                pass
     
     def start(self):
         """Start the worker threads."""
         if self.running:
             return
         
+        if self._wakeup_r is None:
+            self._wakeup_r, self._wakeup_w = self._create_wakeup_pipe()
         self.running = True
         for i in range(self.num_workers):
             worker = threading.Thread(
@@ -105,49 +391,121 @@ class AsyncTaskManager:
             self.workers.append(worker)
     
     def stop(self):
-        """Stop all worker threads."""
-        self.running = False
-        # Add sentinel values to unblock workers
-        for _ in range(self.num_workers):
-            self.task_queue.put(None)
+        """Stop all worker threads, the CPU process pool and the coroutine
+        event loop, and close the wakeup pipe (queued thread tasks wait for
+        the next start())."""
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
         
         # Wait for workers to finish
         for worker in self.workers:
             worker.join(timeout=2.0)
         
         self.workers.clear()
+        # CPU tasks still queued are cancelled; running ones finish in the
+        # background rather than holding up the OS's exit
+        self.shutdown_cpu_pool(wait=False)
+        self.stop_event_loop()
+        self._close_wakeup_pipe()
     
     def _worker_loop(self):
         """Worker thread main loop."""
-        while self.running:
+        while True:
+            with self._cond:
+                while True:
+                    if not self.running:
+                        return
+                    task = self._take_next()
+                    if task is not None:
+                        break
+                    self._cond.wait()
+                self._active[task.app_name] = self._active.get(task.app_name, 0) + 1
+                task.running = True
+                task.started_at = time.monotonic()
+            
             try:
-                task = self.task_queue.get(timeout=0.5)
-                
-                if task is None:  # Sentinel value to exit
-                    break
-                
-                # Execute the task
-                task.execute()
-                
+                finished = task.execute()
+            finally:
+                with self._cond:
+                    self._active[task.app_name] -= 1
+                    task.running = False
+                    self._cond.notify_all()  # The app may be under its limit again
+            
+            if finished:
                 # Put result in result queue for main thread
-                self.result_queue.put(task)
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Worker error: {e}")
+                self._complete(task)
+
+    def _limit(self, app_name: str) -> int:
+        return self.app_limits.get(app_name, self.max_per_app)
+
+    def _take_next(self) -> Optional[BackgroundTask]:
+        """Pop the best task an app under its limit may run (lock held)."""
+        now = time.monotonic()
+        best = None
+        for app_name, heap in self._queues.items():
+            while heap:
+                task = heap[0][2]
+                if task.deadline is not None and now >= task.deadline:
+                    self._time_out(task)
+                if not task.completed:
+                    break
+                heapq.heappop(heap)  # Cancelled or timed out while queued
+            if heap and self._active.get(app_name, 0) < self._limit(app_name):
+                if best is None or heap[0] < best[0]:
+                    best = heap
+        for app_name in [name for name, heap in self._queues.items() if not heap]:
+            del self._queues[app_name]
+        return heapq.heappop(best)[2] if best else None
+
+    def _complete(self, task: BackgroundTask):
+        """Hand a finished task (and tasks sharing its key) to the main thread."""
+        with self._cond:
+            if task.key is not None and self._keyed.get(task.key) is task:
+                del self._keyed[task.key]
+                if task.success and task.ttl:
+                    expires_at = task.completed_at + task.ttl
+                    self._results[task.key] = (expires_at, task)
+                    heapq.heappush(self._result_expiry, (expires_at, next(self._seq), task.key))
+            followers, task._followers = task._followers, []
+        self.result_queue.put(task)
+        for follower in followers:
+            if follower._finish(task.success, task.value, task.error):
+                self.result_queue.put(follower)
+        self._wake()
+
+    def _time_out(self, task: BackgroundTask):
+        task.token.cancel()  # Let a cooperative task stop
+        finished = task._finish(False, None, TaskTimeoutError(f"Task {task.id} timed out"))
+        if task._pool_future:
+            # Stops a coroutine; a CPU task only until a process picks it up
+            task._pool_future.cancel()
+        if finished:
+            self._complete(task)
     
     def schedule_task(self, func: Callable, callback: Optional[Callable] = None,
-                     app_name: str = "Unknown") -> int:
+                     app_name: str = "Unknown", priority: str = 'normal',
+                     timeout: Optional[float] = None, key: Optional[Hashable] = None,
+                     ttl: Optional[float] = None) -> BackgroundTask:
         """Schedule a task to run in background.
         
         Args:
             func: Function to execute (should be self-contained, no shared state)
             callback: Optional callback for when task completes
             app_name: Name of app scheduling task
+            priority: 'high', 'normal' or 'low'
+            timeout: Seconds until the task fails with TaskTimeoutError,
+                     whether it's still queued or running (None = no limit)
+            key: Requests with the same key share one run: while a task with
+                 this key is queued or running, this one waits for its
+                 outcome instead of running func. If the task doing the run
+                 is cancelled, the next waiting task runs its own func in
+                 its place, so other waiters still get a result
+            ttl: Seconds a successful keyed result is reused after it
+                 finished - within them the returned task is already done
         
         Returns:
-            Task ID for tracking
+            The task - a future-like handle (task.id is its ID)
         
         Example:
             def fetch_data():
@@ -161,70 +519,435 @@ class AsyncTaskManager:
                 else:
                     print(f"Error: {result.error}")
             
-            task_id = task_manager.schedule_task(fetch_data, on_complete, "MyApp")
+            task = task_manager.schedule_task(fetch_data, on_complete, "MyApp",
+                                              timeout=10.0)
         """
-        task = BackgroundTask(func, callback, app_name)
+        task = BackgroundTask(func, callback, app_name, priority, timeout)
+        task._manager = self
+        self.tasks[task.id] = task
+        with self._cond:
+            seq = next(self._seq)
+            if task.deadline is not None:
+                heapq.heappush(self._deadlines, (task.deadline, seq, task))
+            cached = None
+            if key is not None:
+                cached = self._results.get(key)
+                if cached and cached[0] <= time.monotonic():
+                    del self._results[key]
+                    cached = None
+                if cached is None:
+                    leader = self._keyed.get(key)
+                    if leader is not None:
+                        leader._followers.append(task)  # Finishes along with it
+                        return task
+                    task.key, task.ttl = key, ttl
+                    self._keyed[key] = task
+            if cached is None:
+                heapq.heappush(self._queues.setdefault(app_name, []), (task.priority, seq, task))
+                self._cond.notify()
+                return task
+        task._finish(True, cached[1].value, None)
+        self._complete(task)  # Callback still runs on the main thread
+        return task
+
+    def forget_key(self, key: Hashable):
+        """Drop a cached keyed result so the next request runs again."""
+        with self._cond:
+            self._results.pop(key, None)
+
+    def schedule_cpu_task(self, func: Callable, args: tuple = (),
+                          callback: Optional[Callable] = None,
+                          app_name: str = "Unknown",
+                          timeout: Optional[float] = None) -> BackgroundTask:
+        """Schedule CPU-bound work to run in a separate process.
+        
+        Args:
+            func: Module-level function (it is pickled to the process)
+            args: Positional arguments for func (pickled too: if they
+                  can't be, the task fails with the pickling error)
+            callback: Optional callback for when task completes (main thread)
+            app_name: Name of app scheduling task
+            timeout: Seconds until the task fails with TaskTimeoutError
+        
+        Returns:
+            The task (a future-like handle, as from schedule_task())
+        
+        Raises:
+            TypeError: If func can't be pickled (e.g. a lambda)
+        """
+        try:
+            pickle.dumps(func)  # Arguments that can't be pickled fail the task
+        except Exception as e:
+            raise TypeError(
+                f"schedule_cpu_task() needs a picklable, module-level function "
+                f"({e}) - use schedule_task() for closures") from None
+        
+        task = BackgroundTask(func, callback, app_name, 'normal', timeout)
+        task._manager = self
         self.tasks[task.id] = task
-        self.task_queue.put(task)
-        return task.id
+        with self._cond:
+            if task.deadline is not None:
+                heapq.heappush(self._deadlines, (task.deadline, next(self._seq), task))
+            self._cpu_tasks.add(task)
+        
+        task.running = True
+        task.started_at = time.monotonic()
+        try:
+            task._pool_future = self._get_cpu_pool().submit(func, *args)
+        except BrokenProcessPool:
+            self._cpu_pool = None  # A worker died - start a fresh pool
+            task._pool_future = self._get_cpu_pool().submit(func, *args)
+        task._pool_future.add_done_callback(lambda future: self._cpu_task_done(task, future))
+        return task
+    
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        if self._cpu_pool is None:
+            # spawn: forking a process with running threads isn't safe
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=self.cpu_workers,
+                mp_context=multiprocessing.get_context('spawn'))
+        return self._cpu_pool
+    
+    def _cpu_task_done(self, task: BackgroundTask, future):
+        """Pool callback (runs on a pool thread): pass the result on."""
+        with self._cond:
+            self._cpu_tasks.discard(task)
+        task.running = False
+        if future.cancelled():
+            # Cancelled or timed out before it started (already delivered),
+            # or dropped by stop()
+            if task._finish(False, None, TaskCancelledError(f"Task {task.id} cancelled"),
+                            cancelled=True):
+                self._complete(task)
+            return
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._cpu_pool = None
+        if task._finish(error is None, None if error else future.result(), error):
+            self._complete(task)
+    
+    def shutdown_cpu_pool(self, wait: bool = True):
+        """Stop the CPU worker processes (restarted on the next CPU task)."""
+        pool, self._cpu_pool = self._cpu_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+    
+    def schedule_coroutine(self, coro, callback: Optional[Callable] = None,
+                           app_name: str = "Unknown",
+                           timeout: Optional[float] = None) -> BackgroundTask:
+        """Schedule a coroutine to run on the task manager's event loop.
+        
+        Coroutines don't hold a worker thread while they wait, so they
+        aren't subject to max_per_app. They must not block (no urlopen or
+        time.sleep) - that would stall every other coroutine.
+        
+        Args:
+            coro: Coroutine object, e.g. fetch(url) for an async def fetch
+            callback: Optional callback for when task completes (main thread)
+            app_name: Name of app scheduling task
+            timeout: Seconds until the task fails with TaskTimeoutError
+                     (the coroutine is cancelled)
+        
+        Returns:
+            The task (a future-like handle, as from schedule_task())
+        
+        Raises:
+            TypeError: If coro isn't a coroutine object
+        """
+        if not asyncio.iscoroutine(coro):
+            raise TypeError(f"schedule_coroutine() needs a coroutine object, "
+                            f"not {type(coro).__name__}")
+        
+        task = BackgroundTask(None, callback, app_name, 'normal', timeout)
+        task._manager = self
+        self.tasks[task.id] = task
+        with self._cond:
+            if task.deadline is not None:
+                heapq.heappush(self._deadlines, (task.deadline, next(self._seq), task))
+            self._coroutines.add(task)
+        
+        task.running = True
+        task.started_at = time.monotonic()
+        task._pool_future = asyncio.run_coroutine_threadsafe(coro, self._get_event_loop())
+        task._pool_future.add_done_callback(lambda future: self._coroutine_done(task, future))
+        return task
+    
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        if self._event_loop is None:
+            loop = asyncio.new_event_loop()
+            self._event_loop_thread = threading.Thread(
+                target=self._run_event_loop, args=(loop,),
+                name="MatrixOS-EventLoop", daemon=True)
+            self._event_loop_thread.start()
+            self._event_loop = loop
+        return self._event_loop
+    
+    @staticmethod
+    def _run_event_loop(loop: asyncio.AbstractEventLoop):
+        """Event loop thread: run until stopped, then cancel what's left."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for pending_task in pending:
+                pending_task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
     
-    def process_completed_tasks(self):
+    def _coroutine_done(self, task: BackgroundTask, future):
+        """Coroutine finished (runs on the event loop thread): pass it on."""
+        with self._cond:
+            self._coroutines.discard(task)
+        task.running = False
+        if future.cancelled():
+            # Cancelled or timed out (already delivered), or the loop stopped
+            error = TaskCancelledError(f"Task {task.id} cancelled")
+            if task._finish(False, None, error, cancelled=True):
+                self._complete(task)
+            return
+        error = future.exception()
+        if task._finish(error is None, None if error else future.result(), error):
+            self._complete(task)
+    
+    def stop_event_loop(self, timeout: float = 2.0):
+        """Stop the coroutine event loop, cancelling running coroutines
+        (restarted on the next schedule_coroutine())."""
+        loop, self._event_loop = self._event_loop, None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        self._event_loop_thread.join(timeout)
+        self._event_loop_thread = None
+    
+    def set_app_limit(self, app_name: str, limit: Optional[int]):
+        """Override max_per_app for one app (None restores the default)."""
+        with self._cond:
+            if limit is None:
+                self.app_limits.pop(app_name, None)
+            else:
+                self.app_limits[app_name] = limit
+            self._cond.notify_all()
+
+    def expire_tasks(self, now: Optional[float] = None) -> int:
+        """Fail every task past its deadline with TaskTimeoutError.
+
+        Returns:
+            Number of tasks that timed out
+        """
+        if now is None:
+            now = time.monotonic()
+        expired = 0
+        with self._cond:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                task = heapq.heappop(self._deadlines)[2]
+                if not task.completed:
+                    self._time_out(task)
+                    expired += 1
+        return expired
+
+    def expire_results(self, now: Optional[float] = None) -> int:
+        """Drop keyed results whose ttl has run out.
+
+        Returns:
+            Number of results dropped
+        """
+        if now is None:
+            now = time.monotonic()
+        dropped = 0
+        with self._cond:
+            while self._result_expiry and self._result_expiry[0][0] <= now:
+                key = heapq.heappop(self._result_expiry)[2]
+                cached = self._results.get(key)
+                if cached is not None and cached[0] <= now:
+                    del self._results[key]
+                    dropped += 1
+        return dropped
+
+    def next_deadline(self) -> Optional[float]:
+        """Monotonic time the next task times out (None if none can)."""
+        with self._cond:
+            while self._deadlines and self._deadlines[0][2].completed:
+                heapq.heappop(self._deadlines)
+            return self._deadlines[0][0] if self._deadlines else None
+    
+    def process_completed_tasks(self, budget: Optional[float] = None,
+                                foreground: Optional[str] = None):
         """Process completed tasks and invoke callbacks.
         
         This MUST be called from the main thread, typically in the OS event loop.
+        
+        Args:
+            budget: Seconds of callbacks to run (None = all of them). At
+                    least one runs; the rest wait for the next call
+            foreground: App whose callbacks run first (the active app)
+        
+        Returns:
+            Number of tasks delivered
         """
-        processed = 0
+        self._drain_wakeup()
+        self.expire_tasks()
+        self.expire_results()
         
-        # Process all completed tasks in result queue
-        while not self.result_queue.empty():
+        ready = self._ready
+        while True:
             try:
-                task = self.result_queue.get_nowait()
-                
-                # Invoke callback on main thread if provided
-                if task.callback:
-                    try:
-                        task.callback(task.get_result())
-                    except Exception as e:
-                        print(f"Callback error for task {task.id}: {e}")
-                
-                # Clean up task
-                if task.id in self.tasks:
-                    del self.tasks[task.id]
-                
-                processed += 1
-                
+                ready.append(self.result_queue.get_nowait())
             except queue.Empty:
                 break
+        if not ready:
+            return 0
+        
+        if foreground is not None and len(ready) > 1:
+            # Foreground first; each group stays in completion order
+            first = [task for task in ready if task.app_name == foreground]
+            if first and len(first) < len(ready):
+                ready = self._ready = deque(
+                    first + [task for task in ready if task.app_name != foreground])
+        
+        processed = 0
+        start = time.perf_counter()
+        while ready:
+            if budget is not None and processed and time.perf_counter() - start >= budget:
+                for task in ready:
+                    self._app_callback_stats(task.app_name)['deferred'] += 1
+                break
+            self._deliver(ready.popleft())
+            processed += 1
         
         return processed
+
+    def has_ready_callbacks(self) -> bool:
+        """True if completions were carried over to the next call."""
+        return bool(self._ready)
+
+    def _app_callback_stats(self, app_name: str) -> dict:
+        stats = self.callback_stats.get(app_name)
+        if stats is None:
+            stats = self.callback_stats[app_name] = {
+                'callbacks': 0, 'deferred': 0,
+                'wait_total': 0.0, 'wait_max': 0.0,
+                'callback_total': 0.0, 'callback_max': 0.0
+            }
+        return stats
+
+    def get_callback_stats(self, app_name: Optional[str] = None) -> Optional[dict]:
+        """
+        Delivery counters: callbacks run, times one was deferred to a later
+        frame, seconds between completion and callback (wait_*) and
+        seconds spent in callbacks (callback_*), with averages.
+        
+        Args:
+            app_name: One app's counters, or None for {app: counters}
+        """
+        def summary(stats):
+            n = stats['callbacks'] or 1
+            return dict(stats, wait_avg=stats['wait_total'] / n,
+                        callback_avg=stats['callback_total'] / n)
+        
+        if app_name is not None:
+            stats = self.callback_stats.get(app_name)
+            return summary(stats) if stats else None
+        return {name: summary(stats) for name, stats in self.callback_stats.items()}
+
+    def _deliver(self, task: BackgroundTask):
+        """Run a finished task's callbacks (main thread)."""
+        task._delivered = True
+        stats = self._app_callback_stats(task.app_name)
+        start = time.monotonic()
+        wait = start - task.completed_at
+        stats['wait_total'] += wait
+        stats['wait_max'] = max(stats['wait_max'], wait)
+        
+        # Invoke callback on main thread if provided
+        if task.callback:
+            try:
+                task.callback(task.get_result())
+            except Exception as e:
+                print(f"Callback error for task {task.id}: {e}")
+        for fn in task._done_callbacks:
+            try:
+                fn(task)
+            except Exception as e:
+                print(f"Done callback error for task {task.id}: {e}")
+        task._done_callbacks = []
+        
+        elapsed = time.monotonic() - start
+        stats['callbacks'] += 1
+        stats['callback_total'] += elapsed
+        stats['callback_max'] = max(stats['callback_max'], elapsed)
+        
+        # Clean up task
+        self.tasks.pop(task.id, None)
     
     def get_task_count(self) -> dict:
-        """Get task queue statistics."""
+        """Get task queue statistics (totals and per app)."""
+        with self._cond:
+            apps = {}
+            for app_name, heap in self._queues.items():
+                queued = sum(1 for entry in heap if not entry[2].completed)
+                apps[app_name] = {'queued': queued, 'active': 0}
+            for app_name, active in self._active.items():
+                if active:
+                    apps.setdefault(app_name, {'queued': 0})['active'] = active
+            cpu = len(self._cpu_tasks)
+            coroutines = len(self._coroutines)
         return {
-            'queued': self.task_queue.qsize(),
+            'queued': sum(app['queued'] for app in apps.values()),
+            'active': sum(app['active'] for app in apps.values()),
+            'cpu': cpu,
+            'coroutines': coroutines,
             'pending': len(self.tasks),
             'workers': len(self.workers),
-            'running': self.running
+            'running': self.running,
+            'apps': apps
         }
     
-    def cancel_task(self, task_id: int) -> bool:
-        """Attempt to cancel a task (only works if not started yet).
+    def cancel_task(self, task: Union[BackgroundTask, int]) -> bool:
+        """Cancel a task.
+        
+        A queued task never runs; a running one has its cancellation
+        token set (threads can't be stopped, so it finishes when it next
+        checks the token, or runs to the end). Either way its callback
+        isn't invoked; done callbacks see task.cancelled().
         
         Args:
-            task_id: ID of task to cancel
+            task: The task or its ID
         
         Returns:
-            True if cancelled, False if already running/completed
+            True if cancelled, False if unknown or already completed
         """
-        if task_id in self.tasks:
-            task = self.tasks[task_id]
-            if not task.completed:
-                # Can't actually stop a running thread, but we can
-                # prevent callback from being invoked
-                task.callback = None
-                del self.tasks[task_id]
-                return True
-        return False
+        if not isinstance(task, BackgroundTask):
+            task = self.tasks.get(task)
+            if task is None:
+                return False
+        task.token.cancel()
+        if not task._finish(False, None, TaskCancelledError(f"Task {task.id} cancelled"),
+                            cancelled=True):
+            return False
+        if task._pool_future:
+            task._pool_future.cancel()
+        task.callback = None
+        self._promote_follower(task)
+        self._complete(task)  # Done callbacks still run on the main thread
+        return True
+
+    def _promote_follower(self, task: BackgroundTask):
+        """Hand a cancelled keyed task's run to the first task still waiting on it."""
+        with self._cond:
+            if task.key is None or self._keyed.get(task.key) is not task:
+                return
+            waiting = [follower for follower in task._followers if not follower.completed]
+            task._followers = []
+            if not waiting:
+                return
+            leader = waiting[0]
+            leader.key, leader.ttl = task.key, task.ttl
+            leader._followers = waiting[1:]
+            self._keyed[task.key] = leader
+            heapq.heappush(self._queues.setdefault(leader.app_name, []),
+                           (leader.priority, next(self._seq), leader))
+            self._cond.notify()
 
 
 # Global task manager instance (initialized by OS)
@@ -241,26 +964,79 @@ def get_task_manager() -> AsyncTaskManager:
 
 
 def schedule_task(func: Callable, callback: Optional[Callable] = None,
-                 app_name: str = "Unknown") -> int:
+                 app_name: str = "Unknown", priority: str = 'normal',
+                 timeout: Optional[float] = None, key: Optional[Hashable] = None,
+                 ttl: Optional[float] = None) -> BackgroundTask:
     """Convenience function to schedule a background task.
     
     Args:
         func: Function to run in background
         callback: Callback for when task completes (receives TaskResult)
         app_name: Name of calling app
+        priority: 'high', 'normal' or 'low'
+        timeout: Seconds until it fails with TaskTimeoutError (None = no limit)
+        key: Share the run of a queued or running task with the same key
+        ttl: Seconds a successful keyed result is reused
     
     Returns:
-        Task ID
+        The task (a future-like handle; task.id is its ID)
     """
-    return get_task_manager().schedule_task(func, callback, app_name)
+    return get_task_manager().schedule_task(func, callback, app_name, priority, timeout,
+                                            key, ttl)
 
 
-def process_completed_tasks():
+def schedule_cpu_task(func: Callable, args: tuple = (),
+                      callback: Optional[Callable] = None,
+                      app_name: str = "Unknown",
+                      timeout: Optional[float] = None) -> BackgroundTask:
+    """Convenience function to run CPU-bound work in the process pool.
+    
+    Args:
+        func: Module-level function to run in another process
+        args: Its arguments (must be picklable)
+        callback: Callback for when task completes (receives TaskResult)
+        app_name: Name of calling app
+        timeout: Seconds until it fails with TaskTimeoutError (None = no limit)
+    
+    Returns:
+        The task (a future-like handle)
+    """
+    return get_task_manager().schedule_cpu_task(func, args, callback, app_name, timeout)
+
+
+def schedule_coroutine(coro, callback: Optional[Callable] = None,
+                       app_name: str = "Unknown",
+                       timeout: Optional[float] = None) -> BackgroundTask:
+    """Convenience function to run a coroutine on the task event loop.
+    
+    Args:
+        coro: Coroutine object to run
+        callback: Callback for when task completes (receives TaskResult)
+        app_name: Name of calling app
+        timeout: Seconds until it's cancelled with TaskTimeoutError (None = no limit)
+    
+    Returns:
+        The task (a future-like handle)
+    """
+    return get_task_manager().schedule_coroutine(coro, callback, app_name, timeout)
+
+
+def cancel_task(task) -> bool:
+    """Convenience function to cancel a task (or task ID)."""
+    return get_task_manager().cancel_task(task)
+
+
+def process_completed_tasks(budget: Optional[float] = None,
+                            foreground: Optional[str] = None):
     """Convenience function to process completed tasks.
     
     Should be called from OS event loop every frame.
+    
+    Args:
+        budget: Seconds of callbacks to run this frame (None = all)
+        foreground: App whose callbacks run first
     """
-    return get_task_manager().process_completed_tasks()
+    return get_task_manager().process_completed_tasks(budget, foreground)
 
 
 # Example usage for apps:
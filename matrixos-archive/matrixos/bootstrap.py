@@ -50,6 +50,8 @@ def boot(project_root=None):
     # Register display drivers
     from matrixos.devices.display.terminal import TerminalDisplayDriver
     device_manager.register_display_driver("terminal", TerminalDisplayDriver)
+    from matrixos.devices.display.shared_memory import SharedFramebufferDriver
+    device_manager.register_display_driver("shared_memory", SharedFramebufferDriver)
     
     try:
         from matrixos.devices.display.macos_window import MacOSWindowDriver
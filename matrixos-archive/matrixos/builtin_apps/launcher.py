@@ -44,6 +44,7 @@ class App:
         self.icon_pixels = None
         self.icon_format = "palette"  # "palette", "rgb", or "hex"
         self.icon_native_size = 16  # Native size of the icon (16 or 32)
+        self.isolated = False  # Run in its own process (see process_runner)
 
         logger.debug(f"Loading config for {folder_path.name}")
         self._load_config()
@@ -61,6 +62,7 @@ class App:
                 self.author = config.get("author", "Unknown")
                 self.version = config.get("version", "1.0.0")
                 self.description = config.get("description", "")
+                self.isolated = bool(config.get("isolated", False))
                 
                 # Check if icon field specifies an emoji
                 icon_field = config.get("icon", "")
@@ -290,6 +292,11 @@ class App:
     def launch(self, os_context):
         """Launch the app using the framework.
 
+        If the app is still resident in os_context.app_cache from an
+        earlier launch it is resumed where it was left; otherwise its
+        module is imported and run() creates it. Either way it is
+        suspended and kept warm when the user leaves it.
+
         Args:
             os_context: OSContext for app execution
 
@@ -302,10 +309,31 @@ class App:
             logger.error(f"main.py not found for {self.name}")
             return False
 
+        if self.isolated:
+            return self._launch_isolated(os_context, main_py)
+
+        cache = os_context.app_cache
+        key = str(self.folder_path)
+        cached = cache.get(key)
+
         print(f"\n{'='*64}")
-        print(f"Launching: {self.name}")
+        print(f"{'Resuming' if cached else 'Launching'}: {self.name}")
         print(f"{'='*64}\n")
 
+        if cached:
+            logger.info(f"Resuming resident {self.name}")
+            try:
+                cache.resume(cached)
+            except Exception as e:
+                logger.error(f"Resumed {self.name} crashed: {e}")
+                cache.evict(key)  # Start fresh next time
+                return False
+            finally:
+                cache.suspend(cached)
+            logger.info(f"{self.name} suspended")
+            return True
+
+        apps_before = list(os_context.apps)
         try:
             # Import app module
             logger.debug(f"Creating module spec for {self.name}")
@@ -329,6 +357,12 @@ class App:
                 print(f"Error: App '{self.name}' missing run(os_context) function!")
                 return False
 
+            # Keep whatever run() registered resident for the next launch
+            new_apps = [app for app in os_context.apps if app not in apps_before]
+            cache.suspend(new_apps)
+            cache.put(key, module, new_apps)
+            logger.info(f"{self.name} suspended ({len(cache)} apps resident)")
+
             print(f"\n{'='*64}")
             print(f"{self.name} exited.")
             print(f"{'='*64}\n")
@@ -338,7 +372,27 @@ class App:
             print(f"Error loading app: {e}")
             import traceback
             traceback.print_exc()
+            # Don't leave a half-started app registered
+            for app in os_context.apps[:]:
+                if app not in apps_before:
+                    os_context.unregister_app(app)
+            return False
+
+    def _launch_isolated(self, os_context, main_py):
+        """Run the app in a child process (isolated apps aren't kept warm)."""
+        from matrixos.process_runner import run_isolated
+
+        print(f"\n{'='*64}")
+        print(f"Launching (isolated): {self.name}")
+        print(f"{'='*64}\n")
+        try:
+            app = run_isolated(os_context, self.name, main_py)
+        except Exception as e:
+            logger.error(f"Isolated {self.name} failed: {e}")
             return False
+        logger.info(f"{self.name} process exited (code {app.exitcode}, "
+                    f"{app.restarts} restarts)")
+        return True
 
 
 class Launcher:
@@ -6,6 +6,7 @@ All display and input drivers inherit from these abstract base classes.
 
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Optional
+from ..display import DamageTracker
 
 
 class DisplayDriver(ABC):
@@ -17,6 +18,7 @@ class DisplayDriver(ABC):
         self.color_mode = "rgb"  # Always RGB for new drivers
         self.name = "Generic Display"
         self.platform = None  # "macos", "linux", "raspberry-pi", etc.
+        self.damage = DamageTracker(width, height)  # Regions changed since last show()
     
     @abstractmethod
     def initialize(self) -> bool:
@@ -30,7 +32,7 @@ class DisplayDriver(ABC):
     
     @abstractmethod
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
-        """Set a single pixel to the given RGB color"""
+        """Set a single pixel to the given RGB color (and self.damage.add_point())"""
         pass
     
     @abstractmethod
@@ -45,13 +47,93 @@ class DisplayDriver(ABC):
     
     def fill(self, color: Tuple[int, int, int] = (0, 0, 0)):
         """Fill entire display with color (default implementation)"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.set_pixel(x, y, color)
+        self.fill_rect(0, 0, self.width, self.height, color)
+        self.damage.add_full()
+    
+    # Bulk region operations. The defaults below fall back to set_pixel;
+    # drivers with a packed framebuffer should override them with row
+    # copies. Drivers record damage for everything drawn through them
+    # (set_pixel included), so show() never skips a frame that changed;
+    # graphics primitives also call mark_dirty() for the whole shape.
+    
+    def fill_rect(self, x: int, y: int, w: int, h: int,
+                  color: Tuple[int, int, int] = (255, 255, 255)):
+        """Fill a rectangle with color (clipped to the display)"""
+        for py in range(max(0, y), min(self.height, y + h)):
+            for px in range(max(0, x), min(self.width, x + w)):
+                self.set_pixel(px, py, color)
+        self.damage.add(x, y, w, h)
+    
+    def hspan(self, x: int, y: int, length: int,
+              color: Tuple[int, int, int] = (255, 255, 255)):
+        """Draw a horizontal run of length pixels starting at (x, y)"""
+        self.fill_rect(x, y, length, 1, color)
+    
+    def vspan(self, x: int, y: int, length: int,
+              color: Tuple[int, int, int] = (255, 255, 255)):
+        """Draw a vertical run of length pixels starting at (x, y)"""
+        self.fill_rect(x, y, 1, length, color)
+    
+    def blit(self, buffer, x: int, y: int, w: int, h: int, transparent=None):
+        """
+        Copy a w x h block of pixels onto the display at (x, y).
+        
+        Args:
+            buffer: Row-major colors - a flat sequence of w*h (r, g, b)
+                tuples, a list of h rows, or bytes of w*h*3 packed RGB
+            x, y: Top-left destination (may be partly off-screen)
+            w, h: Size of the block
+            transparent: Color to skip (e.g. a sprite's background)
+        """
+        if isinstance(buffer, (bytes, bytearray, memoryview)):
+            buffer = memoryview(buffer)
+            buffer = [tuple(buffer[i:i + 3]) for i in range(0, len(buffer), 3)]
+        elif buffer and isinstance(buffer[0], list):
+            buffer = [color for row in buffer for color in row]
+        for py in range(max(0, y), min(self.height, y + h)):
+            base = (py - y) * w - x
+            for px in range(max(0, x), min(self.width, x + w)):
+                color = buffer[base + px]
+                if transparent is None or tuple(color) != tuple(transparent):
+                    self.set_pixel(px, py, color)
+        self.damage.add(x, y, w, h)
+    
+    def set_clip(self, rect=None) -> bool:
+        """
+        Limit drawing to an (x, y, width, height) rectangle (None = anywhere).
+        
+        Returns:
+            bool: False if the driver can't clip (the OS then redraws
+            the whole frame instead of just invalidated regions)
+        """
+        return False
+    
+    def mark_dirty(self, x: int, y: int, width: int, height: int):
+        """Record that a rectangle was drawn to (called by graphics primitives)"""
+        self.damage.add(x, y, width, height)
+    
+    def get_dirty_rects(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Regions changed since the last show().
+        
+        Returns:
+            list: Merged (x, y, width, height) rectangles
+        """
+        return self.damage.get_rects()
+    
+    def reset_damage(self):
+        """Forget accumulated damage (call at the end of show())"""
+        self.damage.reset()
     
     @abstractmethod
     def show(self):
-        """Push buffer to actual display hardware"""
+        """
+        Push buffer to actual display hardware.
+        
+        Drivers can call get_dirty_rects() to push only the damaged
+        regions, and should call reset_damage() once the frame is out.
+        Implementations of clear() must call self.damage.clear_frame().
+        """
         pass
     
     @abstractmethod
@@ -131,6 +213,17 @@ class InputDriver(ABC):
         events = self.poll()
         return events[0] if events else None
     
+    def fileno(self) -> Optional[int]:
+        """
+        File descriptor that becomes readable when input arrives.
+        
+        The OS loop sleeps in select() on it instead of polling.
+        
+        Returns:
+            int: Selectable fd, or None if the driver has to be polled
+        """
+        return None
+    
     @abstractmethod
     def cleanup(self):
         """Release resources and cleanup"""
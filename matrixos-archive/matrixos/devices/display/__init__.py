@@ -2,5 +2,7 @@
 
 from .terminal import TerminalDisplayDriver
 from .macos_window import MacOSWindowDriver
+from .shared_memory import SharedFramebufferDriver, SharedFramebufferReader
 
-__all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver']
+__all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver',
+           'SharedFramebufferDriver', 'SharedFramebufferReader']
@@ -3,11 +3,16 @@ macOS Window Display Driver
 
 Uses Pygame to create a native window displaying the LED matrix.
 Pixels are scaled 2x for better visibility (256x192 -> 512x384 window).
+
+The framebuffer is wrapped in a native-resolution Surface and scaled up
+with pygame.transform.scale, so there is no per-pixel Python work. Nothing
+here is macOS specific: with SDL_VIDEODRIVER=dummy it runs headless.
 """
 
 import pygame
 from typing import Tuple
 from ..base import DisplayDriver
+from ...display import Display
 
 
 class MacOSWindowDriver(DisplayDriver):
@@ -22,9 +27,14 @@ class MacOSWindowDriver(DisplayDriver):
         self.window_width = width * scale
         self.window_height = height * scale
         self.screen = None
-        self.buffer = None
+        self.frame = None  # Packed framebuffer
+        self.native = None  # Surface view of frame.framebuffer (1 px per LED)
+        self._scaled = None  # Window-sized scale target, rebuilt per scale
+        self._gap_mask = None  # LED gap overlay, cached per scale
+        self._gap_mask_scale = None
         self.current_scale = scale  # Track current scale for resizing
         self.aspect_ratio = width / height  # Store aspect ratio for proportional resizing
+        self.needs_full_redraw = True  # Repaint whole window on next show()
         
         # Debug output
         print(f"[MacOSWindowDriver] Init: width={width}, height={height}, scale={scale}, pixel_gap={pixel_gap}")
@@ -40,8 +50,12 @@ class MacOSWindowDriver(DisplayDriver):
             )
             pygame.display.set_caption("MatrixOS - ZX Spectrum Edition")
             
-            # Create pixel buffer
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+            # Create pixel buffer, plus a native-resolution surface that
+            # shares its memory (frombuffer is zero-copy)
+            self.frame = Display(self.width, self.height, color_mode='rgb')
+            self.native = pygame.image.frombuffer(
+                self.frame.framebuffer, (self.width, self.height), 'RGB'
+            )
             
             # Clear to black
             self.clear()
@@ -52,33 +66,59 @@ class MacOSWindowDriver(DisplayDriver):
             print(f"[MacOSWindowDriver] Failed to initialize: {e}")
             return False
     
+    @property
+    def buffer(self):
+        """Back buffer rows, indexable as buffer[y][x]"""
+        return self.frame.buffer if self.frame else None
+    
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
         """Set pixel in buffer"""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = color
+        self.frame.set_pixel(x, y, color)
+        self.damage.add_point(x, y)
     
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get pixel from buffer"""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            return self.buffer[y][x]
-        return (0, 0, 0)
+        return self.frame.get_pixel(x, y)
     
     def clear(self):
-        """Clear buffer to black"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = (0, 0, 0)
+        """Clear buffer to black (in place)"""
+        self.damage.clear_frame()
+        self.frame.clear()
     
     def fill(self, color=(0, 0, 0)):
         """Fill buffer with color"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = color
+        self.damage.add_full()
+        self.frame.fill(color)
+    
+    def fill_rect(self, x, y, w, h, color=(255, 255, 255)):
+        """Fill a rectangle in the native-resolution frame"""
+        self.frame.fill_rect(x, y, w, h, color)
+        self.damage.add(x, y, w, h)
+    
+    def hspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a horizontal run of pixels"""
+        self.frame.hspan(x, y, length, color)
+        self.damage.add(x, y, length, 1)
+    
+    def vspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a vertical run of pixels"""
+        self.frame.vspan(x, y, length, color)
+        self.damage.add(x, y, 1, length)
+    
+    def blit(self, buffer, x, y, w, h, transparent=None):
+        """Copy a w x h block of pixels into the frame (e.g. a sprite)"""
+        self.frame.blit(buffer, x, y, w, h, transparent)
+        self.damage.add(x, y, w, h)
+    
+    def set_clip(self, rect=None) -> bool:
+        """Limit drawing to a rectangle (None = anywhere)"""
+        return self.frame.set_clip(rect)
     
     def show(self):
         """
         Render buffer to Pygame window.
-        Each LED pixel is drawn as a scaled rectangle with optional gap.
+        Damaged regions are scaled up from the native surface; the optional
+        LED gap comes from a cached mask overlay.
         """
         if self.screen is None:
             return
@@ -110,37 +150,67 @@ class MacOSWindowDriver(DisplayDriver):
                     print(f"[Resize] Snapping to: {new_width}×{new_height}")
                     
                     self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+                    self.needs_full_redraw = True
         
-        # Draw pixels based on gap setting
-        if self.pixel_gap > 0:
-            # LED matrix mode: clear background and draw pixels with gaps
-            self.screen.fill((0, 0, 0))
-            pixel_size = max(1, self.current_scale - self.pixel_gap)
-            
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = self.buffer[y][x]
-                    # Use fill instead of draw.rect to avoid antialiasing
-                    rect = pygame.Rect(
-                        x * self.current_scale,
-                        y * self.current_scale,
-                        pixel_size,
-                        pixel_size
-                    )
-                    self.screen.fill(color, rect)
+        # Only repaint what changed since the last frame, unless the window
+        # was resized (or this is the first frame) and needs a full redraw
+        if self.needs_full_redraw:
+            rects = [(0, 0, self.width, self.height)]
         else:
-            # Full pixel mode: no gaps, draw solid blocks without any spacing
+            rects = self.get_dirty_rects()
+        self.reset_damage()
+        if not rects:
+            return
+        
+        # Scale each damaged region of the native-resolution surface in one
+        # C-level call, blit it to the window, then overlay the LED gap mask
+        scale = self.current_scale
+        if self._scaled is None or self._scaled.get_size() != (self.width * scale, self.height * scale):
+            # Scale target must share the native surface's pixel format
+            self._scaled = pygame.Surface((self.width * scale, self.height * scale), 0, self.native)
+        gap_mask = self._get_gap_mask(scale) if self.pixel_gap > 0 else None
+        updated = []
+        for rx, ry, rw, rh in rects:
+            area = pygame.Rect(rx * scale, ry * scale, rw * scale, rh * scale)
+            pygame.transform.scale(
+                self.native.subsurface((rx, ry, rw, rh)),
+                area.size,
+                self._scaled.subsurface(area)
+            )
+            self.screen.blit(self._scaled, area, area)
+            if gap_mask is not None:
+                self.screen.blit(gap_mask, area, area)
+            updated.append(area)
+        
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(updated)
+    
+    def _get_gap_mask(self, scale: int):
+        """
+        Window-sized overlay that paints the black gaps between LEDs.
+        
+        Gap pixels are opaque black and everything else fully transparent.
+        Built once per scale and reused every frame.
+        """
+        if self._gap_mask is not None and self._gap_mask_scale == scale:
+            return self._gap_mask
+        
+        pixel_size = max(1, scale - self.pixel_gap)
+        gap = scale - pixel_size
+        mask = pygame.Surface((self.width * scale, self.height * scale), pygame.SRCALPHA)
+        mask.fill((0, 0, 0, 0))
+        if gap > 0:
+            for x in range(self.width):
+                mask.fill((0, 0, 0, 255), (x * scale + pixel_size, 0, gap, mask.get_height()))
             for y in range(self.height):
-                y_pos = y * self.current_scale
-                for x in range(self.width):
-                    x_pos = x * self.current_scale
-                    color = self.buffer[y][x]
-                    
-                    # Use pygame.draw.rect instead of surface.fill for guaranteed solid blocks
-                    pygame.draw.rect(self.screen, color, 
-                                   (x_pos, y_pos, self.current_scale, self.current_scale), 0)
+                mask.fill((0, 0, 0, 255), (0, y * scale + pixel_size, mask.get_width(), gap))
         
-        pygame.display.flip()
+        self._gap_mask = mask
+        self._gap_mask_scale = scale
+        return mask
     
     def cleanup(self):
         """Cleanup Pygame"""
@@ -0,0 +1,533 @@
+"""
+Shared-Memory Framebuffer Display Driver
+
+Publishes frames into a shared memory segment (or an mmap'd file) so a
+panel refresh loop running in another process can read them without
+copying through a pipe or socket.
+
+Segment layout (all integers little-endian):
+
+    header   magic 'MXFB', version, width, height, front slot
+    slot 0   sequence (u64), frame number (u64), width*height*3 RGB bytes
+    slot 1   same as slot 0
+
+The driver double-buffers: show() writes the slot readers are *not*
+looking at, then flips the front slot. Each slot has a seqlock-style
+sequence counter that is odd while the slot is being written, so a reader
+can use a memoryview of the front slot zero-copy and afterwards check that
+the writer didn't lap it (see SharedFramebufferReader).
+
+Run this module to benchmark frame throughput:
+
+    python -m matrixos.devices.display.shared_memory --frames 2000
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Optional, Tuple
+from ..base import DisplayDriver
+from ...display import Display
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+
+MAGIC = b'MXFB'
+VERSION = 1
+HEADER = struct.Struct('<4sIIII')  # magic, version, width, height, front slot
+SLOT_HEADER = struct.Struct('<QQ')  # sequence, frame number
+HEADER_SIZE = 64  # Slots start cache-line aligned
+SLOT_ALIGN = 64
+FRONT_OFFSET = 16  # Offset of the front slot field within HEADER
+
+DEFAULT_NAME = "matrixos_framebuffer"
+
+
+def _slot_stride(width: int, height: int) -> int:
+    """Bytes per slot (header + pixels), rounded up to SLOT_ALIGN."""
+    size = SLOT_HEADER.size + width * height * 3
+    return (size + SLOT_ALIGN - 1) // SLOT_ALIGN * SLOT_ALIGN
+
+
+def segment_size(width: int, height: int) -> int:
+    """Total size of a framebuffer segment for the given resolution."""
+    return HEADER_SIZE + 2 * _slot_stride(width, height)
+
+
+class _UntrackedSegment:
+    """A POSIX shared memory segment mapped without the resource tracker."""
+
+    def __init__(self, name: str, shm_open):
+        fd = shm_open('/' + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.name = name
+        self.buf = memoryview(self._mmap)
+
+    def close(self):
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+            self._mmap.close()
+
+
+def _attach_shared_memory(name: str):
+    """Attach to an existing segment without letting this process own it.
+
+    Before Python 3.13 SharedMemory registers every segment it opens with
+    the resource tracker, which unlinks it when the reader exits and pulls
+    the framebuffer out from under the driver. There the segment is opened
+    with shm_open() and mapped directly instead.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    try:
+        from _posixshmem import shm_open
+    except ImportError:
+        # Windows: no resource tracker, and the segment lives while mapped
+        return shared_memory.SharedMemory(name=name)
+    return _UntrackedSegment(name, shm_open)
+
+
+class SharedFramebufferDriver(DisplayDriver):
+    """Display driver that publishes frames to shared memory for other processes"""
+
+    def __init__(self, width: int, height: int, name: str = DEFAULT_NAME,
+                 path: Optional[str] = None, attach: bool = False, **kwargs):
+        """
+        Args:
+            width, height: Display size in pixels
+            name: Shared memory segment name (ignored when path is given)
+            path: Publish into this mmap'd file instead of a shared memory segment
+            attach: Publish into an existing segment created by another
+                    process, which keeps ownership (cleanup() won't remove it)
+        """
+        super().__init__(width, height)
+        self.name = "Shared Memory Framebuffer"
+        self.segment_name = name
+        self.path = path
+        self.attach = attach
+        self.display = None
+        self.frames_published = 0
+        self._shm = None
+        self._file = None
+        self._mmap = None
+        self._buf = None
+        self._slot_stride = _slot_stride(width, height)
+        self._front = 0
+        self._sequences = [0, 0]
+        # Shared memory driver ignores scale and pixel_gap settings
+
+    def initialize(self) -> bool:
+        """Create the segment and write its header"""
+        size = segment_size(self.width, self.height)
+        try:
+            if self.attach:
+                return self._attach(size)
+            if self.path:
+                self._file = open(self.path, 'w+b')
+                self._file.truncate(size)
+                self._mmap = mmap.mmap(self._file.fileno(), size)
+                self._buf = memoryview(self._mmap)
+            else:
+                if shared_memory is None:
+                    print("[SharedFramebuffer] multiprocessing.shared_memory needs Python 3.8+")
+                    return False
+                try:
+                    self._shm = shared_memory.SharedMemory(name=self.segment_name,
+                                                           create=True, size=size)
+                except FileExistsError:
+                    # Left behind by a crashed run - take it over
+                    stale = shared_memory.SharedMemory(name=self.segment_name)
+                    stale.close()
+                    stale.unlink()
+                    self._shm = shared_memory.SharedMemory(name=self.segment_name,
+                                                           create=True, size=size)
+                self._buf = self._shm.buf
+
+            self._buf[:size] = bytes(size)
+            HEADER.pack_into(self._buf, 0, MAGIC, VERSION, self.width, self.height, 0)
+            self.display = Display(self.width, self.height, color_mode='rgb')
+            return True
+        except Exception as e:
+            print(f"[SharedFramebuffer] Initialization failed: {e}")
+            self._release()
+            return False
+
+    def _attach(self, size: int) -> bool:
+        """Take over publishing into an existing segment."""
+        if self.path:
+            self._file = open(self.path, 'r+b')
+            self._mmap = mmap.mmap(self._file.fileno(), size)
+            self._buf = memoryview(self._mmap)
+        else:
+            self._shm = _attach_shared_memory(self.segment_name)
+            self._buf = self._shm.buf
+
+        magic, version, width, height, front = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION or (width, height) != (self.width, self.height):
+            print(f"[SharedFramebuffer] {self.path or self.segment_name} is not a "
+                  f"{self.width}x{self.height} framebuffer segment")
+            self._release()
+            return False
+
+        # Carry on from the previous writer. A slot it died writing has an
+        # odd sequence - round up so our writes keep the seqlock even/odd
+        for slot in (0, 1):
+            seq, frame = SLOT_HEADER.unpack_from(self._buf, HEADER_SIZE + slot * self._slot_stride)
+            self._sequences[slot] = seq + (seq & 1)
+            self.frames_published = max(self.frames_published, frame)
+        self._front = front
+        self.display = Display(self.width, self.height, color_mode='rgb')
+        return True
+
+    def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
+        """Set a single pixel"""
+        if self.display:
+            self.display.set_pixel(x, y, color)
+            self.damage.add_point(x, y)
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get pixel color"""
+        if self.display:
+            return self.display.get_pixel(x, y)
+        return (0, 0, 0)
+
+    def clear(self):
+        """Clear the display"""
+        self.damage.clear_frame()
+        if self.display:
+            self.display.clear()
+
+    def fill(self, color=(0, 0, 0)):
+        """Fill display with color"""
+        self.damage.add_full()
+        if self.display:
+            self.display.fill(color)
+
+    def fill_rect(self, x, y, w, h, color=(255, 255, 255)):
+        """Fill a rectangle"""
+        if self.display:
+            self.display.fill_rect(x, y, w, h, color)
+            self.damage.add(x, y, w, h)
+
+    def hspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a horizontal run of pixels"""
+        if self.display:
+            self.display.hspan(x, y, length, color)
+            self.damage.add(x, y, length, 1)
+
+    def vspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a vertical run of pixels"""
+        if self.display:
+            self.display.vspan(x, y, length, color)
+            self.damage.add(x, y, 1, length)
+
+    def blit(self, buffer, x, y, w, h, transparent=None):
+        """Copy a w x h block of pixels onto the display"""
+        if self.display:
+            self.display.blit(buffer, x, y, w, h, transparent)
+            self.damage.add(x, y, w, h)
+
+    def set_clip(self, rect=None) -> bool:
+        """Limit drawing to a rectangle (None = anywhere)"""
+        return bool(self.display and self.display.set_clip(rect))
+
+    def show(self):
+        """Publish the frame (skipped when nothing was drawn)"""
+        if not self.display or self._buf is None:
+            return
+        if self.frames_published and self.damage.is_empty:
+            return
+        # The segment's slots are the double buffer - no need to swap()
+        # the Display's own front buffer as well
+        self.publish(self.display.framebuffer)
+        self.reset_damage()
+
+    def publish(self, frame):
+        """
+        Write a packed RGB frame into the back slot and make it the front.
+
+        Args:
+            frame: width*height*3 bytes-like object
+        """
+        back = 1 - self._front
+        offset = HEADER_SIZE + back * self._slot_stride
+        pixels = offset + SLOT_HEADER.size
+        buf = self._buf
+
+        # Odd sequence: readers that started on this slot must retry
+        seq = self._sequences[back] + 1
+        SLOT_HEADER.pack_into(buf, offset, seq, self.frames_published + 1)
+        buf[pixels:pixels + len(frame)] = frame
+        seq += 1
+        SLOT_HEADER.pack_into(buf, offset, seq, self.frames_published + 1)
+        self._sequences[back] = seq
+
+        struct.pack_into('<I', buf, FRONT_OFFSET, back)
+        self._front = back
+        self.frames_published += 1
+
+    def get_stats(self) -> dict:
+        """Publishing statistics"""
+        return {
+            'frames_published': self.frames_published,
+            'segment': self.path or self.segment_name,
+            'size': segment_size(self.width, self.height)
+        }
+
+    def _release(self):
+        """Unmap the segment"""
+        if self._mmap and self._buf is not None:
+            self._buf.release()
+        self._buf = None
+        if self._shm:
+            self._shm.close()
+            if not self.attach:
+                try:
+                    self._shm.unlink()
+                except FileNotFoundError:
+                    pass
+            self._shm = None
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def cleanup(self):
+        """Remove the shared memory segment unless attached (an mmap'd file is left in place)"""
+        self._release()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Available wherever shared memory or mmap is"""
+        return True
+
+    @classmethod
+    def get_priority(cls) -> int:
+        """Never auto-selected - choose it with "driver": "shared_memory" """
+        return 0
+
+    @classmethod
+    def get_platform_preference(cls) -> str:
+        """No platform preference"""
+        return None
+
+
+class SharedFramebufferReader:
+    """
+    Reads frames published by a SharedFramebufferDriver in another process.
+
+    Zero-copy access:
+
+        frame, seq, view = reader.begin()
+        ...use view (width*height*3 RGB bytes)...
+        if not reader.validate(seq):
+            ...the writer reused the slot meanwhile, discard and retry...
+
+    read_frame() wraps that loop and copies into a caller-owned buffer.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME, path: Optional[str] = None):
+        """
+        Args:
+            name: Shared memory segment name
+            path: Read from this mmap'd file instead
+        """
+        self._shm = None
+        self._file = None
+        self._mmap = None
+        if path:
+            self._file = open(path, 'r+b')
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+            self._buf = memoryview(self._mmap)
+        else:
+            self._shm = _attach_shared_memory(name)
+            self._buf = self._shm.buf
+
+        magic, version, width, height, _ = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a MatrixOS framebuffer segment: {path or name}")
+        self.width = width
+        self.height = height
+        self.frame_size = width * height * 3
+        self._slot_stride = _slot_stride(width, height)
+        self._slot = 0
+        self.retries = 0  # Reads that raced the writer
+
+    def _slot_offset(self, slot: int) -> int:
+        return HEADER_SIZE + slot * self._slot_stride
+
+    def begin(self) -> Tuple[int, int, memoryview]:
+        """
+        Start a zero-copy read of the newest complete frame.
+
+        Returns:
+            (frame_number, sequence, view) - frame_number is 0 until the
+            first frame is published. Pass sequence to validate() once done
+            with view.
+        """
+        while True:
+            slot = struct.unpack_from('<I', self._buf, FRONT_OFFSET)[0]
+            offset = self._slot_offset(slot)
+            seq, frame = SLOT_HEADER.unpack_from(self._buf, offset)
+            if seq & 1:
+                # Writer lapped us and is rewriting this slot
+                self.retries += 1
+                continue
+            self._slot = slot
+            start = offset + SLOT_HEADER.size
+            return frame, seq, self._buf[start:start + self.frame_size]
+
+    def validate(self, seq: int) -> bool:
+        """True if the slot from begin() wasn't rewritten while it was read."""
+        current = SLOT_HEADER.unpack_from(self._buf, self._slot_offset(self._slot))[0]
+        return current == seq
+
+    def read_frame(self, into: Optional[bytearray] = None) -> Tuple[int, bytearray]:
+        """
+        Copy the newest complete frame.
+
+        Args:
+            into: Reusable width*height*3 bytearray (allocated if None)
+
+        Returns:
+            (frame_number, buffer)
+        """
+        if into is None:
+            into = bytearray(self.frame_size)
+        while True:
+            frame, seq, view = self.begin()
+            into[:] = view
+            view.release()
+            if self.validate(seq):
+                return frame, into
+            self.retries += 1
+
+    def frame_number(self) -> int:
+        """Number of the newest published frame (0 before the first)."""
+        slot = struct.unpack_from('<I', self._buf, FRONT_OFFSET)[0]
+        return SLOT_HEADER.unpack_from(self._buf, self._slot_offset(slot))[1]
+
+    def wait_for_frame(self, after: int, timeout: float = 1.0,
+                       poll_interval: float = 0.001) -> bool:
+        """
+        Wait until a frame newer than `after` is published.
+
+        Returns:
+            True if a new frame is available, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self.frame_number() <= after:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def close(self):
+        """Detach from the segment (never removes it)"""
+        if self._mmap and self._buf is not None:
+            self._buf.release()
+        self._buf = None
+        if self._shm:
+            self._shm.close()
+            self._shm = None
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _benchmark_reader(name, path, frames, result):
+    """Reader process for benchmark(): read until the last frame arrives."""
+    reader = SharedFramebufferReader(name=name, path=path)
+    buffer = bytearray(reader.frame_size)
+    seen = 0
+    reads = 0
+    while seen < frames:
+        if not reader.wait_for_frame(seen, timeout=5.0, poll_interval=0):
+            break
+        seen, _ = reader.read_frame(buffer)
+        reads += 1
+    result.put((reads, reader.retries, seen))
+    reader.close()
+
+
+def benchmark(width: int = 256, height: int = 192, frames: int = 1000,
+              path: Optional[str] = None) -> dict:
+    """
+    Measure publish throughput with a reader in a separate process.
+
+    Returns:
+        dict of frames/s, MB/s, frames the reader saw and torn-read retries
+    """
+    import multiprocessing
+
+    name = f"{DEFAULT_NAME}_bench_{os.getpid()}"
+    driver = SharedFramebufferDriver(width, height, name=name, path=path)
+    if not driver.initialize():
+        raise RuntimeError("Could not create shared framebuffer")
+
+    result = multiprocessing.Queue()
+    reader = multiprocessing.Process(target=_benchmark_reader,
+                                     args=(name, path, frames, result))
+    reader.start()
+    try:
+        time.sleep(0.2)  # Let the reader attach
+        start = time.perf_counter()
+        for i in range(frames):
+            driver.fill((i & 0xFF, 0, 255 - (i & 0xFF)))
+            driver.show()
+        elapsed = time.perf_counter() - start
+        reads, retries, last = result.get(timeout=10)
+    finally:
+        reader.join(timeout=5)
+        driver.cleanup()
+
+    frame_bytes = width * height * 3
+    return {
+        'frames': frames,
+        'seconds': elapsed,
+        'fps': frames / elapsed,
+        'mb_per_s': frames * frame_bytes / elapsed / 1e6,
+        'reader_frames': reads,
+        'reader_last_frame': last,
+        'torn_retries': retries
+    }
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shared framebuffer throughput benchmark")
+    parser.add_argument('--width', type=int, default=256)
+    parser.add_argument('--height', type=int, default=192)
+    parser.add_argument('--frames', type=int, default=1000)
+    parser.add_argument('--path', help="Use an mmap'd file instead of shared memory")
+    args = parser.parse_args()
+
+    stats = benchmark(args.width, args.height, args.frames, args.path)
+    print(f"Published {stats['frames']} frames of {args.width}x{args.height} "
+          f"in {stats['seconds']:.3f}s")
+    print(f"  {stats['fps']:.0f} frames/s, {stats['mb_per_s']:.1f} MB/s")
+    print(f"  Reader saw {stats['reader_frames']} frames "
+          f"(last #{stats['reader_last_frame']}), {stats['torn_retries']} torn reads retried")
@@ -3,29 +3,56 @@ Terminal Display Driver
 
 Cross-platform display driver that renders to terminal using ANSI escape codes.
 Uses the existing Display and TerminalRenderer classes.
+
+With threaded=True frames are written by a FramePresenter output thread,
+so a slow terminal or SSH link drops frames instead of stalling the app
+loop. It is off by default: the output thread's writes would interleave
+with print() output from the main thread (boot, launcher and debug
+messages) and corrupt the screen.
 """
 
+import os
 import sys
 from typing import Tuple
 from ..base import DisplayDriver
 from ...display import Display, TerminalRenderer
+from ...presenter import FramePresenter
 
 
 class TerminalDisplayDriver(DisplayDriver):
     """Display driver for terminal output using ANSI escape codes"""
     
-    def __init__(self, width: int, height: int, **kwargs):
+    def __init__(self, width: int, height: int, color_depth: str = None,
+                 threaded: bool = False, **kwargs):
         super().__init__(width, height)
         self.name = "Terminal Display"
         self.display = None
         self.renderer = None
+        self.threaded = threaded  # Present frames on a background thread
+        self.presenter = None
+        self.output_display = None  # Presenter-owned copy the renderer reads
+        self.frames_written = 0
+        # '256' or 'truecolor'; auto-detected from $COLORTERM if not given
+        if color_depth is None:
+            colorterm = os.environ.get('COLORTERM', '').lower()
+            color_depth = 'truecolor' if colorterm in ('truecolor', '24bit') else '256'
+        self.color_depth = color_depth
         # Terminal driver ignores scale and pixel_gap settings
     
     def initialize(self) -> bool:
         """Initialize the terminal display"""
         try:
             self.display = Display(self.width, self.height, color_mode='rgb')
-            self.renderer = TerminalRenderer(self.display)
+            if self.threaded:
+                # The renderer reads a private copy owned by the output thread
+                self.output_display = Display(self.width, self.height, color_mode='rgb')
+                self.presenter = FramePresenter(self._present_frame)
+                self.presenter.start()
+            else:
+                self.output_display = self.display
+            # Delta mode: only changed cells are rewritten each frame
+            self.renderer = TerminalRenderer(self.output_display, delta=True,
+                                             color_depth=self.color_depth)
             return True
         except Exception as e:
             print(f"[TerminalDisplay] Initialization failed: {e}")
@@ -35,6 +62,7 @@ class TerminalDisplayDriver(DisplayDriver):
         """Set a single pixel"""
         if self.display:
             self.display.set_pixel(x, y, color)
+            self.damage.add_point(x, y)
     
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get pixel color"""
@@ -44,24 +72,82 @@ class TerminalDisplayDriver(DisplayDriver):
     
     def clear(self):
         """Clear the display"""
+        self.damage.clear_frame()
         if self.display:
             self.display.clear()
     
     def fill(self, color=(0, 0, 0)):
         """Fill display with color"""
+        self.damage.add_full()
         if self.display:
             self.display.fill(color)
     
+    def fill_rect(self, x, y, w, h, color=(255, 255, 255)):
+        """Fill a rectangle (row slices into the packed framebuffer)"""
+        if self.display:
+            self.display.fill_rect(x, y, w, h, color)
+            self.damage.add(x, y, w, h)
+    
+    def hspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a horizontal run of pixels"""
+        if self.display:
+            self.display.hspan(x, y, length, color)
+            self.damage.add(x, y, length, 1)
+    
+    def vspan(self, x, y, length, color=(255, 255, 255)):
+        """Draw a vertical run of pixels"""
+        if self.display:
+            self.display.vspan(x, y, length, color)
+            self.damage.add(x, y, 1, length)
+    
+    def blit(self, buffer, x, y, w, h, transparent=None):
+        """Copy a w x h block of pixels onto the display"""
+        if self.display:
+            self.display.blit(buffer, x, y, w, h, transparent)
+            self.damage.add(x, y, w, h)
+    
+    def set_clip(self, rect=None) -> bool:
+        """Limit drawing to a rectangle (None = anywhere)"""
+        return bool(self.display and self.display.set_clip(rect))
+
     def show(self):
-        """Push buffer to terminal"""
-        if self.renderer:
-            self.renderer.display_in_terminal(
-                use_half_blocks=True,
-                clear_screen=True
-            )
+        """Push buffer to terminal (skipped when nothing was drawn)"""
+        if self.renderer and not self.damage.is_empty:
+            if self.presenter:
+                # Snapshot the frame and let the output thread write it
+                self.presenter.submit(bytes(self.display.framebuffer))
+            else:
+                self._write_frame()
+        self.reset_damage()
+    
+    def _present_frame(self, frame: bytes):
+        """Presenter sink: render a frame snapshot (runs on the output thread)"""
+        self.output_display.framebuffer[:] = frame
+        self._write_frame()
+    
+    def _write_frame(self):
+        """Render output_display to the terminal"""
+        self.renderer.display_in_terminal(
+            use_half_blocks=True,
+            clear_screen=True
+        )
+        self.frames_written += 1
+    
+    def get_stats(self) -> dict:
+        """
+        Frame presentation counters.
+        
+        Returns:
+            dict: presented, dropped and queued frame counts
+        """
+        if self.presenter:
+            return self.presenter.get_stats()
+        return {'presented': self.frames_written, 'dropped': 0, 'queued': 0, 'running': False}
     
     def cleanup(self):
         """Cleanup terminal state"""
+        if self.presenter:
+            self.presenter.stop(flush=False)
         # Clear screen and reset cursor
         print('\033[2J\033[H\033[0m', end='')
         sys.stdout.flush()
@@ -31,6 +31,7 @@ class PygameInputDriver(InputDriver):
             pygame.K_BACKSPACE: InputEvent.BACK,
             pygame.K_ESCAPE: InputEvent.HOME,
             pygame.K_TAB: InputEvent.HELP,
+            pygame.K_F3: InputEvent.PROFILER,
         }
     
     def initialize(self) -> bool:
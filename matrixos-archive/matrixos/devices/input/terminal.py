@@ -41,6 +41,10 @@ class TerminalInputDriver(InputDriver):
         
         return events
     
+    def fileno(self):
+        """stdin, so the OS loop can wait for key presses"""
+        return self.keyboard.fileno() if self.keyboard else None
+    
     def cleanup(self):
         """Restore terminal settings"""
         if self.keyboard:
@@ -4,18 +4,221 @@ Provides a framebuffer for LED matrix displays with terminal rendering.
 """
 
 import os
+import sys
 from typing import Tuple, Optional
 
 
+class _PackedRow:
+    """
+    One row of a packed RGB framebuffer, indexable like a list of tuples.
+
+    Returned by PackedBuffer so legacy code reading display.buffer[y][x]
+    keeps working against the bytearray framebuffer.
+    """
+
+    __slots__ = ('_display', '_offset')
+
+    def __init__(self, display, y: int):
+        self._display = display
+        self._offset = y * display.width * 3
+
+    def __len__(self):
+        return self._display.width
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(self._display.width))]
+        if x < 0:
+            x += self._display.width
+        if not 0 <= x < self._display.width:
+            raise IndexError("row index out of range")
+        i = self._offset + x * 3
+        fb = self._display.framebuffer
+        return (fb[i], fb[i + 1], fb[i + 2])
+
+    def __setitem__(self, x: int, value):
+        if x < 0:
+            x += self._display.width
+        if not 0 <= x < self._display.width:
+            raise IndexError("row index out of range")
+        r, g, b = self._display._to_rgb(value)
+        i = self._offset + x * 3
+        self._display.framebuffer[i:i + 3] = bytes((r, g, b))
+
+    def __iter__(self):
+        return iter(self._display.get_row(self._offset // (self._display.width * 3)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class PackedBuffer:
+    """
+    Compatibility shim exposing a packed framebuffer as buffer[y][x].
+
+    Reads return (r, g, b) tuples and writes are packed straight into the
+    underlying bytearray. New code should use Display.pixels instead.
+    """
+
+    __slots__ = ('_display',)
+
+    def __init__(self, display):
+        self._display = display
+
+    def __len__(self):
+        return self._display.height
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [self[i] for i in range(*y.indices(self._display.height))]
+        if y < 0:
+            y += self._display.height
+        if not 0 <= y < self._display.height:
+            raise IndexError("buffer index out of range")
+        return _PackedRow(self._display, y)
+
+    def __iter__(self):
+        for y in range(self._display.height):
+            yield _PackedRow(self._display, y)
+
+
+class DamageTracker:
+    """
+    Accumulates dirty rectangles for a framebuffer between two show() calls.
+
+    Drawing primitives report the bounding box they touched with add().
+    Rectangles are merged as they arrive, so a frame that touches a few
+    small areas yields a short list of regions a driver can push instead
+    of the whole panel.
+
+    clear() does not damage the whole frame: only what was drawn since the
+    previous clear differs from black, so those regions are carried over
+    into the damage list instead.
+    """
+
+    def __init__(self, width: int, height: int, max_rects: int = 32):
+        """
+        Initialize the tracker.
+
+        Args:
+            width: Framebuffer width in pixels
+            height: Framebuffer height in pixels
+            max_rects: Rectangles kept before collapsing to one bounding box
+        """
+        self.width = width
+        self.height = height
+        self.max_rects = max_rects
+        self._damage = []  # [x0, y0, x1, y1] with exclusive x1/y1
+        self._drawn = []   # Regions drawn since the last clear()
+
+    def add(self, x: int, y: int, width: int, height: int):
+        """Mark a rectangle as damaged (clipped to the framebuffer)."""
+        x0 = max(0, int(x))
+        y0 = max(0, int(y))
+        x1 = min(self.width, int(x) + int(width))
+        y1 = min(self.height, int(y) + int(height))
+        if x0 >= x1 or y0 >= y1:
+            return
+        self._merge_into(self._damage, x0, y0, x1, y1)
+        self._merge_into(self._drawn, x0, y0, x1, y1)
+
+    def add_point(self, x: int, y: int):
+        """Mark one pixel as damaged (cheap when it extends the last rect)."""
+        damage = self._damage
+        drawn = self._drawn
+        if damage and drawn:
+            d = damage[-1]
+            r = drawn[-1]
+            if (d[0] <= x < d[2] and d[1] <= y < d[3] and
+                    r[0] <= x < r[2] and r[1] <= y < r[3]):
+                return
+        self.add(x, y, 1, 1)
+
+    def add_full(self):
+        """Mark the whole framebuffer as damaged and drawn (e.g. after fill)."""
+        self._damage = [[0, 0, self.width, self.height]]
+        self._drawn = [[0, 0, self.width, self.height]]
+
+    def clear_frame(self):
+        """Record a clear(): everything drawn since the last clear is damaged."""
+        for x0, y0, x1, y1 in self._drawn:
+            self._merge_into(self._damage, x0, y0, x1, y1)
+        self._drawn = []
+
+    def reset(self):
+        """Forget accumulated damage (call once the frame has been pushed)."""
+        self._damage = []
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed since the last reset()."""
+        return not self._damage
+
+    def get_rects(self) -> list:
+        """
+        Get the merged damage as a list of (x, y, width, height) tuples.
+
+        Overlapping and touching rectangles are combined before returning.
+        """
+        rects = [list(r) for r in self._damage]
+        merged = True
+        while merged and len(rects) > 1:
+            merged = False
+            out = []
+            for r in rects:
+                for o in out:
+                    if (r[0] <= o[2] and o[0] <= r[2] and
+                            r[1] <= o[3] and o[1] <= r[3]):
+                        o[0] = min(o[0], r[0])
+                        o[1] = min(o[1], r[1])
+                        o[2] = max(o[2], r[2])
+                        o[3] = max(o[3], r[3])
+                        merged = True
+                        break
+                else:
+                    out.append(r)
+            rects = out
+        return [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in rects]
+
+    def _merge_into(self, rects: list, x0: int, y0: int, x1: int, y1: int):
+        """Add a rectangle to a list, growing the last entry when they touch."""
+        if rects:
+            last = rects[-1]
+            # Fast path: already covered by the most recent rectangle
+            if last[0] <= x0 and last[1] <= y0 and x1 <= last[2] and y1 <= last[3]:
+                return
+            # Touching or overlapping the most recent rectangle: grow it
+            if x0 <= last[2] and last[0] <= x1 and y0 <= last[3] and last[1] <= y1:
+                if x0 < last[0]:
+                    last[0] = x0
+                if y0 < last[1]:
+                    last[1] = y0
+                if x1 > last[2]:
+                    last[2] = x1
+                if y1 > last[3]:
+                    last[3] = y1
+                return
+        rects.append([x0, y0, x1, y1])
+        if len(rects) > self.max_rects:
+            # Too fragmented to be worth tracking: collapse to bounding box
+            rects[:] = [[min(r[0] for r in rects), min(r[1] for r in rects),
+                         max(r[2] for r in rects), max(r[3] for r in rects)]]
+
+
 class Display:
     """
     Represents an LED matrix display with a pixel buffer.
 
     Coordinates are (x, y) where (0, 0) is top-left.
     Pixels are stored as RGB tuples or can be monochrome.
+
+    In packed RGB mode (the default) the frame lives in a single bytearray,
+    3 bytes per pixel in row-major order, exposed as the memoryview
+    `pixels` so renderers and drivers can read it without copying.
     """
 
-    def __init__(self, width: int, height: int, color_mode: str = 'mono'):
+    def __init__(self, width: int, height: int, color_mode: str = 'mono',
+                 packed: bool = True):
         """
         Initialize the display.
 
@@ -23,27 +226,142 @@ class Display:
             width: Display width in pixels
             height: Display height in pixels
             color_mode: 'mono' for monochrome (on/off), 'rgb' for RGB color
+            packed: In RGB mode, store pixels in a flat bytearray instead of
+                    a list of lists of tuples (ignored in mono mode)
         """
         self.width = width
         self.height = height
         self.color_mode = color_mode
-
-        # Initialize framebuffer
+        self.packed = packed and color_mode == 'rgb'
+        self.framebuffer = None
+        self.pixels = None
+        self.front = None  # Last presented frame, allocated by the first swap()
+        self.front_pixels = None
+        self.damage = DamageTracker(width, height)
+        self.clip_rect = None  # (x, y, width, height) drawing is limited to
+        self._bounds = (0, 0, width, height)  # Clip rect as x0, y0, x1, y1
+
+        # Initialize framebuffer (the back buffer, drawn into)
         if color_mode == 'mono':
             # Boolean array: True = on, False = off
-            self.buffer = [[False for _ in range(width)] for _ in range(height)]
+            blank = False
+            self._buffer = [[False for _ in range(width)] for _ in range(height)]
         elif color_mode == 'rgb':
-            # RGB tuples: (r, g, b) each 0-255
-            self.buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
+            blank = (0, 0, 0)
+            if self.packed:
+                # Packed RGB: one contiguous bytearray, 3 bytes per pixel
+                self.framebuffer = bytearray(width * height * 3)
+                self.pixels = memoryview(self.framebuffer)
+                self._zero = bytes(width * height * 3)  # Reused by clear()
+                self._fill_cache = (None, None)  # (rgb, packed frame) for fill()
+                self._buffer = PackedBuffer(self)
+            else:
+                # RGB tuples: (r, g, b) each 0-255
+                self._buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
         else:
             raise ValueError(f"Unknown color_mode: {color_mode}")
+        self._blank_row = [blank] * width  # Reused by clear()
+
+    @property
+    def buffer(self):
+        """Pixel rows indexable as buffer[y][x] (a shim in packed mode)."""
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, rows):
+        if self.packed:
+            for y, row in enumerate(rows[:self.height]):
+                for x, value in enumerate(row[:self.width]):
+                    self.set_pixel(x, y, value)
+        else:
+            self._buffer = rows
+
+    @staticmethod
+    def _to_rgb(value) -> Tuple[int, int, int]:
+        """Normalize a colour value (tuple, list or bool) to ints 0-255."""
+        if value is True:
+            return (255, 255, 255)
+        if value is False or value is None:
+            return (0, 0, 0)
+        r, g, b = value[0], value[1], value[2]
+        return (min(255, max(0, int(r))),
+                min(255, max(0, int(g))),
+                min(255, max(0, int(b))))
+
+    def mark_dirty(self, x: int, y: int, width: int, height: int):
+        """Record that a rectangle of the framebuffer was drawn to."""
+        self.damage.add(x, y, width, height)
+
+    def get_dirty_rects(self) -> list:
+        """Get merged (x, y, width, height) regions changed since the last show."""
+        return self.damage.get_rects()
+
+    def reset_damage(self):
+        """Forget accumulated damage once the frame has been presented."""
+        self.damage.reset()
+
+    def set_clip(self, rect=None) -> bool:
+        """
+        Limit drawing to a rectangle until set_clip(None).
+
+        Every drawing call - set_pixel, fill_rect, blit, fill and clear -
+        leaves pixels outside the clip rect untouched.
+
+        Args:
+            rect: (x, y, width, height), or None to draw anywhere again
+
+        Returns:
+            True (clipping is supported)
+        """
+        if rect is None:
+            self.clip_rect = None
+            self._bounds = (0, 0, self.width, self.height)
+            return True
+        x, y, w, h = rect
+        x0 = min(self.width, max(0, int(x)))
+        y0 = min(self.height, max(0, int(y)))
+        x1 = max(x0, min(self.width, int(x) + int(w)))
+        y1 = max(y0, min(self.height, int(y) + int(h)))
+        self.clip_rect = (x0, y0, x1 - x0, y1 - y0)
+        self._bounds = (x0, y0, x1, y1)
+        return True
 
     def clear(self):
-        """Clear the entire display (turn all pixels off)."""
-        if self.color_mode == 'mono':
-            self.buffer = [[False for _ in range(self.width)] for _ in range(self.height)]
+        """Clear the entire display (turn all pixels off) in place."""
+        if self.clip_rect:
+            self.fill_rect(*self.clip_rect, False if self.color_mode == 'mono' else (0, 0, 0))
+            self.damage.add(*self.clip_rect)
+            return
+        self.damage.clear_frame()
+        if self.packed:
+            self.framebuffer[:] = self._zero
+        else:
+            blank_row = self._blank_row
+            for row in self._buffer:
+                row[:] = blank_row
+
+    def swap(self):
+        """
+        Flip the back buffer to the front after a frame has been presented.
+
+        The front buffer then holds the presented frame so a renderer can
+        diff the next frame against it. This costs a full-frame copy, so
+        the drivers don't call it: use it only when something reads the
+        front buffer. The copy happens in place, so the back buffer keeps
+        its contents (apps that draw incrementally are unaffected) and
+        memoryviews of either buffer stay valid.
+        """
+        if self.packed:
+            if self.front is None:
+                self.front = bytearray(self.framebuffer)
+                self.front_pixels = memoryview(self.front)
+            else:
+                self.front[:] = self.framebuffer
+        elif self.front is None:
+            self.front = [list(row) for row in self._buffer]
         else:
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+            for front_row, row in zip(self.front, self._buffer):
+                front_row[:] = row
 
     def set_pixel(self, x: int, y: int, value=True):
         """
@@ -54,20 +372,177 @@ class Display:
             y: Y coordinate (0 to height-1)
             value: For mono: True/False. For RGB: (r, g, b) tuple
         """
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = value
+        x0, y0, x1, y1 = self._bounds
+        if x0 <= x < x1 and y0 <= y < y1:
+            if self.packed:
+                i = (int(y) * self.width + int(x)) * 3
+                fb = self.framebuffer
+                try:
+                    fb[i] = value[0]
+                    fb[i + 1] = value[1]
+                    fb[i + 2] = value[2]
+                except (TypeError, ValueError, IndexError):
+                    # Floats, out-of-range channels or bool colours
+                    fb[i:i + 3] = bytes(self._to_rgb(value))
+            else:
+                self._buffer[y][x] = value
 
     def get_pixel(self, x: int, y: int):
         """Get the value of a pixel at the given coordinates."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.buffer[y][x]
+            if self.packed:
+                i = (int(y) * self.width + int(x)) * 3
+                fb = self.framebuffer
+                return (fb[i], fb[i + 1], fb[i + 2])
+            return self._buffer[y][x]
         return False if self.color_mode == 'mono' else (0, 0, 0)
 
+    def get_row(self, y: int) -> list:
+        """Get row y as a list of pixel values ((r, g, b) tuples in RGB mode)."""
+        if not self.packed:
+            return list(self._buffer[y])
+        start = y * self.width * 3
+        row = self.pixels[start:start + self.width * 3]
+        return list(zip(row[0::3], row[1::3], row[2::3]))
+
+    def get_front_row(self, y: int) -> list:
+        """Get row y of the last presented frame (see swap())."""
+        if self.front is None:
+            return list(self._blank_row)  # Nothing presented yet
+        if not self.packed:
+            return list(self.front[y])
+        start = y * self.width * 3
+        row = self.front_pixels[start:start + self.width * 3]
+        return list(zip(row[0::3], row[1::3], row[2::3]))
+
     def fill(self, value=True):
-        """Fill the entire display with the given value."""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = value
+        """Fill the entire display (or the clip rect) with the given value."""
+        if self.clip_rect:
+            self.fill_rect(*self.clip_rect, value)
+            self.damage.add(*self.clip_rect)
+            return
+        self.damage.add_full()
+        if self.packed:
+            rgb = self._to_rgb(value)
+            if self._fill_cache[0] != rgb:
+                self._fill_cache = (rgb, bytes(rgb) * (self.width * self.height))
+            self.framebuffer[:] = self._fill_cache[1]
+            return
+        fill_row = [value] * self.width
+        for row in self._buffer:
+            row[:] = fill_row
+
+    def _clip(self, x: int, y: int, w: int, h: int):
+        """Clip a rectangle to the clip rect, returning (x0, y0, x1, y1) or None."""
+        cx0, cy0, cx1, cy1 = self._bounds
+        x0 = max(cx0, int(x))
+        y0 = max(cy0, int(y))
+        x1 = min(cx1, int(x) + int(w))
+        y1 = min(cy1, int(y) + int(h))
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, value=True):
+        """
+        Fill a rectangle with one value (clipped to the display and clip rect).
+
+        Each row is written with a single slice assignment instead of
+        one set_pixel call per pixel.
+        """
+        clipped = self._clip(x, y, w, h)
+        if clipped is None:
+            return
+        x0, y0, x1, y1 = clipped
+        if self.packed:
+            span = bytes(self._to_rgb(value)) * (x1 - x0)
+            fb = self.framebuffer
+            stride = self.width * 3
+            start = y0 * stride + x0 * 3
+            end = start + len(span)
+            for _ in range(y1 - y0):
+                fb[start:end] = span
+                start += stride
+                end += stride
+        else:
+            span = [value] * (x1 - x0)
+            for row in self._buffer[y0:y1]:
+                row[x0:x1] = span
+
+    def hspan(self, x: int, y: int, length: int, value=True):
+        """Draw a horizontal run of `length` pixels starting at (x, y)."""
+        self.fill_rect(x, y, length, 1, value)
+
+    def vspan(self, x: int, y: int, length: int, value=True):
+        """Draw a vertical run of `length` pixels starting at (x, y)."""
+        clipped = self._clip(x, y, 1, length)
+        if clipped is None:
+            return
+        x0, y0, _, y1 = clipped
+        if self.packed:
+            rgb = bytes(self._to_rgb(value))
+            fb = self.framebuffer
+            stride = self.width * 3
+            i = y0 * stride + x0 * 3
+            for _ in range(y1 - y0):
+                fb[i:i + 3] = rgb
+                i += stride
+        else:
+            for row in self._buffer[y0:y1]:
+                row[x0] = value
+
+    def blit(self, buffer, x: int, y: int, w: int, h: int, transparent=None):
+        """
+        Copy a w x h block of pixels onto the display at (x, y).
+
+        Args:
+            buffer: Row-major pixel values - a flat sequence of w*h values,
+                a list of h rows, or (packed mode) bytes of w*h*3 RGB
+            x, y: Top-left destination (may be partly off-screen)
+            w, h: Size of the block
+            transparent: Value to skip (e.g. a sprite's background colour)
+        """
+        clipped = self._clip(x, y, w, h)
+        if clipped is None:
+            return
+        x0, y0, x1, y1 = clipped
+        x, y, w = int(x), int(y), int(w)
+        raw = isinstance(buffer, (bytes, bytearray, memoryview))
+
+        if self.packed and raw and transparent is None:
+            # Straight row copies from packed source bytes
+            fb = self.framebuffer
+            stride = self.width * 3
+            n = (x1 - x0) * 3
+            for dy in range(y0, y1):
+                src = ((dy - y) * w + (x0 - x)) * 3
+                dst = dy * stride + x0 * 3
+                fb[dst:dst + n] = buffer[src:src + n]
+            return
+
+        if raw:
+            buffer = memoryview(buffer)
+            values = [tuple(buffer[i:i + 3]) for i in range(0, len(buffer), 3)]
+        elif buffer and isinstance(buffer[0], list):
+            values = [value for row in buffer for value in row]
+        else:
+            values = buffer
+
+        if transparent is not None and self.packed:
+            transparent = self._to_rgb(transparent)
+        set_pixel = self.set_pixel
+        for dy in range(y0, y1):
+            base = (dy - y) * w - x
+            for dx in range(x0, x1):
+                value = values[base + dx]
+                if transparent is not None and (
+                        self._to_rgb(value) if self.packed else value) == transparent:
+                    continue
+                set_pixel(dx, dy, value)
+
+
+# Lookup table mapping a 0-255 channel to its 0-5 index in the 216-colour cube
+_CUBE_INDEX = bytes(int(v / 255 * 5) for v in range(256))
 
 
 class TerminalRenderer:
@@ -76,12 +551,21 @@ class TerminalRenderer:
 
     Uses half-block characters (▀ ▄) to pack 2 vertical pixels per character,
     making the display more compact and readable in the terminal.
+
+    In delta mode the renderer remembers the last cell grid it emitted and
+    only rewrites cells that changed, using cursor-positioning escapes and
+    emitting colour escapes only when the colour actually changes.
     """
 
     # ANSI color codes
     RESET = '\033[0m'
 
-    def __init__(self, display: Display, pixel_char: str = '█', off_char: str = ' ', ascii_mode: bool = False):
+    # Distinct colours remembered per foreground/background escape cache
+    COLOR_CACHE_SIZE = 4096
+
+    def __init__(self, display: Display, pixel_char: str = '█', off_char: str = ' ',
+                 ascii_mode: bool = False, delta: bool = False,
+                 color_depth: str = '256'):
         """
         Initialize the renderer.
 
@@ -90,9 +574,20 @@ class TerminalRenderer:
             pixel_char: Character to use for "on" pixels in mono mode
             off_char: Character to use for "off" pixels
             ascii_mode: If True, use ASCII characters instead of Unicode blocks
+            delta: If True, display_in_terminal() only rewrites changed cells
+            color_depth: '256' for the 216-colour cube or 'truecolor' for
+                         24-bit colour escapes
         """
+        if color_depth not in ('256', 'truecolor'):
+            raise ValueError(f"Unknown color_depth: {color_depth}")
         self.display = display
         self.ascii_mode = ascii_mode
+        self.delta = delta
+        self.truecolor = color_depth == 'truecolor'
+        self._fg_params = {}  # rgb -> SGR parameter string
+        self._bg_params = {}
+        self._last_cells = None  # Cell grid last emitted in delta mode
+        self._last_half_blocks = None
 
         if ascii_mode:
             self.pixel_char = '#'
@@ -110,10 +605,7 @@ class TerminalRenderer:
         """Convert RGB values to ANSI 256-color escape code."""
         # Simple conversion to 256-color palette
         # Using the 216-color cube (16-231)
-        r_idx = int(r / 255 * 5)
-        g_idx = int(g / 255 * 5)
-        b_idx = int(b / 255 * 5)
-        color_code = 16 + 36 * r_idx + 6 * g_idx + b_idx
+        color_code = 16 + 36 * _CUBE_INDEX[r] + 6 * _CUBE_INDEX[g] + _CUBE_INDEX[b]
 
         prefix = '48' if background else '38'
         return f'\033[{prefix};5;{color_code}m'
@@ -122,6 +614,9 @@ class TerminalRenderer:
         """
         Render the display to a string suitable for terminal output.
 
+        Colour escapes are only emitted when the colour changes within a
+        row, and each row that ends in a non-default colour is RESET.
+
         Args:
             use_half_blocks: If True, use ▀/▄ to pack 2 vertical pixels per char.
                            If False, use one character per pixel.
@@ -130,71 +625,166 @@ class TerminalRenderer:
             String with ANSI escape codes for terminal display
         """
         output = []
+        for cells in self._cell_rows(use_half_blocks):
+            line = []
+            cur_fg = None
+            cur_bg = None
+            for cell in cells:
+                char, fg, bg = self._cell_style(cell, use_half_blocks)
+                if fg != cur_fg or bg != cur_bg:
+                    line.append(self._sgr(fg, bg, cur_fg, cur_bg))
+                    cur_fg, cur_bg = fg, bg
+                line.append(char)
+            if cur_fg is not None or cur_bg is not None:
+                line.append(self.RESET)
+            output.append(''.join(line))
+
+        return '\n'.join(output)
+
+    def invalidate(self):
+        """Forget the last emitted frame so the next delta render is a full redraw."""
+        self._last_cells = None
 
+    def _cell_rows(self, use_half_blocks: bool) -> list:
+        """Build the terminal cell grid: one list of cell keys per text row."""
+        display = self.display
+        rows = [display.get_row(y) for y in range(display.height)]
         if not use_half_blocks:
-            # Simple mode: one character per pixel
-            for y in range(self.display.height):
-                line = []
-                for x in range(self.display.width):
-                    pixel = self.display.buffer[y][x]
-
-                    if self.display.color_mode == 'mono':
-                        line.append(self.pixel_char if pixel else self.off_char)
-                    else:  # RGB
-                        r, g, b = pixel
-                        if r == 0 and g == 0 and b == 0:
-                            line.append(self.off_char)
-                        else:
-                            color = self.rgb_to_ansi(r, g, b)
-                            line.append(f'{color}{self.pixel_char}{self.RESET}')
-
-                output.append(''.join(line))
-        else:
-            # Half-block mode: pack 2 vertical pixels per character
-            # Process pairs of rows
-            for y in range(0, self.display.height, 2):
-                line = []
-                for x in range(self.display.width):
-                    top_pixel = self.display.buffer[y][x]
-                    bottom_pixel = self.display.buffer[y + 1][x] if y + 1 < self.display.height else (False if self.display.color_mode == 'mono' else (0, 0, 0))
-
-                    if self.display.color_mode == 'mono':
-                        # Determine which character to use
-                        if top_pixel and bottom_pixel:
-                            line.append(self.pixel_char)  # Full block
-                        elif top_pixel and not bottom_pixel:
-                            line.append(self.upper_half_char)  # Upper half
-                        elif not top_pixel and bottom_pixel:
-                            line.append(self.lower_half_char)  # Lower half
-                        else:
-                            line.append(self.off_char)  # Empty
-                    else:  # RGB mode
-                        r1, g1, b1 = top_pixel
-                        r2, g2, b2 = bottom_pixel
-
-                        top_on = not (r1 == 0 and g1 == 0 and b1 == 0)
-                        bottom_on = not (r2 == 0 and g2 == 0 and b2 == 0)
-
-                        if top_on and bottom_on:
-                            # Both on - use foreground color for top, background for bottom
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            bg = self.rgb_to_ansi(r2, g2, b2, True)
-                            line.append(f'{fg}{bg}{self.upper_half_char}{self.RESET}')
-                        elif top_on:
-                            # Only top on
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            line.append(f'{fg}{self.upper_half_char}{self.RESET}')
-                        elif bottom_on:
-                            # Only bottom on
-                            fg = self.rgb_to_ansi(r2, g2, b2, False)
-                            line.append(f'{fg}{self.lower_half_char}{self.RESET}')
-                        else:
-                            # Both off
-                            line.append(self.off_char)
-
-                output.append(''.join(line))
+            return rows
+        off = False if display.color_mode == 'mono' else (0, 0, 0)
+        blank_row = [off] * display.width
+        cells = []
+        for y in range(0, display.height, 2):
+            bottom = rows[y + 1] if y + 1 < display.height else blank_row
+            cells.append(list(zip(rows[y], bottom)))
+        return cells
+
+    def _cell_style(self, cell, use_half_blocks: bool):
+        """
+        Map a cell key to (char, fg, bg), where fg/bg are RGB tuples or
+        None for the terminal's default colours.
+        """
+        if not use_half_blocks:
+            if self.display.color_mode == 'mono':
+                return (self.pixel_char if cell else self.off_char), None, None
+            if cell == (0, 0, 0):
+                return self.off_char, None, None
+            return self.pixel_char, cell, None
+
+        top, bottom = cell
+        if self.display.color_mode == 'mono':
+            if top and bottom:
+                return self.pixel_char, None, None
+            if top:
+                return self.upper_half_char, None, None
+            if bottom:
+                return self.lower_half_char, None, None
+            return self.off_char, None, None
+
+        top_on = top != (0, 0, 0)
+        bottom_on = bottom != (0, 0, 0)
+        if top_on and bottom_on:
+            return self.upper_half_char, top, bottom
+        if top_on:
+            return self.upper_half_char, top, None
+        if bottom_on:
+            return self.lower_half_char, bottom, None
+        return self.off_char, None, None
+
+    def _color_param(self, rgb: Tuple[int, int, int], background: bool) -> str:
+        """
+        SGR parameter string selecting a colour, e.g. '38;5;196' in 256-colour
+        mode or '38;2;255;0;0' in truecolor mode. Results are cached per colour.
+        """
+        cache = self._bg_params if background else self._fg_params
+        param = cache.get(rgb)
+        if param is None:
+            r, g, b = rgb
+            prefix = '48' if background else '38'
+            if self.truecolor:
+                param = f'{prefix};2;{r};{g};{b}'
+            else:
+                color_code = 16 + 36 * _CUBE_INDEX[r] + 6 * _CUBE_INDEX[g] + _CUBE_INDEX[b]
+                param = f'{prefix};5;{color_code}'
+            if len(cache) >= self.COLOR_CACHE_SIZE:
+                cache.clear()
+            cache[rgb] = param
+        return param
+
+    def _sgr(self, fg, bg, cur_fg, cur_bg) -> str:
+        """SGR escape switching from (cur_fg, cur_bg) to (fg, bg), changed parts only."""
+        params = []
+        if fg != cur_fg:
+            params.append('39' if fg is None else self._color_param(fg, False))
+        if bg != cur_bg:
+            params.append('49' if bg is None else self._color_param(bg, True))
+        return f"\033[{';'.join(params)}m"
+
+    def render_delta(self, use_half_blocks: bool = True) -> str:
+        """
+        Render only the cells that changed since the previous call.
 
-        return '\n'.join(output)
+        The first call (or the first after invalidate()) clears the screen
+        and emits every cell. Runs of adjacent changed cells share a single
+        cursor-positioning escape, and SGR colour escapes are only emitted
+        when the colour differs from the previous cell written.
+
+        Args:
+            use_half_blocks: If True, use ▀/▄ to pack 2 vertical pixels per char.
+
+        Returns:
+            String of escape sequences that updates the terminal in place
+        """
+        rows = self._cell_rows(use_half_blocks)
+        full = self._last_cells is None or self._last_half_blocks != use_half_blocks
+        last_rows = None if full else self._last_cells
+
+        out = []
+        if full:
+            out.append(f'{self.RESET}\033[2J')
+
+        # Every frame ends with RESET, so the terminal starts in default colours
+        cur_fg = None
+        cur_bg = None
+        for ty, cells in enumerate(rows):
+            last = None if last_rows is None else last_rows[ty]
+            if last == cells:
+                continue
+            cursor_x = -1
+            for x, cell in enumerate(cells):
+                if last is not None and last[x] == cell:
+                    continue
+                if cursor_x != x:
+                    out.append(f'\033[{ty + 1};{x + 1}H')
+                char, fg, bg = self._cell_style(cell, use_half_blocks)
+                if fg != cur_fg or bg != cur_bg:
+                    out.append(self._sgr(fg, bg, cur_fg, cur_bg))
+                    cur_fg, cur_bg = fg, bg
+                out.append(char)
+                cursor_x = x + 1
+
+        if cur_fg is not None or cur_bg is not None:
+            out.append(self.RESET)
+
+        self._last_cells = rows
+        self._last_half_blocks = use_half_blocks
+        return ''.join(out)
+
+    @staticmethod
+    def _write_frame(data: str):
+        """Write a whole frame to stdout with a single os.write where possible."""
+        sys.stdout.flush()  # Keep ordering with earlier print() output
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Captured/redirected stdout without a file descriptor
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            return
+        view = memoryview(data.encode('utf-8'))
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
 
     def display_in_terminal(self, use_half_blocks: bool = True, clear_screen: bool = True):
         """
@@ -202,8 +792,20 @@ class TerminalRenderer:
 
         Args:
             use_half_blocks: Use half-block characters for compact display
-            clear_screen: Clear terminal before rendering
+            clear_screen: Clear terminal before rendering (in delta mode the
+                          screen is only cleared for the first full frame)
         """
+        if self.delta:
+            full = self._last_cells is None or self._last_half_blocks != use_half_blocks
+            data = self.render_delta(use_half_blocks)
+            rows_used = (self.display.height // 2) if use_half_blocks else self.display.height
+            # Park the cursor below the matrix so print() output lands there
+            data += f'\033[{rows_used + 2};1H'
+            if full:
+                data += '─' * min(self.display.width, 80) + '\n'
+            self._write_frame(data)
+            return
+
         if clear_screen:
             # Clear terminal and move cursor to home
             print('\033[2J\033[H', end='')
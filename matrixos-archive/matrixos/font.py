@@ -5,12 +5,32 @@ ZX Spectrum-style font system for LED matrix display.
 
 from typing import Tuple, Union, Optional, Dict
 from matrixos.display import Display
+from matrixos.graphics import draw_hspan, fill_region
 
 
 # Type alias for color
 Color = Union[bool, Tuple[int, int, int]]
 
 
+def _byte_runs(byte: int) -> tuple:
+    """Split a bitmap row into (start_col, length) runs of set bits."""
+    runs = []
+    col = 0
+    while col < 8:
+        if byte & (0x80 >> col):
+            start = col
+            while col < 8 and byte & (0x80 >> col):
+                col += 1
+            runs.append((start, col - start))
+        else:
+            col += 1
+    return tuple(runs)
+
+
+# Set-bit runs for every possible bitmap row, so glyphs draw as spans
+_BYTE_RUNS = tuple(_byte_runs(byte) for byte in range(256))
+
+
 class Font:
     """
     Font class for rendering text on LED matrix.
@@ -270,15 +290,17 @@ class Font:
         if not bitmap:
             return
 
+        mark_dirty = getattr(display, 'mark_dirty', None)
+        if mark_dirty is not None:
+            mark_dirty(x, y, self.char_width, self.char_height)
+
+        if bg_color is not None:
+            # Draw background, then the set bits over it
+            fill_region(display, x, y, 8, 8, bg_color)
+
         for row in range(8):
-            byte = bitmap[row]
-            for col in range(8):
-                # Check if pixel is set (bit is 1)
-                if byte & (0x80 >> col):
-                    display.set_pixel(x + col, y + row, color)
-                elif bg_color is not None:
-                    # Draw background
-                    display.set_pixel(x + col, y + row, bg_color)
+            for col, length in _BYTE_RUNS[bitmap[row] & 0xFF]:
+                draw_hspan(display, x + col, y + row, length, color)
 
     def draw_text(self, display: Display, text: str, x: int, y: int,
                   color: Color = True, bg_color: Optional[Color] = None, spacing: int = 0):
@@ -11,6 +11,44 @@ import math
 Color = Union[bool, Tuple[int, int, int]]
 
 
+def _mark_dirty(display, x: int, y: int, width: int, height: int):
+    """Report a primitive's bounding box to displays that track damage."""
+    mark = getattr(display, 'mark_dirty', None)
+    if mark is not None:
+        mark(x, y, width, height)
+
+
+def fill_region(display, x: int, y: int, width: int, height: int, color: Color):
+    """Fill a rectangle via the display's bulk API, or pixel by pixel."""
+    fill_rect = getattr(display, 'fill_rect', None)
+    if fill_rect is not None:
+        fill_rect(x, y, width, height, color)
+        return
+    for py in range(y, y + height):
+        for px in range(x, x + width):
+            display.set_pixel(px, py, color)
+
+
+def draw_hspan(display, x: int, y: int, length: int, color: Color):
+    """Draw a horizontal run of pixels via the display's bulk API if it has one."""
+    hspan = getattr(display, 'hspan', None)
+    if hspan is not None:
+        hspan(x, y, length, color)
+        return
+    for px in range(x, x + length):
+        display.set_pixel(px, y, color)
+
+
+def draw_vspan(display, x: int, y: int, length: int, color: Color):
+    """Draw a vertical run of pixels via the display's bulk API if it has one."""
+    vspan = getattr(display, 'vspan', None)
+    if vspan is not None:
+        vspan(x, y, length, color)
+        return
+    for py in range(y, y + length):
+        display.set_pixel(x, py, color)
+
+
 def draw_line(display, x0: int, y0: int, x1: int, y1: int, color: Color = True):
     """
     Draw a line using Bresenham's algorithm.
@@ -23,6 +61,7 @@ def draw_line(display, x0: int, y0: int, x1: int, y1: int, color: Color = True):
     """
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
+    _mark_dirty(display, min(x0, x1), min(y0, y1), dx + 1, dy + 1)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
     err = dx - dy
@@ -56,21 +95,18 @@ def draw_rect(display, x: int, y: int, width: int, height: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the rectangle
     """
+    _mark_dirty(display, x, y, width, height)
     if fill:
         # Filled rectangle
-        for dy in range(height):
-            for dx in range(width):
-                display.set_pixel(x + dx, y + dy, color)
+        fill_region(display, x, y, width, height, color)
     else:
         # Outline only
         # Top and bottom
-        for dx in range(width):
-            display.set_pixel(x + dx, y, color)
-            display.set_pixel(x + dx, y + height - 1, color)
+        draw_hspan(display, x, y, width, color)
+        draw_hspan(display, x, y + height - 1, width, color)
         # Left and right
-        for dy in range(height):
-            display.set_pixel(x, y + dy, color)
-            display.set_pixel(x + width - 1, y + dy, color)
+        draw_vspan(display, x, y, height, color)
+        draw_vspan(display, x + width - 1, y, height, color)
 
 
 def draw_circle(display, cx: int, cy: int, radius: int,
@@ -85,11 +121,12 @@ def draw_circle(display, cx: int, cy: int, radius: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the circle
     """
+    _mark_dirty(display, cx - radius, cy - radius, 2 * radius + 1, 2 * radius + 1)
     if fill:
         # Filled circle - draw horizontal lines
         for y in range(-radius, radius + 1):
             x = int(math.sqrt(radius * radius - y * y))
-            draw_line(display, cx - x, cy + y, cx + x, cy + y, color)
+            draw_hspan(display, cx - x, cy + y, 2 * x + 1, color)
     else:
         # Outline only - midpoint circle algorithm
         x = radius
@@ -152,11 +189,12 @@ def draw_ellipse(display, cx: int, cy: int, rx: int, ry: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the ellipse
     """
+    _mark_dirty(display, cx - rx, cy - ry, 2 * rx + 1, 2 * ry + 1)
     if fill:
         # Filled ellipse
         for y in range(-ry, ry + 1):
             x = int(rx * math.sqrt(1 - (y / ry) ** 2))
-            draw_line(display, cx - x, cy + y, cx + x, cy + y, color)
+            draw_hspan(display, cx - x, cy + y, 2 * x + 1, color)
     else:
         # Outline ellipse using midpoint algorithm
         rx2 = rx * rx
@@ -217,6 +255,10 @@ def draw_triangle(display, x0: int, y0: int, x1: int, y1: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the triangle
     """
+    min_x = min(x0, x1, x2)
+    min_y = min(y0, y1, y2)
+    _mark_dirty(display, min_x, min_y,
+                max(x0, x1, x2) - min_x + 1, max(y0, y1, y2) - min_y + 1)
     if fill:
         # Filled triangle using scanline algorithm
         # Sort vertices by y coordinate
@@ -243,8 +285,7 @@ def draw_triangle(display, x0: int, y0: int, x1: int, y1: int,
             if xa > xb:
                 xa, xb = xb, xa
 
-            for x in range(int(xa), int(xb) + 1):
-                display.set_pixel(x, y, color)
+            draw_hspan(display, int(xa), y, int(xb) - int(xa) + 1, color)
     else:
         # Outline only
         draw_line(display, x0, y0, x1, y1, color)
@@ -333,6 +374,8 @@ def flood_fill(display, x: int, y: int, color: Color):
 
     # Use stack-based flood fill to avoid recursion limits
     stack = [(x, y)]
+    min_x = max_x = x
+    min_y = max_y = y
 
     while stack:
         px, py = stack.pop()
@@ -344,6 +387,16 @@ def flood_fill(display, x: int, y: int, color: Color):
             continue
 
         display.set_pixel(px, py, color)
+        if display.get_pixel(px, py) == target:
+            continue  # Outside the display's clip rect - don't spread from here
+        if px < min_x:
+            min_x = px
+        elif px > max_x:
+            max_x = px
+        if py < min_y:
+            min_y = py
+        elif py > max_y:
+            max_y = py
 
         # Add neighbors
         stack.append((px + 1, py))
@@ -351,6 +404,8 @@ def flood_fill(display, x: int, y: int, color: Color):
         stack.append((px, py + 1))
         stack.append((px, py - 1))
 
+    _mark_dirty(display, min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+
 
 def draw_rounded_rect(display, x: int, y: int, width: int, height: int,
                       radius: int, color: Color = True, fill: bool = False):
@@ -365,6 +420,7 @@ def draw_rounded_rect(display, x: int, y: int, width: int, height: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the rectangle
     """
+    _mark_dirty(display, x, y, width, height)
     # Clamp radius
     radius = min(radius, width // 2, height // 2)
 
@@ -27,6 +27,7 @@ class InputEvent:
     HELP = 'HELP'      # TAB key
     L1 = 'L1'          # Left shoulder button (Page Up on keyboard)
     R1 = 'R1'          # Right shoulder button (Page Down on keyboard)
+    PROFILER = 'PROFILER'  # F3 - performance overlay
 
     def __init__(self, key: str, raw: str = None):
         """
@@ -126,6 +127,15 @@ class KeyboardInput:
         except Exception as e:
             return None
 
+    def fileno(self) -> Optional[int]:
+        """stdin's file descriptor for select(), or None where unsupported."""
+        if sys.platform == 'win32':
+            return None
+        try:
+            return sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
     def wait_for_key(self) -> InputEvent:
         """
         Wait for a key press (blocking).
@@ -160,6 +170,10 @@ class KeyboardInput:
         elif char == '\x1b[6~':
             return InputEvent(InputEvent.R1, char)
         
+        # F3 toggles the performance overlay
+        elif char in ['\x1bOR', '\x1b[13~']:
+            return InputEvent(InputEvent.PROFILER, char)
+        
         # ESC = HOME button (return to launcher) - only if bare ESC
         elif char == '\x1b':
             return InputEvent(InputEvent.HOME, char)
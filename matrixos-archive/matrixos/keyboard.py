@@ -17,6 +17,7 @@ Example:
 """
 
 from matrixos.input import InputEvent
+from matrixos.logger import debug_log
 
 
 class KeyboardLayout:
@@ -294,12 +295,7 @@ def show_keyboard(matrix, input_handler, prompt: str = "Enter text:",
         Entered text, or None if cancelled
     """
     # DEBUG
-    try:
-        with open('/tmp/matrixos_debug.log', 'a') as f:
-            f.write(f"[KEYBOARD] show_keyboard() starting\n")
-            f.flush()
-    except:
-        pass
+    debug_log("[KEYBOARD] show_keyboard() starting")
     
     keyboard = OnScreenKeyboard(prompt, initial)
     
@@ -307,58 +303,37 @@ def show_keyboard(matrix, input_handler, prompt: str = "Enter text:",
     while not keyboard.done:
         iteration += 1
         if iteration == 1 or iteration % 10 == 0:
-            try:
-                with open('/tmp/matrixos_debug.log', 'a') as f:
-                    f.write(f"[KEYBOARD] Loop iteration {iteration}\n")
-                    f.flush()
-            except:
-                pass
+            debug_log(f"[KEYBOARD] Loop iteration {iteration}")
         
         # Clear screen
         try:
             matrix.clear()
         except Exception as e:
-            with open('/tmp/matrixos_debug.log', 'a') as f:
-                f.write(f"[KEYBOARD ERROR] matrix.clear() failed: {e}\n")
-                f.flush()
+            debug_log(f"[KEYBOARD ERROR] matrix.clear() failed: {e}")
             break
         
         # Render keyboard
         try:
             keyboard.render(matrix)
         except Exception as e:
-            with open('/tmp/matrixos_debug.log', 'a') as f:
-                f.write(f"[KEYBOARD ERROR] keyboard.render() failed: {e}\n")
-                f.flush()
+            debug_log(f"[KEYBOARD ERROR] keyboard.render() failed: {e}")
             break
         
         # Display
         try:
             matrix.show()
         except Exception as e:
-            with open('/tmp/matrixos_debug.log', 'a') as f:
-                f.write(f"[KEYBOARD ERROR] matrix.show() failed: {e}\n")
-                f.flush()
+            debug_log(f"[KEYBOARD ERROR] matrix.show() failed: {e}")
             break
         
         # Handle input
         event = input_handler.get_key(timeout=0.1)
         if event:
-            try:
-                with open('/tmp/matrixos_debug.log', 'a') as f:
-                    f.write(f"[KEYBOARD] Got event: {event.key}\n")
-                    f.flush()
-            except:
-                pass
+            debug_log(f"[KEYBOARD] Got event: {event.key}")
             keyboard.handle_input(event)
     
     # DEBUG
-    try:
-        with open('/tmp/matrixos_debug.log', 'a') as f:
-            f.write(f"[KEYBOARD] show_keyboard() done, cancelled={keyboard.cancelled}\n")
-            f.flush()
-    except:
-        pass
+    debug_log(f"[KEYBOARD] show_keyboard() done, cancelled={keyboard.cancelled}")
     
     if keyboard.cancelled:
         return None
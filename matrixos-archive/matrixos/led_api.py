@@ -6,6 +6,7 @@ Simple interface for drawing graphics and text.
 from matrixos.display import Display, TerminalRenderer
 from matrixos.graphics import *
 from matrixos.font import Font, default_font
+from matrixos.presenter import FramePresenter
 from typing import Tuple, Union, Optional
 
 
@@ -19,7 +20,8 @@ class LEDMatrix:
     Provides simple functions for graphics and text.
     """
 
-    def __init__(self, width: int = 64, height: int = 64, color_mode: str = 'rgb'):
+    def __init__(self, width: int = 64, height: int = 64, color_mode: str = 'rgb',
+                 threaded_output: bool = False):
         """
         Initialize LED matrix.
 
@@ -27,6 +29,9 @@ class LEDMatrix:
             width: Display width in pixels
             height: Display height in pixels
             color_mode: 'mono' or 'rgb'
+            threaded_output: If True, show() hands a frame snapshot to a
+                             background output thread instead of printing
+                             (RGB only; stale frames are dropped)
         """
         self.display = Display(width, height, color_mode)
         self.font = default_font
@@ -34,6 +39,16 @@ class LEDMatrix:
         self.height = height
         self.color_mode = color_mode
 
+        # Background presentation (see show())
+        self.presenter = None
+        self._output_renderer = None
+        if threaded_output and self.display.packed:
+            self._output_renderer = TerminalRenderer(
+                Display(width, height, color_mode), delta=True
+            )
+            self.presenter = FramePresenter(self._present_frame)
+            self.presenter.start()
+
     def clear(self):
         """Clear the display."""
         self.display.clear()
@@ -42,9 +57,23 @@ class LEDMatrix:
         """Fill display with color."""
         self.display.fill(color)
 
+    def set_clip(self, rect=None) -> bool:
+        """
+        Limit drawing to a rectangle until set_clip(None).
+
+        Args:
+            rect: (x, y, width, height), or None to draw anywhere again
+
+        Returns:
+            False if the display can't clip
+        """
+        set_clip = getattr(self.display, 'set_clip', None)
+        return bool(set_clip and set_clip(rect))
+
     def set_pixel(self, x: int, y: int, color: Color = True):
         """Set a single pixel."""
         self.display.set_pixel(x, y, color)
+        self.display.mark_dirty(x, y, 1, 1)
 
     def get_pixel(self, x: int, y: int):
         """Get pixel value at position."""
@@ -100,6 +129,12 @@ class LEDMatrix:
         """Flood fill from point."""
         flood_fill(self.display, x, y, color)
 
+    def blit(self, buffer, x: int, y: int, width: int, height: int,
+             transparent: Optional[Color] = None):
+        """Copy a width x height block of pixels (e.g. a sprite) to (x, y)."""
+        self.display.blit(buffer, x, y, width, height, transparent)
+        self.display.mark_dirty(x, y, width, height)
+
     # Text functions
 
     def text(self, text: str, x: int, y: int,
@@ -197,10 +232,43 @@ class LEDMatrix:
             renderer: Renderer to use (default: create TerminalRenderer)
             clear_screen: Clear screen before rendering
         """
-        if renderer is None:
-            renderer = TerminalRenderer(self.display)
+        if renderer is None and self.presenter:
+            # Output thread renders the snapshot; never blocks on the terminal
+            self.presenter.submit(bytes(self.display.framebuffer))
+        else:
+            if renderer is None:
+                renderer = TerminalRenderer(self.display)
+            renderer.display_in_terminal(clear_screen=clear_screen)
+        self.display.reset_damage()
+
+    def _present_frame(self, frame: bytes):
+        """Presenter sink: render a frame snapshot on the output thread."""
+        self._output_renderer.display.framebuffer[:] = frame
+        self._output_renderer.display_in_terminal()
+
+    def get_output_stats(self) -> dict:
+        """
+        Get background presentation counters.
+
+        Returns:
+            dict with presented, dropped and queued frame counts
+            (None if threaded output is off)
+        """
+        return self.presenter.get_stats() if self.presenter else None
+
+    def stop_output(self):
+        """Flush and stop the background output thread (if any)."""
+        if self.presenter:
+            self.presenter.stop()
 
-        renderer.display_in_terminal(clear_screen=clear_screen)
+    def get_dirty_rects(self) -> list:
+        """
+        Get regions changed since the last show().
+
+        Returns:
+            List of merged (x, y, width, height) rectangles
+        """
+        return self.display.get_dirty_rects()
 
     def get_display(self):
         """Get underlying Display object (for advanced use)."""
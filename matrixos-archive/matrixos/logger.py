@@ -3,13 +3,395 @@
 MatrixOS Logging System
 
 Provides a simple logging mechanism for apps and the OS itself.
-Logs are written to settings/logs/ with automatic timestamps.
+Logs are written to settings/logs/ with automatic timestamps, or to the
+directory in $MATRIXOS_LOG_DIR if it is set (child processes inherit it).
+
+Writes don't touch the disk on the caller's thread: they are queued to a
+single LogWriter thread that keeps one file handle per log open, batches
+messages and writes them every FLUSH_INTERVAL seconds (immediately for
+errors). Logs are rotated when they reach MAX_LOG_BYTES, and anything
+still queued is written when the process exits.
+
+Every message is also kept as a structured LogRecord in an in-memory
+LogSink (the last LOG_SINK_CAPACITY records), indexed by app and level,
+so tests can query logs without reading files back from disk.
 """
 
+import atexit
 import os
+import queue
 import sys
+import threading
+import time
+from collections import deque, namedtuple
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
+
+
+FLUSH_INTERVAL = 0.25  # Seconds a message may wait before it is written
+MAX_LOG_BYTES = 1024 * 1024  # Rotate a log file at this size
+LOG_BACKUPS = 3  # Rotated copies kept (name.log.1 ... name.log.3)
+DEBUG_LOG_PATH = '/tmp/matrixos_debug.log'
+LOG_SINK_CAPACITY = 10000  # Records kept in memory for queries
+LOG_DIR_ENV = 'MATRIXOS_LOG_DIR'  # Overrides settings/logs/ (e.g. for tests)
+
+# Queue item kinds
+_WRITE, _URGENT, _TRUNCATE, _FLUSH, _STOP = range(5)
+
+
+class LogWriter:
+    """Background writer that batches log messages per file."""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL,
+                 max_bytes: int = MAX_LOG_BYTES, backup_count: int = LOG_BACKUPS,
+                 batch_bytes: int = 64 * 1024):
+        """
+        Args:
+            flush_interval: Seconds between writes of queued messages
+            max_bytes: Rotate a file when it reaches this size (0 = never)
+            backup_count: Rotated copies to keep
+            batch_bytes: Write early once this much is queued
+        """
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_bytes = batch_bytes
+        self.writes = 0  # write() syscalls issued, for measuring batching
+        self._queue = queue.SimpleQueue()
+        self._files = {}  # path -> unbuffered FileIO (we do the buffering)
+        self._sizes = {}  # path -> bytes in the current file
+        self._pending = {}  # path -> [str] waiting to be written
+        self._pending_bytes = 0
+        self._thread = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def write(self, path, text: str, urgent: bool = False):
+        """Queue text for a log file (urgent = write it now)."""
+        if self._closed:
+            # Shutting down - write directly so late messages aren't lost
+            with self._lock:
+                self._pending.setdefault(str(path), []).append(text)
+                self._write_pending()
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put((_URGENT if urgent else _WRITE, str(path), text))
+
+    def truncate(self, path):
+        """Empty a log file (messages queued before this are dropped)."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((_TRUNCATE, str(path), None))
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Block until everything queued so far is on disk."""
+        if self._thread is None or self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        """Write everything queued, close the files and stop the thread."""
+        if self._closed:
+            return
+        if self._thread is not None:
+            done = threading.Event()
+            self._queue.put((_STOP, None, done))
+            done.wait(timeout)
+            self._thread.join(timeout)
+        self._closed = True
+        with self._lock:
+            # Messages queued after the thread stopped
+            while True:
+                try:
+                    kind, path, data = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == _WRITE or kind == _URGENT:
+                    self._pending.setdefault(path, []).append(data)
+            self._write_pending()
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="MatrixOS-LogWriter")
+                self._thread.start()
+
+    def _run(self):
+        last_write = time.monotonic()
+        while True:
+            timeout = None
+            if self._pending:
+                timeout = max(0.0, last_write + self.flush_interval - time.monotonic())
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            while len(items) < 1000:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            write_now = False
+            waiters = []
+            stop = False
+            with self._lock:
+                for kind, path, data in items:
+                    if kind == _WRITE or kind == _URGENT:
+                        self._pending.setdefault(path, []).append(data)
+                        self._pending_bytes += len(data)
+                        write_now = write_now or kind == _URGENT
+                    elif kind == _TRUNCATE:
+                        self._pending.pop(path, None)
+                        self._truncate(path)
+                    else:
+                        waiters.append(data)
+                        write_now = True
+                        stop = stop or kind == _STOP
+
+                now = time.monotonic()
+                if (write_now or self._pending_bytes >= self.batch_bytes
+                        or (self._pending and now - last_write >= self.flush_interval)):
+                    self._write_pending()
+                    last_write = now
+            for done in waiters:
+                done.set()
+            if stop:
+                return
+
+    def _open(self, path: str):
+        f = self._files.get(path)
+        if f is None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            f = self._files[path] = open(path, 'ab', buffering=0)
+            self._sizes[path] = os.fstat(f.fileno()).st_size
+        return f
+
+    def _write_pending(self):
+        """Write all queued text, one write per file (caller holds _lock)."""
+        pending, self._pending = self._pending, {}
+        self._pending_bytes = 0
+        for path, chunks in pending.items():
+            data = ''.join(chunks).encode('utf-8')
+            try:
+                f = self._open(path)
+                view = memoryview(data)
+                while view:
+                    view = view[f.write(view):]
+                self.writes += 1
+                self._sizes[path] += len(data)
+                if self.max_bytes and self._sizes[path] >= self.max_bytes:
+                    self._rotate(path)
+            except OSError as e:
+                print(f"[LOG ERROR] {e}: {data[:200]!r}", file=sys.stderr)
+
+    def _rotate(self, path: str):
+        """Shift name.log -> name.log.1 -> ... and start a new file."""
+        self._files.pop(path).close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(f"{path}.{i}"):
+                    os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+            os.replace(path, f"{path}.1")
+        else:
+            open(path, 'wb').close()
+
+    def _truncate(self, path: str):
+        f = self._files.pop(path, None)
+        if f:
+            f.close()
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            open(path, 'wb').close()
+        except OSError as e:
+            print(f"[LOG ERROR] {e}: truncating {path}", file=sys.stderr)
+
+
+def log_key(app_name: str) -> str:
+    """Normalized app name, as used for log filenames and sink lookups."""
+    return "".join(c if c.isalnum() or c in '-_' else '_' for c in app_name.lower())
+
+
+class LogRecord(namedtuple('LogRecord', 'seq timestamp app level message')):
+    """One log message. timestamp is time.time(); seq increases per record."""
+
+    __slots__ = ()
+
+    def format(self) -> str:
+        """The record as it appears in the log file."""
+        if self.level == 'SESSION':
+            return self.message
+        stamp = datetime.fromtimestamp(self.timestamp).strftime('%H:%M:%S.%f')[:-3]
+        return f"[{stamp}] {self.level}: {self.message}"
+
+
+class LogSink:
+    """Ring buffer of recent LogRecords with per-app and per-level indexes.
+
+    The oldest record is dropped once capacity is reached. Each index is
+    a deque in record order, so eviction pops the same record from the
+    left of every index it's in.
+    """
+
+    def __init__(self, capacity: int = LOG_SINK_CAPACITY):
+        self.capacity = capacity
+        self._records = deque()
+        self._by_app = {}  # log_key(app) -> deque of records
+        self._by_level = {}  # level -> deque
+        self._by_app_level = {}  # (log_key(app), level) -> deque
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def add(self, app: str, level: str, message: str,
+            timestamp: Optional[float] = None) -> LogRecord:
+        """Store a record (evicting the oldest if full)."""
+        key = log_key(app)
+        with self._lock:
+            self._seq += 1
+            record = LogRecord(self._seq, timestamp if timestamp is not None else time.time(),
+                               app, level, message)
+            if len(self._records) >= self.capacity:
+                self._evict()
+            self._records.append(record)
+            self._index(self._by_app, key).append(record)
+            self._index(self._by_level, level).append(record)
+            self._index(self._by_app_level, (key, level)).append(record)
+        return record
+
+    @staticmethod
+    def _index(indexes, key):
+        records = indexes.get(key)
+        if records is None:
+            records = indexes[key] = deque()
+        return records
+
+    def _evict(self):
+        old = self._records.popleft()
+        key = log_key(old.app)
+        for indexes, index_key in ((self._by_app, key), (self._by_level, old.level),
+                                   (self._by_app_level, (key, old.level))):
+            records = indexes[index_key]
+            records.popleft()
+            if not records:
+                del indexes[index_key]
+
+    def mark(self) -> int:
+        """Sequence number of the newest record (pass as since= later)."""
+        return self._seq
+
+    def query(self, app: Optional[str] = None, level: Optional[str] = None,
+              since: int = 0, contains: Optional[str] = None) -> List[LogRecord]:
+        """
+        Records matching every given filter, oldest first.
+
+        Args:
+            app: App name (any spelling that maps to the same log file)
+            level: Exact level, e.g. 'ERROR'
+            since: Only records added after this mark()
+            contains: Substring of the message
+        """
+        with self._lock:
+            if app is not None and level is not None:
+                source = self._by_app_level.get((log_key(app), level), ())
+            elif app is not None:
+                source = self._by_app.get(log_key(app), ())
+            elif level is not None:
+                source = self._by_level.get(level, ())
+            else:
+                source = self._records
+            if since:
+                # Newest records are on the right - stop at the mark
+                records = []
+                for record in reversed(source):
+                    if record.seq <= since:
+                        break
+                    records.append(record)
+                records.reverse()
+            else:
+                records = list(source)
+        if contains is not None:
+            records = [r for r in records if contains in r.message]
+        return records
+
+    def count(self, text: str, app: Optional[str] = None,
+              level: Optional[str] = None, since: int = 0) -> int:
+        """Occurrences of text in matching messages."""
+        return sum(r.message.count(text) for r in self.query(app, level, since))
+
+    def contains(self, text: str, app: Optional[str] = None,
+                 level: Optional[str] = None, since: int = 0) -> bool:
+        """True if any matching message contains text."""
+        return any(text in r.message for r in self.query(app, level, since))
+
+    def clear(self):
+        """Drop all records."""
+        with self._lock:
+            self._records.clear()
+            self._by_app.clear()
+            self._by_level.clear()
+            self._by_app_level.clear()
+
+
+_sink = LogSink()
+
+
+def get_log_sink() -> LogSink:
+    """The process-wide in-memory log sink."""
+    return _sink
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """Get or create the process-wide log writer."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = LogWriter()
+    return _writer
+
+
+def flush_logs(timeout: float = 2.0) -> bool:
+    """Block until every queued log message is written."""
+    return _writer.flush(timeout) if _writer else True
+
+
+def _shutdown():
+    if _writer is not None:
+        _writer.close()
+
+
+def _after_fork_in_child():
+    # The writer thread didn't survive the fork; the parent still owns
+    # (and will write) whatever was queued, so start over
+    global _writer, _writer_lock, _debug_started
+    _writer = None
+    _writer_lock = threading.Lock()
+    _debug_started = True  # Don't truncate the parent's debug log
+
+
+atexit.register(_shutdown)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def default_log_dir() -> Path:
+    """Directory logs go to: $MATRIXOS_LOG_DIR, else settings/logs/."""
+    log_dir = os.environ.get(LOG_DIR_ENV)
+    if log_dir:
+        return Path(log_dir)
+    return Path(__file__).parent.parent / "settings" / "logs"
 
 
 class MatrixLogger:
@@ -21,62 +403,53 @@ class MatrixLogger:
         
         Args:
             app_name: Name of the app (used for log filename)
-            log_dir: Optional custom log directory (defaults to settings/logs/)
+            log_dir: Optional custom log directory (defaults to
+                     default_log_dir())
         """
         self.app_name = app_name
         
         # Determine log directory
-        if log_dir is None:
-            # Default to settings/logs/ in project root
-            project_root = Path(__file__).parent.parent
-            self.log_dir = project_root / "settings" / "logs"
-        else:
-            self.log_dir = Path(log_dir)
+        self.log_dir = default_log_dir() if log_dir is None else Path(log_dir)
         
         # Create logs directory if needed
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Create log file path (sanitize app name for filename)
-        safe_name = "".join(c if c.isalnum() or c in '-_' else '_' for c in app_name.lower())
-        self.log_file = self.log_dir / f"{safe_name}.log"
+        self.log_file = self.log_dir / f"{log_key(app_name)}.log"
         
         # Write session start marker
-        self._write_raw(f"\n{'='*60}\n")
-        self._write_raw(f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self._write_raw(f"{'='*60}\n")
+        started = f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        _sink.add(app_name, 'SESSION', started)
+        self._write_raw(f"\n{'='*60}\n{started}\n{'='*60}\n")
     
-    def _write_raw(self, message):
-        """Write raw message to log file."""
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(message)
-        except Exception as e:
-            # Fallback to stderr if file writing fails
-            print(f"[LOG ERROR] {e}: {message}", file=sys.stderr)
+    def _write_raw(self, message, urgent=False):
+        """Queue raw message for the log file."""
+        get_log_writer().write(self.log_file, message, urgent)
+
+    def flush(self):
+        """Block until everything logged so far is in the file."""
+        flush_logs()
     
-    def _format_timestamp(self):
-        """Get formatted timestamp for log entries."""
-        return datetime.now().strftime('%H:%M:%S.%f')[:-3]  # Include milliseconds
+    def _log(self, level, message):
+        """Record a message in the sink and queue it for the file."""
+        record = _sink.add(self.app_name, level, str(message))
+        self._write_raw(f"{record.format()}\n", urgent=level in ('ERROR', 'CRITICAL'))
     
     def debug(self, message):
         """Log debug message."""
-        timestamp = self._format_timestamp()
-        self._write_raw(f"[{timestamp}] DEBUG: {message}\n")
+        self._log("DEBUG", message)
     
     def info(self, message):
         """Log info message."""
-        timestamp = self._format_timestamp()
-        self._write_raw(f"[{timestamp}] INFO: {message}\n")
+        self._log("INFO", message)
     
     def warning(self, message):
         """Log warning message."""
-        timestamp = self._format_timestamp()
-        self._write_raw(f"[{timestamp}] WARNING: {message}\n")
+        self._log("WARNING", message)
     
     def error(self, message):
         """Log error message."""
-        timestamp = self._format_timestamp()
-        self._write_raw(f"[{timestamp}] ERROR: {message}\n")
+        self._log("ERROR", message)
     
     def log(self, message, level="INFO"):
         """
@@ -86,8 +459,7 @@ class MatrixLogger:
             message: The message to log
             level: Log level string (default: "INFO")
         """
-        timestamp = self._format_timestamp()
-        self._write_raw(f"[{timestamp}] {level}: {message}\n")
+        self._log(level, message)
     
     def separator(self):
         """Write a visual separator line."""
@@ -116,3 +488,19 @@ def get_logger(app_name):
         MatrixLogger instance
     """
     return MatrixLogger(app_name)
+
+
+_debug_started = False
+
+def debug_log(msg):
+    """Append a line to the OS debug log (/tmp/matrixos_debug.log).
+
+    The file is emptied by the first message of each run. Lines containing
+    ERROR are written immediately, the rest in batches.
+    """
+    global _debug_started
+    writer = get_log_writer()
+    if not _debug_started:
+        _debug_started = True
+        writer.truncate(DEBUG_LOG_PATH)
+    writer.write(DEBUG_LOG_PATH, f"{msg}\n", urgent='ERROR' in msg)
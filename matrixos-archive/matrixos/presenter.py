@@ -0,0 +1,128 @@
+"""
+Frame Presentation Thread for MatrixOS
+
+Moves slow frame output (terminal writes over SSH, etc.) off the main
+event loop. The OS hands a snapshot of each frame to a FramePresenter,
+and a dedicated output thread pushes it to the sink.
+
+If the sink falls behind, stale frames are dropped: only the most recent
+snapshot is kept (latest-frame-wins), so a slow terminal lowers the
+presented frame rate instead of stretching every app frame.
+"""
+
+import threading
+from typing import Any, Callable
+
+
+class FramePresenter:
+    """Presents frame snapshots on a dedicated output thread."""
+
+    def __init__(self, sink: Callable[[Any], None], name: str = "MatrixOS-Presenter"):
+        """Create a presenter.
+
+        Args:
+            sink: Function called on the output thread with each frame snapshot
+            name: Thread name (for debugging)
+        """
+        self.sink = sink
+        self.name = name
+        self.running = False
+        self.presented = 0  # Frames pushed to the sink
+        self.dropped = 0    # Frames replaced before they were presented
+        self._cond = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._busy = False
+        self._thread = None
+
+    def start(self):
+        """Start the output thread."""
+        if self.running:
+            return
+
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True, timeout: float = 2.0):
+        """Stop the output thread.
+
+        Args:
+            flush: Present the pending frame (if any) before stopping
+            timeout: Seconds to wait for the thread to finish
+        """
+        with self._cond:
+            if not flush and self._has_pending:
+                self._pending = None
+                self._has_pending = False
+                self.dropped += 1
+            self.running = False
+            self._cond.notify_all()
+
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def submit(self, frame: Any):
+        """Queue a frame snapshot for presentation (never blocks).
+
+        The snapshot must not be modified after submitting it. If a frame
+        is already waiting, it is replaced and counted as dropped.
+        """
+        with self._cond:
+            if self._has_pending:
+                self.dropped += 1
+            self._pending = frame
+            self._has_pending = True
+            self._cond.notify()
+
+    @property
+    def queued(self) -> int:
+        """Number of frames waiting to be presented (0 or 1)."""
+        return 1 if self._has_pending else 0
+
+    def wait_idle(self, timeout: float = 1.0) -> bool:
+        """Block until every submitted frame has been presented.
+
+        Returns:
+            True if idle, False if the timeout expired
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._has_pending and not self._busy, timeout
+            )
+
+    def get_stats(self) -> dict:
+        """Get presentation statistics."""
+        return {
+            'presented': self.presented,
+            'dropped': self.dropped,
+            'queued': self.queued,
+            'running': self.running
+        }
+
+    def _run(self):
+        """Output thread main loop."""
+        while True:
+            with self._cond:
+                while not self._has_pending and self.running:
+                    self._cond.wait()
+                if not self._has_pending:
+                    break  # Stopped and drained
+                frame = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._busy = True
+
+            success = False
+            try:
+                self.sink(frame)
+                success = True
+            except Exception as e:
+                print(f"Presenter error: {e}")
+            finally:
+                with self._cond:
+                    if success:
+                        self.presented += 1
+                    self._busy = False
+                    self._cond.notify_all()
@@ -0,0 +1,267 @@
+"""
+Process-Isolated App Runner for MatrixOS
+
+Runs an app in its own Python process so it can't stall or crash the OS,
+and so a CPU-heavy app runs on another core instead of sharing the GIL
+with the OS's render loop.
+
+The child process runs the app under its own OSContext, drawing into a
+SharedMatrix - an LEDMatrix whose show() publishes the frame to a
+shared-memory framebuffer. In the OS, a ProcessApp stands in for the app:
+it forwards input events over a pipe and copies new frames onto the real
+matrix. The OS can kill() or restart() the child at any time; a child that
+crashes is restarted automatically up to max_restarts times.
+
+Mark an app as isolated in its config.json and the launcher does the rest:
+
+    {"name": "Platformer", "isolated": true}
+
+Or run one directly:
+
+    app = ProcessApp("Platformer", "examples/platformer/main.py")
+    os_context.register_app(app)
+    os_context.switch_to_app(app)
+    os_context.run()
+    app.stop()
+"""
+
+import importlib.util
+import itertools
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+
+from matrixos.app_framework import App, OSContext, debug_log
+from matrixos.devices.display.shared_memory import (
+    SharedFramebufferDriver, SharedFramebufferReader
+)
+from matrixos.input import InputEvent
+from matrixos.led_api import LEDMatrix
+from matrixos.logger import get_logger
+
+_segment_ids = itertools.count(1)
+
+
+class SharedMatrix(LEDMatrix):
+    """LEDMatrix whose show() publishes to a shared-memory framebuffer."""
+
+    def __init__(self, driver: SharedFramebufferDriver):
+        super().__init__(driver.width, driver.height, 'rgb')
+        self.driver = driver
+        self.display = driver  # Draw straight into the driver (as bootstrap does)
+
+    def show(self, renderer=None, clear_screen: bool = True):
+        """Publish the frame for the OS process."""
+        self.driver.show()
+
+
+class PipeInput:
+    """Child-side input handler reading event keys from a pipe."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def fileno(self):
+        return self.conn.fileno()
+
+    def get_key(self, timeout: float = 0.0):
+        try:
+            if not self.conn.poll(timeout):
+                return None
+            return InputEvent(self.conn.recv_bytes().decode())
+        except (EOFError, OSError):
+            # The OS went away - leave like the user pressed HOME
+            return InputEvent(InputEvent.HOME)
+
+
+def _child_main(main_py: str, module_name: str, segment: str,
+                width: int, height: int, conn):
+    """Entry point of the app process: run the app against shared memory."""
+    driver = SharedFramebufferDriver(width, height, name=segment, attach=True)
+    if not driver.initialize():
+        sys.exit(2)
+    try:
+        os_context = OSContext(SharedMatrix(driver), PipeInput(conn))
+        # The OS process dumps its own profile to the default path
+        profile = os_context.profiler.dump_path
+        if profile is not None:
+            os_context.profiler.dump_path = profile.with_name(
+                f"{profile.stem}.{module_name}{profile.suffix}")
+        spec = importlib.util.spec_from_file_location(module_name, main_py)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.run(os_context)
+    finally:
+        driver.cleanup()
+
+
+class ProcessApp(App):
+    """Stand-in for an app running in a child process."""
+
+    target_fps = 60  # Poll for the child's frames (it draws at its own rate)
+    background_interval = 0.5  # Notice a background child dying
+
+    def __init__(self, name: str, main_py, max_restarts: int = 3,
+                 start_method: str = 'spawn'):
+        """
+        Args:
+            name: App name
+            main_py: Path of the app's main.py (must define run(os_context))
+            max_restarts: Automatic restarts after crashes before giving up
+            start_method: multiprocessing start method ('spawn' doesn't
+                          inherit the OS's threads, so it's the safe default)
+        """
+        super().__init__(name)
+        self.main_py = str(main_py)
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.exitcode = None  # Of the last child that exited
+        self.process = None
+        self.logger = get_logger(name)
+        self._ctx = multiprocessing.get_context(start_method)
+        self._conn = None
+        self._segment = None
+        self._reader = None
+        self._frame = None
+        self._shown = -1  # Frame number last copied to the matrix
+
+    # === Process control ===
+
+    def start(self, width: int, height: int) -> bool:
+        """Start the child process (creating the framebuffer segment)."""
+        if self._segment is None:
+            name = f"matrixos_app_{os.getpid()}_{next(_segment_ids)}"
+            self._segment = SharedFramebufferDriver(width, height, name=name)
+            if not self._segment.initialize():
+                self._segment = None
+                return False
+            self._reader = SharedFramebufferReader(name=name)
+            self._frame = bytearray(self._reader.frame_size)
+
+        receiver, self._conn = self._ctx.Pipe(duplex=False)
+        module_name = f"app_{Path(self.main_py).parent.name}"
+        self.process = self._ctx.Process(
+            target=_child_main, name=f"MatrixOS-{self.name}", daemon=True,
+            args=(self.main_py, module_name, self._segment.segment_name,
+                  width, height, receiver))
+        self.process.start()
+        receiver.close()  # The child has its own copy
+        self.exitcode = None
+        debug_log(f"[PROCESS] Started {self.name} (pid {self.process.pid})")
+        return True
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def kill(self, timeout: float = 1.0):
+        """Stop the child: terminate, then kill if it doesn't exit."""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout)
+        self.exitcode = self.process.exitcode
+        self.process = None
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def restart(self) -> bool:
+        """Kill the child and start a fresh one on the same framebuffer."""
+        self.kill()
+        return self.start(self._reader.width, self._reader.height)
+
+    def stop(self):
+        """Kill the child and remove the framebuffer segment."""
+        self.kill()
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+        if self._segment:
+            self._segment.cleanup()
+            self._segment = None
+
+    def _check_child(self) -> bool:
+        """Handle a child that exited. Returns True while it's running."""
+        if self.is_running():
+            return True
+        if self.process is None:
+            return False
+        self.process.join(0)
+        code = self.process.exitcode
+        self.process = None
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+        self.exitcode = code
+        if code == 0:
+            debug_log(f"[PROCESS] {self.name} exited")
+        elif self.restarts < self.max_restarts:
+            self.restarts += 1
+            self.logger.error(f"Process exited with code {code} - "
+                              f"restart {self.restarts}/{self.max_restarts}")
+            return self.start(self._reader.width, self._reader.height)
+        else:
+            self.logger.error(f"Process exited with code {code} - giving up")
+        # Done: leave like any app that exits
+        if self.os:
+            if self.active and self.os.launcher:
+                self.os.switch_to_app(self.os.launcher)
+            elif self.active:
+                self.os.running = False
+        return False
+
+    # === App lifecycle ===
+
+    def on_activate(self):
+        super().on_activate()
+        if not self.is_running():
+            self.start(self.os.matrix.width, self.os.matrix.height)
+        self._shown = -1  # Redraw whatever the child shows now
+
+    def on_event(self, event):
+        if self._conn is None:
+            return False
+        try:
+            self._conn.send_bytes(str(event.key).encode())
+        except (BrokenPipeError, OSError):
+            return False
+        return True  # The child decides what BACK means
+
+    def on_update(self, delta_time):
+        if not self._check_child():
+            return
+        if self._reader.frame_number() != self._shown:
+            self.dirty = True
+
+    def on_background_tick(self):
+        self._check_child()
+
+    def render(self, matrix):
+        if self._reader is None:
+            super().render(matrix)
+            return
+        self._shown, pixels = self._reader.read_frame(self._frame)
+        matrix.blit(pixels, 0, 0, self._reader.width, self._reader.height)
+        super().render(matrix)
+
+
+def run_isolated(os_context, name: str, main_py, **kwargs) -> ProcessApp:
+    """Run an app in a child process until the user leaves it.
+
+    Returns:
+        The ProcessApp (already stopped and unregistered)
+    """
+    app = ProcessApp(name, main_py, **kwargs)
+    os_context.register_app(app)
+    try:
+        os_context.switch_to_app(app)
+        os_context.run()
+    finally:
+        app.stop()
+        os_context.unregister_app(app)
+    return app
@@ -0,0 +1,181 @@
+"""
+Frame Profiler for MatrixOS
+
+Records how long each phase of an OS frame takes (input poll, async task
+callbacks, timers, on_update, render, show and background ticks), per app.
+Samples live in fixed-size ring buffers, so memory stays constant however
+long the OS runs, and percentiles are computed on demand.
+
+Usage:
+    profiler = FrameProfiler()
+    start = time.perf_counter()
+    app.on_update(dt)
+    profiler.record(app.name, 'update', time.perf_counter() - start)
+
+    profiler.get_stats('Tetris')['update']['p95']  # seconds
+"""
+
+import json
+import os
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Frame phases in the order OSContext.run executes them
+PHASES = ('input', 'tasks', 'timers', 'update', 'render', 'show', 'background')
+
+
+class RingBuffer:
+    """Fixed-size buffer of float samples; the oldest sample is overwritten."""
+
+    def __init__(self, size: int = 240):
+        self.size = size
+        self._samples = array('d', bytes(8 * size))
+        self._index = 0
+        self.count = 0  # Samples currently held (<= size)
+        self.total = 0  # Samples ever added
+
+    def add(self, value: float):
+        """Add a sample."""
+        self._samples[self._index] = value
+        self._index = (self._index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        self.total += 1
+
+    def values(self) -> List[float]:
+        """Samples currently held, oldest first."""
+        if self.count < self.size:
+            return list(self._samples[:self.count])
+        return list(self._samples[self._index:]) + list(self._samples[:self._index])
+
+    def clear(self):
+        """Drop all samples."""
+        self._index = 0
+        self.count = 0
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(pct / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Count, mean, p50/p95/p99 and max of a list of samples."""
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1] if ordered else 0.0
+    }
+
+
+class FrameProfiler:
+    """Per-app, per-phase frame timings with percentile summaries."""
+
+    def __init__(self, window: int = 240, dump_path: Optional[str] = None,
+                 dump_interval: float = 30.0):
+        """
+        Args:
+            window: Samples kept per app and phase (240 = 4s at 60fps)
+            dump_path: JSON file written by maybe_dump() (None = no dumps)
+            dump_interval: Seconds between JSON dumps
+        """
+        self.window = window
+        self.enabled = True
+        self.dump_path = Path(dump_path) if dump_path else None
+        self.dump_interval = dump_interval
+        self._timings: Dict[str, Dict[str, RingBuffer]] = {}
+        self._presents = RingBuffer(window)  # Timestamps of shown frames
+        self._last_dump = time.monotonic()
+
+    def record(self, app_name: str, phase: str, seconds: float):
+        """Record the duration of one phase for an app."""
+        if not self.enabled:
+            return
+        phases = self._timings.get(app_name)
+        if phases is None:
+            phases = self._timings[app_name] = {}
+        ring = phases.get(phase)
+        if ring is None:
+            ring = phases[phase] = RingBuffer(self.window)
+        ring.add(seconds)
+
+    def record_present(self, timestamp: float):
+        """Record that a frame was shown (for the frame rate)."""
+        if self.enabled:
+            self._presents.add(timestamp)
+
+    def get_fps(self) -> float:
+        """Frames shown per second over the sample window."""
+        stamps = self._presents.values()
+        if len(stamps) < 2 or stamps[-1] <= stamps[0]:
+            return 0.0
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+
+    def get_apps(self) -> List[str]:
+        """Names of apps with recorded timings."""
+        return list(self._timings)
+
+    def get_stats(self, app_name: Optional[str] = None) -> dict:
+        """
+        Timing summaries in seconds.
+
+        Args:
+            app_name: One app's {phase: summary}, or None for {app: {phase: summary}}
+        """
+        if app_name is not None:
+            phases = self._timings.get(app_name, {})
+            return {phase: summarize(ring.values()) for phase, ring in phases.items()}
+        return {name: self.get_stats(name) for name in self._timings}
+
+    def reset(self):
+        """Forget all samples."""
+        self._timings.clear()
+        self._presents.clear()
+
+    def dump(self, path: Optional[str] = None) -> bool:
+        """
+        Write all stats to a JSON file.
+
+        Returns:
+            True if written
+        """
+        path = Path(path) if path else self.dump_path
+        if path is None:
+            return False
+        report = {
+            'timestamp': time.time(),
+            'fps': round(self.get_fps(), 2),
+            'window': self.window,
+            'apps': self.get_stats()
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")  # Per writer process
+            with open(tmp, 'w') as f:
+                json.dump(report, f, indent=2)
+            tmp.replace(path)  # Readers never see a half-written file
+            return True
+        except OSError as e:
+            print(f"[Profiler] Dump failed: {e}")
+            return False
+
+    def maybe_dump(self, now: Optional[float] = None) -> bool:
+        """Dump to dump_path if dump_interval has passed since the last dump."""
+        if self.dump_path is None or not self.enabled:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_dump < self.dump_interval:
+            return False
+        self._last_dump = now
+        return self.dump()
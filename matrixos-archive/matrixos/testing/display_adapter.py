@@ -9,7 +9,6 @@ Uses pure Python (no numpy) to minimize dependencies.
 
 from typing import List, Tuple, Optional, Set
 from collections import deque
-import copy
 
 
 class HeadlessDisplay:
@@ -32,6 +31,9 @@ class HeadlessDisplay:
         
         # Pure Python buffer: list of lists of tuples (r, g, b)
         self.buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
+        self._black_row = [(0, 0, 0)] * width
+        self.clip_rect = None
+        self._bounds = (0, 0, width, height)  # Clip rect as x0, y0, x1, y1
         self.render_count = 0
         self.history = deque(maxlen=60)  # Keep last 60 frames (1 second at 60fps)
         self.call_log = []  # Track all drawing calls
@@ -42,25 +44,77 @@ class HeadlessDisplay:
         """Set a single pixel."""
         self._log_call('set_pixel', x=x, y=y, color=color)
         x, y = int(x), int(y)  # Ensure integers
-        if 0 <= x < self.width and 0 <= y < self.height:
+        x0, y0, x1, y1 = self._bounds
+        if x0 <= x < x1 and y0 <= y < y1:
             self.buffer[y][x] = color
     
+    def set_clip(self, rect=None) -> bool:
+        """Limit drawing to an (x, y, width, height) rectangle (None = anywhere)."""
+        self._log_call('set_clip', rect=rect)
+        if rect is None:
+            self.clip_rect = None
+            self._bounds = (0, 0, self.width, self.height)
+            return True
+        x, y, w, h = (int(v) for v in rect)
+        x0, y0 = min(self.width, max(0, x)), min(self.height, max(0, y))
+        x1, y1 = max(x0, min(self.width, x + w)), max(y0, min(self.height, y + h))
+        self.clip_rect = (x0, y0, x1 - x0, y1 - y0)
+        self._bounds = (x0, y0, x1, y1)
+        return True
+    
+    def _fill_clip(self, color: Tuple[int, int, int]):
+        """Fill just the clip rect."""
+        x0, y0, x1, y1 = self._bounds
+        span = [color] * (x1 - x0)
+        for row in self.buffer[y0:y1]:
+            row[x0:x1] = span
+    
     def clear(self, color: Optional[Tuple[int, int, int]] = None):
         """Clear display to color (or black)."""
         self._log_call('clear', color=color)
-        if color is None:
-            color = (0, 0, 0)
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = color
+        if self.clip_rect:
+            self._fill_clip(color or (0, 0, 0))
+            return
+        if color is None or color == (0, 0, 0):
+            fill_row = self._black_row
+        else:
+            fill_row = [color] * self.width
+        for row in self.buffer:
+            row[:] = fill_row
     
     def fill(self, color: Tuple[int, int, int]):
         """Fill entire display with color."""
         self._log_call('fill', color=color)
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = color
+        if self.clip_rect:
+            self._fill_clip(color)
+            return
+        fill_row = [color] * self.width
+        for row in self.buffer:
+            row[:] = fill_row
     
+    def blit(self, buffer, x: int, y: int, width: int, height: int,
+             transparent: Optional[Tuple[int, int, int]] = None):
+        """Copy a block of pixels (flat list, list of rows or packed RGB bytes)."""
+        self._log_call('blit', x=x, y=y, width=width, height=height)
+        if isinstance(buffer, (bytes, bytearray, memoryview)):
+            raw = bytes(buffer)
+            values = [tuple(raw[i:i + 3]) for i in range(0, width * height * 3, 3)]
+        elif buffer and isinstance(buffer[0], list):
+            values = [value for row in buffer for value in row]
+        else:
+            values = buffer
+        x0, y0, x1, y1 = self._bounds
+        for dy in range(height):
+            ty = y + dy
+            if not y0 <= ty < y1:
+                continue
+            row = self.buffer[ty]
+            for dx in range(width):
+                tx = x + dx
+                value = values[dy * width + dx]
+                if x0 <= tx < x1 and value != transparent:
+                    row[tx] = value
+
     def line(self, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]):
         """Draw a line."""
         self._log_call('line', x1=x1, y1=y1, x2=x2, y2=y2, color=color)
@@ -148,7 +202,7 @@ class HeadlessDisplay:
         """
         self._log_call('show')
         self.render_count += 1
-        self.history.append(copy.deepcopy(self.buffer))
+        self.history.append(self.snapshot())
     
     # === Inspection Methods (Testing-specific) ===
     
@@ -226,7 +280,8 @@ class HeadlessDisplay:
     
     def snapshot(self) -> List[List[Tuple[int, int, int]]]:
         """Get copy of current buffer."""
-        return copy.deepcopy(self.buffer)
+        # Pixels are immutable tuples, so copying the rows is a full copy
+        return [row[:] for row in self.buffer]
     
     def compare(self, snapshot: List[List[Tuple[int, int, int]]], tolerance: float = 0.01) -> float:
         """
@@ -10,6 +10,8 @@ import importlib
 from pathlib import Path
 from typing import Optional, Callable, List, Tuple, Any
 from matrixos.input import InputEvent
+from matrixos.app_framework import render_app, run_fixed_steps, take_invalid_regions
+from matrixos.logger import default_log_dir, flush_logs, get_log_sink, log_key
 from .display_adapter import HeadlessDisplay
 from .input_simulator import InputSimulator
 from .assertions import Assertions
@@ -52,9 +54,11 @@ class TestRunner:
         self.snapshots = {}
         
         # Logging integration
-        self.log_dir = Path(__file__).parent.parent.parent / "settings" / "logs"
+        self.log_dir = default_log_dir()
         self.app_log_file = None
-        self._log_start_pos = {}  # Track log file positions at test start
+        self.log_sink = get_log_sink()  # Log queries go to memory, not files
+        self._log_start = 0  # Sink mark at test start
+        self._log_marks = {}  # log_key(app) -> sink mark set by clear_logs()
         
         # Framework components (created when run() is called)
         self.framework = None
@@ -82,15 +86,8 @@ class TestRunner:
     
     def _load_app(self):
         """Import and initialize the app."""
-        # Record current log positions before loading app
-        if self.log_dir.exists():
-            for log_file in self.log_dir.glob("*.log"):
-                try:
-                    with open(log_file, 'r') as f:
-                        f.seek(0, 2)  # Seek to end
-                        self._log_start_pos[log_file] = f.tell()
-                except:
-                    pass
+        # Only records logged from here on count as "since test start"
+        self._log_start = self.log_sink.mark()
         
         # Suppress stdout during app initialization
         old_stdout = sys.stdout
@@ -129,12 +126,14 @@ class TestRunner:
         # Update
         delta = 1.0 / self.fps
         if self.app.active:
+            if self.app.fixed_timestep:
+                run_fixed_steps(self.app, delta)
             self.app.on_update(delta)
         
         # Render if dirty
         if self.app.active and self.app.dirty:
-            self.display.clear()
-            self.app.render(self.display)
+            regions = take_invalid_regions(self.app, self.display.width, self.display.height)
+            render_app(self.app, self.display, regions)
             self.display.show()
         
         # Advance frame
@@ -515,44 +514,64 @@ class TestRunner:
         if not app_name:
             return None
         
-        # Sanitize name same way logger does
-        safe_name = "".join(c if c.isalnum() or c in '-_' else '_' 
-                           for c in app_name.lower())
-        log_file = self.log_dir / f"{safe_name}.log"
+        log_file = self.log_dir / f"{log_key(app_name)}.log"
         
+        flush_logs()  # Logs are written in batches - get them on disk
         if log_file.exists():
             return log_file
         return None
     
+    def _log_app(self, app_name: Optional[str]) -> Optional[str]:
+        """App name to query (defaults to the current app)."""
+        if app_name is None and self.app:
+            return self.app.name
+        return app_name
+    
+    def _log_since(self, app_name: str, since_test_start: bool) -> int:
+        """Sink mark to read from."""
+        if not since_test_start:
+            return 0
+        return self._log_marks.get(log_key(app_name), self._log_start)
+    
+    def get_log_records(self, app_name: Optional[str] = None,
+                        level: Optional[str] = None,
+                        since_test_start: bool = False) -> list:
+        """
+        Get structured log records from the in-memory log sink.
+        
+        Args:
+            app_name: App name (defaults to current app)
+            level: Only this level, e.g. 'ERROR'
+            since_test_start: Only records logged during this test
+            
+        Returns:
+            List of LogRecord (seq, timestamp, app, level, message)
+        """
+        app_name = self._log_app(app_name)
+        if not app_name:
+            return []
+        return self.log_sink.query(app_name, level,
+                                   since=self._log_since(app_name, since_test_start))
+    
     def read_logs(self, app_name: Optional[str] = None, 
                   since_test_start: bool = False) -> str:
         """
-        Read log file contents.
+        Read logs as text, formatted like the log file.
         
         Args:
             app_name: App name (defaults to current app)
             since_test_start: Only return logs written during this test (default: False, read all)
             
         Returns:
-            Log file contents as string
+            Log contents as string
         """
-        log_file = self.get_log_file(app_name)
-        if not log_file:
-            return ""
-        
-        try:
-            with open(log_file, 'r') as f:
-                if since_test_start and log_file in self._log_start_pos:
-                    # Seek to position at test start
-                    f.seek(self._log_start_pos[log_file])
-                return f.read()
-        except:
-            return ""
+        lines = self.get_log_lines(app_name, since_test_start)
+        return '\n'.join(lines) + '\n' if lines else ""
     
     def get_log_lines(self, app_name: Optional[str] = None,
                      since_test_start: bool = False) -> List[str]:
         """
-        Get log file as list of lines.
+        Get logs as list of lines.
         
         Args:
             app_name: App name (defaults to current app)
@@ -561,14 +580,12 @@ class TestRunner:
         Returns:
             List of log lines
         """
-        content = self.read_logs(app_name, since_test_start)
-        if not content:
-            return []
-        return content.strip().split('\n')
+        return [record.format()
+                for record in self.get_log_records(app_name, None, since_test_start)]
     
     def log_contains(self, text: str, app_name: Optional[str] = None) -> bool:
         """
-        Check if log contains specific text.
+        Check if log messages contain specific text.
         
         Args:
             text: Text to search for
@@ -577,13 +594,13 @@ class TestRunner:
         Returns:
             True if text found in logs
         """
-        logs = self.read_logs(app_name, since_test_start=False)
-        return text in logs
+        app_name = self._log_app(app_name)
+        return bool(app_name) and self.log_sink.contains(text, app_name)
     
     def count_log_occurrences(self, text: str, 
                              app_name: Optional[str] = None) -> int:
         """
-        Count occurrences of text in logs.
+        Count occurrences of text in log messages.
         
         Args:
             text: Text to count
@@ -592,8 +609,8 @@ class TestRunner:
         Returns:
             Number of occurrences
         """
-        logs = self.read_logs(app_name, since_test_start=False)
-        return logs.count(text)
+        app_name = self._log_app(app_name)
+        return self.log_sink.count(text, app_name) if app_name else 0
     
     def assert_log_contains(self, text: str, app_name: Optional[str] = None):
         """Assert that logs contain specific text."""
@@ -606,8 +623,7 @@ class TestRunner:
     
     def assert_no_errors_logged(self, app_name: Optional[str] = None):
         """Assert that no ERROR messages appear in logs."""
-        logs = self.read_logs(app_name, since_test_start=False)
-        error_lines = [line for line in logs.split('\n') if 'ERROR' in line]
+        error_lines = self.get_error_logs(app_name)
         if error_lines:
             raise AssertionError(
                 f"Found {len(error_lines)} error(s) in logs:\n" + 
@@ -616,28 +632,21 @@ class TestRunner:
     
     def get_error_logs(self, app_name: Optional[str] = None) -> List[str]:
         """Get all ERROR log lines."""
-        logs = self.read_logs(app_name, since_test_start=False)
-        return [line for line in logs.split('\n') if 'ERROR' in line]
+        return [record.format() for record in self.get_log_records(app_name, 'ERROR')]
     
     def get_warning_logs(self, app_name: Optional[str] = None) -> List[str]:
         """Get all WARNING log lines."""
-        logs = self.read_logs(app_name, since_test_start=False)
-        return [line for line in logs.split('\n') if 'WARNING' in line]
+        return [record.format() for record in self.get_log_records(app_name, 'WARNING')]
     
     def clear_logs(self, app_name: Optional[str] = None):
         """
-        Mark current log position (future reads will start from here).
+        Mark current log position (future since_test_start reads start from here).
         
         Useful for isolating logs from different test phases.
         """
-        log_file = self.get_log_file(app_name)
-        if log_file and log_file.exists():
-            try:
-                with open(log_file, 'r') as f:
-                    f.seek(0, 2)  # Seek to end
-                    self._log_start_pos[log_file] = f.tell()
-            except:
-                pass
+        app_name = self._log_app(app_name)
+        if app_name:
+            self._log_marks[log_key(app_name)] = self.log_sink.mark()
     
     def print_recent_logs(self, lines: int = 20, app_name: Optional[str] = None):
         """
@@ -16,16 +16,39 @@ Example:
     label.render(matrix)
     text_input.render(matrix)
     button.render(matrix)
+
+Widgets stored on an app (self.button = Button(...), or a list of them)
+are bound to it when the OS registers or activates the app, and then
+invalidate their own area whenever their state changes, so a
+partial_render app only repaints what moved:
+
+    self.button = Button("Save", x=2, y=24)
+    self.button.focused = True  # Calls self.invalidate(button.bounds)
+
+Widgets created later or kept anywhere else (a dict, another object)
+need an explicit widget.bind(app) or app.bind_widgets(). ListWidget.items is the widget's own list, so editing
+it in place repaints the list too.
 """
 
 from typing import Callable, Optional, List
 from matrixos.input import InputEvent
+from matrixos.font import default_font
 from matrixos import layout
 
 
+def text_width(text: str) -> int:
+    """Pixels matrix.text() covers horizontally for text."""
+    return len(text) * default_font.char_width
+
+
 class Widget:
     """Base class for all UI widgets."""
     
+    # Attributes that change how the widget looks - setting one to a new
+    # value invalidates the widget (subclasses extend this)
+    render_state = frozenset({'x', 'y', 'width', 'height', 'visible', 'enabled', 'focused'})
+    app = None  # App to invalidate (see bind())
+    
     def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0):
         """
         Initialize widget.
@@ -44,6 +67,40 @@ class Widget:
         self.enabled = True
         self.focused = False
     
+    def __setattr__(self, name, value):
+        if name in self.render_state and self.app is not None:
+            old = self.__dict__.get(name, value)
+            if old != value:
+                before = self.bounds
+                object.__setattr__(self, name, value)
+                self.invalidate()
+                if before != self.bounds:
+                    self.app.invalidate(before)  # Moved: clear where it was
+                return
+        object.__setattr__(self, name, value)
+    
+    def bind(self, app):
+        """
+        Invalidate this widget on app whenever its state changes.
+        
+        Widgets stored on an app are bound by App.bind_widgets().
+        
+        Returns:
+            The widget (for chaining)
+        """
+        self.app = app
+        return self
+    
+    @property
+    def bounds(self):
+        """Screen area the widget draws to, as (x, y, width, height)."""
+        return (self.x, self.y, self.width, self.height)
+    
+    def invalidate(self):
+        """Ask the bound app to repaint this widget's area."""
+        if self.app is not None:
+            self.app.invalidate(self.bounds)
+    
     def render(self, matrix):
         """Render the widget."""
         pass
@@ -61,6 +118,8 @@ class Widget:
 class Label(Widget):
     """Static text label."""
     
+    render_state = Widget.render_state | {'text', 'color'}
+    
     def __init__(self, text: str, x: int = 0, y: int = 0, 
                  color: tuple = (200, 200, 200)):
         """
@@ -72,11 +131,15 @@ class Label(Widget):
             y: Y position
             color: Text color (r, g, b)
         """
-        width = len(text) * 6
-        super().__init__(x, y, width, 7)
+        super().__init__(x, y, text_width(text), default_font.char_height)
         self.text = text
         self.color = color
     
+    @property
+    def bounds(self):
+        """The text's area (it follows the current text)."""
+        return (self.x, self.y, text_width(self.text), default_font.char_height)
+    
     def render(self, matrix):
         """Render label."""
         if not self.visible:
@@ -87,6 +150,8 @@ class Label(Widget):
 class Button(Widget):
     """Clickable button."""
     
+    render_state = Widget.render_state | {'text'}
+    
     def __init__(self, text: str, x: int = 0, y: int = 0, 
                  width: int = 0, on_click: Optional[Callable] = None):
         """
@@ -100,7 +165,7 @@ class Button(Widget):
             on_click: Callback when clicked
         """
         if width == 0:
-            width = len(text) * 6 + 8
+            width = text_width(text) + 8
         super().__init__(x, y, width, 11)
         self.text = text
         self.on_click = on_click
@@ -129,7 +194,7 @@ class Button(Widget):
         matrix.rect(self.x, self.y, self.width, self.height, border_color, fill=False)
         
         # Text (centered)
-        text_x = self.x + (self.width - len(self.text) * 6) // 2
+        text_x = self.x + (self.width - text_width(self.text)) // 2
         text_y = self.y + 2
         matrix.text(self.text, text_x, text_y, text_color)
     
@@ -149,6 +214,8 @@ class Button(Widget):
 class TextInput(Widget):
     """Single-line text input field."""
     
+    render_state = Widget.render_state | {'value', 'placeholder', 'cursor_visible'}
+    
     def __init__(self, x: int = 0, y: int = 0, width: int = 60,
                  value: str = "", placeholder: str = "",
                  on_change: Optional[Callable[[str], None]] = None):
@@ -193,7 +260,7 @@ class TextInput(Widget):
         if self.value:
             # Show value (truncate if too long)
             display_text = self.value
-            max_chars = (self.width - 10) // 6
+            max_chars = (self.width - 10) // default_font.char_width
             if len(display_text) > max_chars:
                 display_text = display_text[:max_chars - 3] + "..."
             
@@ -201,7 +268,7 @@ class TextInput(Widget):
             
             # Cursor when focused
             if self.focused and self.cursor_visible:
-                cursor_x = text_x + len(display_text) * 6
+                cursor_x = text_x + text_width(display_text)
                 if cursor_x < self.x + self.width - 3:
                     matrix.rect(cursor_x, text_y, 2, 7, (100, 200, 255), fill=True)
         
@@ -227,8 +294,35 @@ class TextInput(Widget):
             self.on_change(value)
 
 
+class _ObservedList(list):
+    """A widget's list that invalidates the widget when edited in place."""
+    
+    def __init__(self, items, widget):
+        super().__init__(items)
+        self.widget = widget
+
+
+def _observed(name):
+    method = getattr(list, name)
+    
+    def edit(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.widget.invalidate()
+        return result
+    edit.__name__ = name
+    return edit
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_ObservedList, _name, _observed(_name))
+
+
 class ListWidget(Widget):
-    """Scrollable list of items."""
+    """Scrollable list of items (items is a copy: edit widget.items)."""
+    
+    # scroll_offset follows selected_index, so it isn't listed
+    render_state = Widget.render_state | {'items', 'selected_index'}
     
     def __init__(self, items: List[str], x: int = 0, y: int = 0,
                  width: int = 60, height: int = 40,
@@ -250,6 +344,11 @@ class ListWidget(Widget):
         self.scroll_offset = 0
         self.on_select = on_select
     
+    def __setattr__(self, name, value):
+        if name == 'items' and not isinstance(value, _ObservedList):
+            value = _ObservedList(value, self)
+        super().__setattr__(name, value)
+    
     def render(self, matrix):
         """Render list."""
         if not self.visible:
@@ -283,7 +382,7 @@ class ListWidget(Widget):
                 text_color = (200, 200, 200)
             
             # Truncate if needed
-            max_chars = (self.width - 8) // 6
+            max_chars = (self.width - 8) // default_font.char_width
             display_text = item if len(item) <= max_chars else item[:max_chars - 3] + "..."
             
             matrix.text(display_text, self.x + 4, y, text_color)
@@ -313,6 +412,8 @@ class ListWidget(Widget):
 class Dialog(Widget):
     """Modal dialog box."""
     
+    render_state = Widget.render_state | {'title', 'message', 'buttons', 'selected_button'}
+    
     def __init__(self, title: str, message: str,
                  buttons: List[str] = None,
                  on_button: Optional[Callable[[str], None]] = None):
@@ -332,6 +433,11 @@ class Dialog(Widget):
         self.on_button = on_button
         self.selected_button = 0
     
+    @property
+    def bounds(self):
+        """None - the dialog is centred and darkens the whole screen."""
+        return None
+    
     def render(self, matrix):
         """Render dialog (centered on screen)."""
         if not self.visible:
@@ -363,13 +469,13 @@ class Dialog(Widget):
         
         # Title bar
         matrix.rect(dialog_x, dialog_y, dialog_width, 10, (70, 100, 180), fill=True)
-        title_x = dialog_x + (dialog_width - len(self.title) * 6) // 2
+        title_x = dialog_x + (dialog_width - text_width(self.title)) // 2
         matrix.text(self.title, title_x, dialog_y + 2, (255, 255, 255))
         
         # Message (word wrap)
         msg_x = dialog_x + 4
         msg_y = dialog_y + 14
-        max_chars = (dialog_width - 8) // 6
+        max_chars = (dialog_width - 8) // default_font.char_width
         
         words = self.message.split()
         line = ""
@@ -397,7 +503,7 @@ class Dialog(Widget):
             
             # Button text
             text_color = (255, 255, 255) if is_selected else (200, 200, 200)
-            text_x = button_x + (button_width - len(btn_text) * 6) // 2
+            text_x = button_x + (button_width - text_width(btn_text)) // 2
             matrix.text(btn_text, text_x, button_y + 2, text_color)
             
             button_x += button_width + 4
@@ -427,6 +533,8 @@ class Dialog(Widget):
 class ProgressBar(Widget):
     """Progress bar widget."""
     
+    render_state = Widget.render_state | {'value', 'color'}
+    
     def __init__(self, x: int = 0, y: int = 0, width: int = 60,
                  height: int = 8, value: float = 0.0, color: tuple = (100, 200, 100)):
         """
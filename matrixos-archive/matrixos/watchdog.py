@@ -0,0 +1,187 @@
+"""
+Overrun Watchdog for MatrixOS
+
+A background thread that watches how long the app callback the OS is
+currently running (on_update, render, on_event, ...) has been going. An
+app that stalls the main loop no longer freezes MatrixOS silently:
+
+- Past the soft threshold the watchdog samples the main thread's stack
+  with sys._current_frames() and writes it to the app's log, so you can
+  see exactly where it is stuck.
+- Past the hard threshold the app is flagged for a forced return to the
+  launcher, which happens as soon as the callback returns.
+- With interrupt=True, AppHangError is also raised inside a callback that
+  is still running Python code, so the OS's crash handling takes over
+  without waiting for it. This is opt-in: the exception is injected
+  asynchronously, and if the callback returns just before it fires it
+  lands in whatever OS code runs next instead of the app.
+
+Usage:
+    watchdog = Watchdog()
+    watchdog.start()
+
+    watchdog.enter(app, 'update')
+    try:
+        app.on_update(dt)
+    finally:
+        watchdog.exit()
+    if watchdog.consume_flag(app):
+        os.switch_to_app(launcher)
+"""
+
+import ctypes
+import itertools
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+from matrixos.logger import get_logger
+
+
+class AppHangError(Exception):
+    """Raised inside an app callback that ran past the hard threshold."""
+
+
+def _interrupt_thread(thread_id: int, exc_type) -> bool:
+    """Raise exc_type asynchronously in another thread (None clears it)."""
+    try:
+        set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    except AttributeError:
+        return False  # Not CPython
+    exc = ctypes.py_object(exc_type) if exc_type is not None else None
+    return set_async_exc(ctypes.c_ulong(thread_id), exc) == 1
+
+
+class Watchdog:
+    """Detects app callbacks that overrun and samples where they're stuck."""
+
+    def __init__(self, soft_threshold: float = 0.25, hard_threshold: float = 5.0,
+                 interrupt: bool = False):
+        """
+        Args:
+            soft_threshold: Seconds before a stack sample is logged
+            hard_threshold: Seconds before the app is sent back to the launcher
+            interrupt: Also raise AppHangError in callbacks past the hard
+                       threshold (see the module docstring for the caveat)
+        """
+        self.soft_threshold = soft_threshold
+        self.hard_threshold = hard_threshold
+        self.interrupt = interrupt
+        self.interval = min(0.05, soft_threshold / 4)  # Poll period
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._current = None  # (seq, app, phase, start, thread_id)
+        self._seq = itertools.count(1)
+        self._sampled = 0  # seq of the last callback sampled
+        self._interrupted = 0  # seq of the last callback interrupted
+        self._flagged = set()  # Names of apps to send to the launcher
+        self._loggers = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the watchdog thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="MatrixOS-Watchdog")
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watchdog thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def enter(self, app, phase: str):
+        """Mark the start of an app callback on the calling thread."""
+        self._current = (next(self._seq), app, phase, time.monotonic(),
+                         threading.get_ident())
+
+    def exit(self):
+        """Mark the end of the callback started by enter()."""
+        with self._lock:
+            current = self._current
+            self._current = None
+            if current and current[0] == self._interrupted:
+                # Returned before the exception fired - don't let it
+                # escape into the OS
+                _interrupt_thread(current[4], None)
+
+    def consume_flag(self, app) -> bool:
+        """True (once) if the app passed the hard threshold."""
+        if app.name in self._flagged:
+            self._flagged.discard(app.name)
+            return True
+        return False
+
+    def get_stats(self, app_name: Optional[str] = None) -> dict:
+        """
+        Overrun counters: soft and hard overruns and the longest callback.
+
+        Args:
+            app_name: One app's counters, or None for {app: counters}
+        """
+        if app_name is not None:
+            return self.stats.get(app_name)
+        return self.stats
+
+    def _app_stats(self, name: str) -> Dict[str, float]:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = {'soft': 0, 'hard': 0, 'max_seconds': 0.0}
+        return stats
+
+    def _logger(self, name: str):
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = get_logger(name)
+        return logger
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self, now: Optional[float] = None):
+        """Check the running callback once (called by the thread)."""
+        current = self._current
+        if current is None:
+            return
+        seq, app, phase, start, thread_id = current
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - start
+        if elapsed < self.soft_threshold:
+            return
+
+        stats = self._app_stats(app.name)
+        stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+
+        if self._sampled != seq:
+            self._sampled = seq
+            stats['soft'] += 1
+            self._sample(app.name, phase, elapsed, thread_id)
+
+        if elapsed >= self.hard_threshold and self._interrupted != seq:
+            with self._lock:
+                if self._current is not current:
+                    return  # Finished while we were sampling
+                self._interrupted = seq
+                stats['hard'] += 1
+                self._flagged.add(app.name)
+                self._logger(app.name).error(
+                    f"[WATCHDOG] {phase} still running after {elapsed:.1f}s - "
+                    f"returning to launcher")
+                if self.interrupt:
+                    _interrupt_thread(thread_id, AppHangError)
+
+    def _sample(self, name: str, phase: str, elapsed: float, thread_id: int):
+        """Log the stack of the thread running the callback."""
+        frame = sys._current_frames().get(thread_id)
+        stack = ''.join(traceback.format_stack(frame)) if frame else '(no frame)\n'
+        self._logger(name).warning(
+            f"[WATCHDOG] {phase} has run for {elapsed * 1000:.0f}ms, stack:\n{stack}")
@@ -11,6 +11,8 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from matrixos.app_framework import render_app, run_fixed_steps
+
 # Suppress terminal output during tests
 import io
 _original_stdout = sys.stdout
@@ -106,12 +108,13 @@ class MockFramework:
             # Update active app
             if self.active_app:
                 delta = 1.0 / 60.0  # 60fps
+                if self.active_app.fixed_timestep:
+                    run_fixed_steps(self.active_app, delta)
                 self.active_app.on_update(delta)
                 
                 # Render if dirty
                 if self.active_app.dirty:
-                    self.matrix.clear()
-                    self.active_app.render(self.matrix)
+                    render_app(self.active_app, self.matrix)
                     self.matrix.show()
             
             self.frame_count += 1
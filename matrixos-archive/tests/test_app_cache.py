@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the warm app cache
+
+Tests that the launcher resumes resident apps instead of re-importing
+them, and that the LRU and memory limits evict (unregister) apps.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.app_framework import OSContext
+from matrixos.builtin_apps.launcher import App as LauncherApp
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.testing.input_simulator import InputSimulator
+
+# Framework app that records its lifecycle on the OS and exits at once
+APP_SOURCE = '''
+from matrixos.app_framework import App
+
+class CountingApp(App):
+    def __init__(self, name):
+        super().__init__(name)
+        self.score = 0
+
+    def on_activate(self):
+        self.os.lifecycle.append((self.name, 'activate', self.score))
+
+    def on_deactivate(self):
+        self.os.lifecycle.append((self.name, 'deactivate', self.score))
+
+    def on_update(self, delta_time):
+        self.score += 1
+        self.os.running = False  # Back to the launcher after one frame
+
+def run(os_context):
+    os_context.lifecycle.append(('{name}', 'import', 0))
+    app = CountingApp('{name}')
+    os_context.register_app(app)
+    os_context.switch_to_app(app)
+    os_context.run()
+'''
+
+
+def make_apps(tmp, names):
+    """Create launchable app folders."""
+    apps = []
+    for name in names:
+        folder = Path(tmp) / name
+        folder.mkdir()
+        (folder / "config.json").write_text(f'{{"name": "{name}"}}')
+        (folder / "main.py").write_text(APP_SOURCE.replace('{name}', name))
+        apps.append(LauncherApp(folder))
+    return apps
+
+
+def make_os():
+    os_context = OSContext(HeadlessDisplay(32, 16), InputSimulator())
+    os_context.lifecycle = []
+    os_context.app_cache.min_free_mb = 0  # Don't depend on this machine's memory
+    return os_context
+
+
+def test_relaunch_resumes_resident_app():
+    """Test a second launch resumes the same instance with its state."""
+    print("TEST: Relaunch resumes the resident app")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context = make_os()
+        (game,) = make_apps(tmp, ["Game"])
+
+        assert game.launch(os_context)
+        assert game.launch(os_context)
+
+        assert os_context.lifecycle == [
+            ('Game', 'import', 0),
+            ('Game', 'activate', 0),
+            ('Game', 'deactivate', 1),  # Suspended on leaving
+            ('Game', 'activate', 1),  # Resumed with its state
+            ('Game', 'deactivate', 2),
+        ], os_context.lifecycle
+        stats = os_context.app_cache.get_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1, stats
+        assert len(os_context.apps) == 1, "Resuming must not register it again"
+        assert os_context.active_app is None
+
+    print("✓ Imported once, resumed via on_activate()")
+
+
+def test_lru_eviction():
+    """Test the least recently used app is evicted past max_resident."""
+    print("\nTEST: LRU eviction")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context = make_os()
+        os_context.app_cache.max_resident = 2
+        a, b, c = make_apps(tmp, ["A", "B", "C"])
+
+        a.launch(os_context)
+        b.launch(os_context)
+        a.launch(os_context)  # A is now more recent than B
+        c.launch(os_context)
+
+        stats = os_context.app_cache.get_stats()
+        assert stats['resident'] == ['A', 'C'], stats
+        assert stats['evictions'] == 1
+        assert sorted(app.name for app in os_context.apps) == ['A', 'C'], \
+            "Evicted apps are unregistered"
+
+        b.launch(os_context)
+        imports = [name for name, what, _ in os_context.lifecycle if what == 'import']
+        assert imports == ['A', 'B', 'C', 'B'], imports
+
+    print("✓ B evicted and re-imported on its next launch")
+
+
+def test_memory_pressure_eviction():
+    """Test apps are evicted while memory is short, keeping the newest."""
+    print("\nTEST: Memory-based eviction")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context = make_os()
+        cache = os_context.app_cache
+        a, b, c = make_apps(tmp, ["A", "B", "C"])
+        a.launch(os_context)
+        b.launch(os_context)
+        assert len(cache) == 2
+
+        cache.memory_limit_mb = 0.001  # Any process is over this
+        c.launch(os_context)
+        assert cache.get_stats()['resident'] == ['C'], cache.get_stats()
+        assert [app.name for app in os_context.apps] == ['C']
+
+    print("✓ Older apps evicted under memory pressure")
+
+
+def run_all_tests():
+    """Run all app cache tests."""
+    print("=" * 70)
+    print("MATRIXOS APP CACHE TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_relaunch_resumes_resident_app,
+        test_lru_eviction,
+        test_memory_pressure_eviction,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
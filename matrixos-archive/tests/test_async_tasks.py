@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the background task manager
+
+Tests priority ordering, per-app concurrency limits, timeouts,
+cancellation, the future-like task handle, the CPU process pool,
+frame-budgeted callback delivery, keyed request coalescing,
+coroutines on the asyncio bridge and stopping and restarting.
+"""
+
+import sys
+import os
+import asyncio
+import math
+import threading
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.async_tasks import (
+    AsyncTaskManager, TaskCancelledError, TaskTimeoutError, current_token
+)
+
+
+def pump(manager, until, timeout=5.0):
+    """Process completions (as the OS loop does) until until() is true."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        manager.process_completed_tasks()
+        if until():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_priority_order():
+    """Test queued tasks run high priority first, FIFO within a priority."""
+    print("TEST: Priority order")
+
+    manager = AsyncTaskManager(num_workers=1)
+    gate = threading.Event()
+    order = []
+    manager.schedule_task(gate.wait, app_name="Blocker")
+    for name, priority in [("low", 'low'), ("normal-1", 'normal'),
+                           ("high", 'high'), ("normal-2", 'normal')]:
+        manager.schedule_task(lambda name=name: order.append(name), app_name="App",
+                              priority=priority)
+    manager.start()
+    try:
+        gate.set()
+        assert pump(manager, lambda: len(order) == 4)
+        assert order == ["high", "normal-1", "normal-2", "low"], order
+    finally:
+        manager.stop()
+
+    print("✓ high, normal (in order), low")
+
+
+def test_per_app_limit():
+    """Test one app's slow tasks can't hold every worker."""
+    print("\nTEST: Per-app concurrency limit")
+
+    manager = AsyncTaskManager(num_workers=2)
+    gate = threading.Event()
+    manager.start()
+    try:
+        slow = [manager.schedule_task(gate.wait, app_name="Weather") for _ in range(3)]
+        fast = manager.schedule_task(lambda: "icon", app_name="Launcher")
+
+        assert fast.result(timeout=2.0) == "icon", "Launcher task starved"
+        stats = manager.get_task_count()
+        assert stats['apps']['Weather'] == {'queued': 2, 'active': 1}, stats
+
+        manager.set_app_limit("Weather", 2)
+        assert pump(manager, lambda: manager.get_task_count()['active'] == 2)
+
+        gate.set()
+        assert pump(manager, lambda: all(task.done() for task in slow))
+    finally:
+        gate.set()
+        manager.stop()
+
+    print("✓ Weather held to one worker, launcher ran")
+
+
+def test_timeouts():
+    """Test queued and running tasks fail at their deadline."""
+    print("\nTEST: Timeouts")
+
+    manager = AsyncTaskManager(num_workers=1)
+    stopped = threading.Event()
+    results = []
+
+    def cooperative():
+        token = current_token()
+        while not token.wait(0.01):
+            pass
+        stopped.set()
+        token.raise_if_cancelled()
+
+    manager.start()
+    try:
+        running = manager.schedule_task(cooperative, results.append, "A", timeout=0.1)
+        queued = manager.schedule_task(lambda: "never", results.append, "B", timeout=0.05)
+
+        assert manager.next_deadline() is not None
+        assert pump(manager, lambda: len(results) == 2)
+        assert all(not r.success and isinstance(r.error, TaskTimeoutError) for r in results)
+        assert stopped.wait(1.0), "Timed-out task's token wasn't cancelled"
+        assert queued.value is None and not queued.success
+        try:
+            running.result(0)
+            assert False, "result() should raise"
+        except TaskTimeoutError:
+            pass
+    finally:
+        manager.stop()
+
+    print("✓ Both timed out; the running task saw its token")
+
+
+def test_future_interface():
+    """Test result(), exception(), done callbacks and cancel()."""
+    print("\nTEST: Future interface")
+
+    manager = AsyncTaskManager(num_workers=1)
+    gate = threading.Event()
+    ran = []
+    calls = []
+
+    blocker = manager.schedule_task(gate.wait, app_name="A")
+    ok = manager.schedule_task(lambda: 42, app_name="A")
+    bad = manager.schedule_task(lambda: 1 / 0, app_name="A")
+    doomed = manager.schedule_task(lambda: ran.append(True), calls.append, "A")
+    ok.add_done_callback(lambda task: calls.append(("done", task.id)))
+
+    assert not ok.done()
+    assert doomed.cancel()
+    assert not doomed.cancel(), "Second cancel is a no-op"
+    assert doomed.done() and doomed.cancelled()
+
+    manager.start()
+    try:
+        gate.set()
+        assert ok.result(timeout=2.0) == 42
+        assert isinstance(bad.exception(timeout=2.0), ZeroDivisionError)
+        assert pump(manager, lambda: not manager.tasks)
+        assert calls == [("done", ok.id)], calls
+        assert not ran, "Cancelled task ran"
+        try:
+            doomed.result(0)
+            assert False, "result() should raise"
+        except TaskCancelledError:
+            pass
+
+        late = []
+        ok.add_done_callback(late.append)
+        assert late == [ok], "Callback added after delivery runs at once"
+        assert blocker.done()
+    finally:
+        manager.stop()
+
+    print("✓ Values, errors, callbacks and cancellation")
+
+
+def test_cpu_tasks_run_in_processes():
+    """Test CPU tasks run in another process and report on the main thread."""
+    print("\nTEST: CPU process pool")
+
+    manager = AsyncTaskManager(num_workers=1, cpu_workers=1)
+    results = []
+    try:
+        try:
+            manager.schedule_cpu_task(lambda: 1)
+            assert False, "Lambdas can't be pickled to a process"
+        except TypeError:
+            pass
+        assert manager._cpu_pool is None, "Pool starts lazily"
+
+        pid = manager.schedule_cpu_task(os.getpid, (), results.append, "Icons")
+        failing = manager.schedule_cpu_task(math.sqrt, (-1,), results.append, "Icons")
+        assert manager.get_task_count()['cpu'] >= 1
+
+        assert pump(manager, lambda: len(results) == 2, timeout=30.0)
+        assert pid.result() != os.getpid()
+        assert results[0].success and results[0].result == pid.value
+        assert isinstance(failing.exception(), ValueError)
+        assert not results[1].success
+        assert manager.get_task_count()['cpu'] == 0
+
+        # Arguments are pickled by the pool: a bad one fails only its task
+        unpicklable = manager.schedule_cpu_task(len, ([lambda: 1],), results.append, "Icons")
+        assert pump(manager, lambda: len(results) == 3, timeout=30.0)
+        assert not results[2].success and unpicklable.exception() is not None
+    finally:
+        manager.stop()
+    assert manager._cpu_pool is None, "stop() left the process pool running"
+
+    print("✓ Ran in a worker process; errors delivered; lambdas rejected")
+
+
+def test_callback_budget_and_stats():
+    """Test callbacks over budget carry over, foreground first, with stats."""
+    print("\nTEST: Callback budget")
+
+    manager = AsyncTaskManager(num_workers=1)
+    delivered = []
+
+    def slow_callback(name):
+        def callback(result):
+            delivered.append(name)
+            time.sleep(0.01)
+        return callback
+
+    manager.start()
+    try:
+        tasks = [manager.schedule_task(lambda: None, slow_callback(name), name)
+                 for name in ("Clock", "Clock", "Game", "Game")]
+        assert all(task.exception(timeout=2.0) is None for task in tasks)
+
+        assert manager.process_completed_tasks(budget=0.015, foreground="Game") == 2
+        assert delivered == ["Game", "Game"], delivered
+        assert manager.has_ready_callbacks(), "Clock callbacks carried over"
+
+        assert manager.process_completed_tasks(budget=0.0) == 1, "At least one runs"
+        assert manager.process_completed_tasks() == 1
+        assert delivered == ["Game", "Game", "Clock", "Clock"]
+        assert not manager.has_ready_callbacks() and not manager.tasks
+
+        clock = manager.get_callback_stats("Clock")
+        assert clock['callbacks'] == 2 and clock['deferred'] == 3, clock
+        assert clock['wait_max'] > manager.get_callback_stats("Game")['wait_max']
+        assert clock['callback_max'] >= 0.01 and clock['callback_avg'] >= 0.01
+        assert set(manager.get_callback_stats()) == {"Clock", "Game"}
+        assert manager.get_callback_stats("Nobody") is None
+    finally:
+        manager.stop()
+
+    print("✓ Game first, Clock deferred to later frames, timings recorded")
+
+
+def test_keyed_tasks_coalesce():
+    """Test same-key requests share one run and cached results."""
+    print("\nTEST: Keyed coalescing")
+
+    manager = AsyncTaskManager(num_workers=2)
+    gate = threading.Event()
+    runs = []
+    results = []
+
+    def fetch():
+        runs.append(True)
+        gate.wait()
+        return "sunny"
+
+    manager.start()
+    try:
+        first = manager.schedule_task(fetch, results.append, "Weather",
+                                      key="weather", ttl=0.2)
+        second = manager.schedule_task(fetch, results.append, "Weather", key="weather")
+        other = manager.schedule_task(lambda: "other", None, "Clock", key="other")
+        assert second is not first
+        assert other.result(timeout=2.0) == "other"
+
+        gate.set()
+        assert pump(manager, lambda: len(results) == 2)
+        assert len(runs) == 1, "Duplicate request ran again"
+        assert [r.result for r in results] == ["sunny", "sunny"]
+        assert {r.task_id for r in results} == {first.id, second.id}
+
+        cached = manager.schedule_task(fetch, results.append, "Weather", key="weather")
+        assert cached.done() and cached.result() == "sunny", "Within ttl: done at once"
+        assert pump(manager, lambda: len(results) == 3)
+        assert len(runs) == 1
+
+        time.sleep(0.25)
+        fresh = manager.schedule_task(fetch, None, "Weather", key="weather")
+        assert fresh.result(timeout=2.0) == "sunny"
+        assert len(runs) == 2, "Expired result was reused"
+
+        failing = manager.schedule_task(lambda: 1 / 0, None, "Weather", key="bad", ttl=60)
+        assert isinstance(failing.exception(timeout=2.0), ZeroDivisionError)
+        assert pump(manager, lambda: not manager.tasks)
+        retry = manager.schedule_task(lambda: "ok", None, "Weather", key="bad", ttl=60)
+        assert retry.result(timeout=2.0) == "ok", "Failures aren't cached"
+
+        # Cancelling the run's owner hands it to a caller still waiting
+        gate.clear()
+        runs.clear()
+        owner = manager.schedule_task(fetch, None, "Weather", key="forecast", ttl=0.1)
+        waiter = manager.schedule_task(fetch, None, "Clock", key="forecast")
+        assert pump(manager, lambda: runs)
+        assert owner.cancel()
+        gate.set()
+        assert waiter.result(timeout=2.0) == "sunny" and not waiter.cancelled()
+        assert len(runs) == 2, "Waiter didn't run in the cancelled task's place"
+
+        # Expired results are pruned without looking their key up again
+        assert pump(manager, lambda: not manager.tasks)
+        assert "forecast" in manager._results
+        time.sleep(0.15)
+        manager.process_completed_tasks()
+        assert "forecast" not in manager._results and "bad" in manager._results
+    finally:
+        gate.set()
+        manager.stop()
+
+    print("✓ One run per key, shared by both callers; ttl reuse and expiry")
+
+
+def test_coroutines_run_concurrently():
+    """Test many coroutines wait at once and report on the main thread."""
+    print("\nTEST: Coroutines")
+
+    manager = AsyncTaskManager(num_workers=1)
+    results = []
+    threads = set()
+    stopped = threading.Event()
+    started = threading.Event()
+
+    async def fetch(n):
+        await asyncio.sleep(0.1)
+        return n * n
+
+    async def fail():
+        raise ValueError("bad response")
+
+    async def stall():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            stopped.set()
+            raise
+
+    def on_result(result):
+        threads.add(threading.current_thread())
+        results.append(result)
+
+    try:
+        try:
+            manager.schedule_coroutine(fetch, on_result)
+            assert False, "Needs a coroutine object, not the function"
+        except TypeError:
+            pass
+
+        start = time.monotonic()
+        tasks = [manager.schedule_coroutine(fetch(n), on_result, "Feeds") for n in range(30)]
+        assert manager.get_task_count()['coroutines'] > 0
+        assert pump(manager, lambda: len(results) == 30)
+        assert time.monotonic() - start < 1.5, "Coroutines ran one at a time"
+        assert sorted(r.result for r in results) == [n * n for n in range(30)]
+        assert threads == {threading.main_thread()}
+        assert tasks[3].result() == 9
+
+        failing = manager.schedule_coroutine(fail(), on_result, "Feeds")
+        assert isinstance(failing.exception(timeout=2.0), ValueError)
+
+        slow = manager.schedule_coroutine(stall(), on_result, "Feeds", timeout=0.1)
+        assert pump(manager, lambda: len(results) == 32)
+        assert isinstance(slow.exception(), TaskTimeoutError)
+        assert stopped.wait(1.0), "Timed-out coroutine wasn't cancelled"
+
+        doomed = manager.schedule_coroutine(stall(), on_result, "Feeds")
+        assert doomed.cancel() and doomed.cancelled()
+        assert pump(manager, lambda: not manager.tasks)
+        assert len(results) == 32, "Cancelled coroutine's callback ran"
+        assert manager.get_task_count()['coroutines'] == 0
+
+        stopped.clear()
+        started.clear()
+        pending = manager.schedule_coroutine(stall(), on_result, "Feeds")
+        assert started.wait(1.0)
+        loop_thread = manager._event_loop_thread
+    finally:
+        manager.stop()
+    assert not loop_thread.is_alive(), "stop() left the event loop running"
+    assert stopped.is_set() and pending.cancelled()
+
+    print("✓ 30 coroutines at once on one loop; errors, timeouts, cancellation")
+
+
+def test_stop_and_restart():
+    """Test stop() releases the manager's resources and start() reopens them."""
+    print("\nTEST: Stop and restart")
+
+    manager = AsyncTaskManager(num_workers=1)
+    results = []
+    manager.start()
+    read_fd = manager.wakeup_fileno()
+    assert read_fd is not None
+    manager.stop()
+    assert manager.wakeup_fileno() is None, "Wakeup pipe left open"
+    try:
+        os.fstat(read_fd)
+        assert False, "Wakeup fd not closed"
+    except OSError:
+        pass
+
+    manager.start()
+    try:
+        assert manager.wakeup_fileno() is not None
+        manager.schedule_task(lambda: 7, results.append, "App")
+        assert pump(manager, lambda: results)
+        assert results[0].result == 7
+    finally:
+        manager.stop()
+
+    print("✓ Wakeup pipe closed on stop, reopened on start")
+
+
+def run_all_tests():
+    """Run all async task tests."""
+    print("=" * 70)
+    print("MATRIXOS ASYNC TASK TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_priority_order,
+        test_per_app_limit,
+        test_timeouts,
+        test_future_interface,
+        test_cpu_tasks_run_in_processes,
+        test_callback_budget_and_stats,
+        test_keyed_tasks_coalesce,
+        test_coroutines_run_concurrently,
+        test_stop_and_restart,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
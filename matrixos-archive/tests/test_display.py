@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS display framebuffer
+
+Tests the packed RGB framebuffer, the buffer[y][x] compatibility shim,
+double buffering, dirty-rectangle tracking and terminal rendering
+(including delta rendering and the background presenter) from a packed
+display.
+"""
+
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.display import Display, TerminalRenderer, DamageTracker
+from matrixos.devices.display.terminal import TerminalDisplayDriver
+from matrixos.led_api import LEDMatrix
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.presenter import FramePresenter
+import threading
+
+
+# ============================================================================
+# Packed Framebuffer Tests
+# ============================================================================
+
+def test_packed_set_get_pixel():
+    """Test pixels round-trip through the packed framebuffer."""
+    print("TEST: Packed set_pixel/get_pixel")
+
+    display = Display(16, 8, color_mode='rgb')
+    assert display.packed, "RGB displays should be packed by default"
+    assert len(display.framebuffer) == 16 * 8 * 3, "3 bytes per pixel"
+
+    display.set_pixel(3, 2, (10, 20, 30))
+    assert display.get_pixel(3, 2) == (10, 20, 30), "Pixel should round-trip"
+    i = (2 * 16 + 3) * 3
+    assert bytes(display.pixels[i:i + 3]) == bytes((10, 20, 30)), "Bytes should be packed row-major"
+
+    # Out of bounds writes are ignored
+    display.set_pixel(-1, 0, (255, 0, 0))
+    display.set_pixel(16, 0, (255, 0, 0))
+    assert display.get_pixel(16, 0) == (0, 0, 0), "Out of bounds reads are black"
+
+    print("✓ Packed pixels round-trip correctly")
+
+
+def test_packed_color_normalization():
+    """Test that floats, bools and out-of-range channels are normalized."""
+    print("\nTEST: Packed colour normalization")
+
+    display = Display(4, 4, color_mode='rgb')
+    display.set_pixel(0, 0, (127.6, 300, -5))
+    assert display.get_pixel(0, 0) == (127, 255, 0), "Channels should be clamped to ints"
+
+    display.set_pixel(1, 0, True)
+    assert display.get_pixel(1, 0) == (255, 255, 255), "True should be white"
+
+    display.set_pixel(2, 0, (1, 2, 3, 255))
+    assert display.get_pixel(2, 0) == (1, 2, 3), "Alpha channel should be dropped"
+
+    print("✓ Colours are normalized")
+
+
+def test_packed_fill_and_clear():
+    """Test fill() and clear() on a packed display."""
+    print("\nTEST: Packed fill/clear")
+
+    display = Display(8, 4, color_mode='rgb')
+    display.fill((1, 2, 3))
+    assert display.get_pixel(7, 3) == (1, 2, 3), "Fill should cover every pixel"
+    assert display.framebuffer == bytearray((1, 2, 3)) * 32
+
+    display.clear()
+    assert not any(display.framebuffer), "Clear should zero the framebuffer"
+
+    print("✓ Fill and clear work on the packed framebuffer")
+
+
+def test_buffer_compatibility_shim():
+    """Test legacy buffer[y][x] access against the packed framebuffer."""
+    print("\nTEST: buffer[y][x] compatibility shim")
+
+    display = Display(8, 4, color_mode='rgb')
+    display.set_pixel(5, 1, (9, 8, 7))
+    assert display.buffer[1][5] == (9, 8, 7), "Shim reads should see set_pixel"
+
+    display.buffer[2][6] = (4, 5, 6)
+    assert display.get_pixel(6, 2) == (4, 5, 6), "Shim writes should reach the framebuffer"
+
+    assert len(display.buffer) == 4 and len(display.buffer[0]) == 8
+    assert list(display.buffer[1])[5] == (9, 8, 7), "Rows should iterate as tuples"
+    assert display.get_row(2)[6] == (4, 5, 6)
+
+    print("✓ Compatibility shim works")
+
+
+def test_unpacked_mode():
+    """Test the list-of-lists RGB mode is still available."""
+    print("\nTEST: Unpacked RGB mode")
+
+    display = Display(4, 4, color_mode='rgb', packed=False)
+    assert display.framebuffer is None
+    display.set_pixel(1, 1, (1, 1, 1))
+    assert display.buffer[1][1] == (1, 1, 1)
+
+    mono = Display(4, 4, color_mode='mono')
+    assert not mono.packed, "Mono displays are never packed"
+    mono.set_pixel(0, 0, True)
+    assert mono.get_pixel(0, 0) is True
+
+    print("✓ Unpacked and mono modes unchanged")
+
+
+def test_renderer_reads_packed_display():
+    """Test TerminalRenderer output from a packed display."""
+    print("\nTEST: Renderer on packed display")
+
+    packed = Display(4, 4, color_mode='rgb')
+    unpacked = Display(4, 4, color_mode='rgb', packed=False)
+    for display in (packed, unpacked):
+        display.set_pixel(1, 1, (255, 0, 0))
+        display.set_pixel(2, 2, (0, 255, 0))
+
+    assert TerminalRenderer(packed).render() == TerminalRenderer(unpacked).render(), \
+        "Packed and unpacked displays should render identically"
+
+    print("✓ Renderer output matches")
+
+
+# ============================================================================
+# Double Buffering Tests
+# ============================================================================
+
+def test_clear_is_in_place():
+    """Test that clear() reuses the existing buffers."""
+    print("\nTEST: In-place clear")
+
+    packed = Display(8, 8, color_mode='rgb')
+    framebuffer, pixels = packed.framebuffer, packed.pixels
+    packed.fill((5, 5, 5))
+    packed.clear()
+    assert packed.framebuffer is framebuffer, "clear() should not reallocate"
+    assert bytes(pixels[:3]) == b'\x00\x00\x00', "Existing memoryviews see the cleared frame"
+
+    for display in (Display(8, 8, color_mode='mono'), Display(8, 8, 'rgb', packed=False)):
+        rows = display.buffer
+        first_row = rows[0]
+        display.set_pixel(0, 0, True)
+        display.clear()
+        assert display.buffer is rows and display.buffer[0] is first_row, "Rows should be reused"
+        assert display.get_pixel(0, 0) in (False, (0, 0, 0))
+
+    print("✓ clear() works in place")
+
+
+def test_swap_keeps_previous_frame():
+    """Test that swap() keeps the presented frame in the front buffer."""
+    print("\nTEST: swap() front/back buffers")
+
+    display = Display(8, 8, color_mode='rgb')
+    assert display.front is None, "Front buffer is only allocated by swap()"
+    display.set_pixel(1, 1, (10, 10, 10))
+    assert display.get_front_row(1)[1] == (0, 0, 0)
+    display.swap()
+    assert display.get_front_row(1)[1] == (10, 10, 10), "Front holds the presented frame"
+    assert display.get_pixel(1, 1) == (10, 10, 10), "Back keeps its contents after swap"
+
+    display.clear()
+    display.set_pixel(2, 2, (20, 20, 20))
+    assert display.get_front_row(1)[1] == (10, 10, 10), "Front unchanged until next swap"
+    assert display.get_front_row(2)[2] == (0, 0, 0)
+
+    headless = HeadlessDisplay(8, 8)
+    headless.set_pixel(3, 3, (1, 2, 3))
+    headless.show()
+    headless.clear()
+    assert headless.history[-1][3][3] == (1, 2, 3), "HeadlessDisplay keeps the shown frame"
+    assert headless.get_pixel(3, 3) == (0, 0, 0)
+
+    print("✓ swap() keeps the previous frame")
+
+
+# ============================================================================
+# Damage Tracking Tests
+# ============================================================================
+
+def test_damage_merging():
+    """Test that touching rectangles merge and distant ones stay separate."""
+    print("\nTEST: Damage rectangle merging")
+
+    damage = DamageTracker(64, 64)
+    assert damage.is_empty
+
+    damage.add(0, 0, 4, 4)
+    damage.add(4, 0, 4, 4)  # Touches the first rect
+    damage.add(40, 40, 2, 2)
+    assert damage.get_rects() == [(0, 0, 8, 4), (40, 40, 2, 2)], damage.get_rects()
+
+    # Clipped to the framebuffer
+    damage.reset()
+    damage.add(60, -2, 10, 4)
+    assert damage.get_rects() == [(60, 0, 4, 2)], damage.get_rects()
+
+    print("✓ Damage rectangles merge correctly")
+
+
+def test_damage_clear_carries_drawn_regions():
+    """Test that clear() damages only what was drawn since the last clear."""
+    print("\nTEST: clear() damages previous frame")
+
+    damage = DamageTracker(64, 64)
+    damage.add(10, 10, 5, 5)
+    damage.reset()  # Frame 1 presented
+    assert damage.is_empty
+
+    damage.clear_frame()  # Frame 2 starts with clear()
+    damage.add(30, 30, 2, 2)
+    assert damage.get_rects() == [(10, 10, 5, 5), (30, 30, 2, 2)], damage.get_rects()
+
+    print("✓ Cleared regions are carried into damage")
+
+
+def test_matrix_primitives_report_damage():
+    """Test that LEDMatrix primitives and text report dirty rectangles."""
+    print("\nTEST: LEDMatrix damage from primitives")
+
+    matrix = LEDMatrix(64, 64)
+    matrix.rect(2, 2, 4, 4, (255, 0, 0), fill=True)
+    matrix.text("A", 40, 40, (0, 255, 0))
+    matrix.set_pixel(20, 30, (0, 0, 255))
+    assert matrix.get_dirty_rects() == [(2, 2, 4, 4), (40, 40, 8, 8), (20, 30, 1, 1)], \
+        matrix.get_dirty_rects()
+
+    matrix.display.reset_damage()
+    matrix.circle(32, 32, 3, (255, 255, 255))
+    assert matrix.get_dirty_rects() == [(29, 29, 7, 7)], matrix.get_dirty_rects()
+
+    matrix.fill((1, 1, 1))
+    assert matrix.get_dirty_rects() == [(0, 0, 64, 64)], "fill() damages everything"
+
+    print("✓ Primitives report damage")
+
+
+def test_driver_drawing_is_shown():
+    """Test drawing straight on a driver damages it, so show() outputs it."""
+    print("\nTEST: Direct driver drawing reaches the output")
+
+    driver = TerminalDisplayDriver(8, 4, threaded=False)
+    assert driver.initialize()
+    with redirect_stdout(io.StringIO()):
+        driver.set_pixel(1, 1, (255, 0, 0))
+        driver.show()
+        assert driver.frames_written == 1, "set_pixel() frame was skipped"
+
+        driver.show()
+        assert driver.frames_written == 1, "Unchanged frame is still skipped"
+
+        driver.hspan(0, 2, 4, (0, 255, 0))
+        driver.blit(bytes(6), 6, 0, 2, 1)
+        assert driver.get_dirty_rects() == [(0, 2, 4, 1), (6, 0, 2, 1)], \
+            driver.get_dirty_rects()
+        driver.show()
+
+        driver.clear()  # Wipes the span and blit drawn since the last clear
+        assert not driver.damage.is_empty
+        driver.show()
+    assert driver.frames_written == 3
+    assert driver.display.front is None, "show() made an unused front-buffer copy"
+    driver.cleanup()
+
+    print("✓ set_pixel, spans, blits and clear() produce frames")
+
+
+# ============================================================================
+# Delta Terminal Renderer Tests
+# ============================================================================
+
+def test_delta_renderer_full_then_changes():
+    """Test that delta rendering emits a full frame first, then only changes."""
+    print("\nTEST: Delta renderer")
+
+    display = Display(16, 8, color_mode='rgb')
+    display.fill((255, 0, 0))
+    renderer = TerminalRenderer(display, delta=True)
+
+    first = renderer.render_delta()
+    assert '\033[2J' in first, "First frame should clear the screen"
+    assert first.count('\033[38;5;196;48;5;196m') == 1, "Repeated colours share one SGR"
+    assert first.count('▀') == 16 * 4, "Every cell emitted"
+
+    assert renderer.render_delta() == '', "Unchanged frame emits nothing"
+
+    display.set_pixel(5, 2, (0, 0, 255))
+    second = renderer.render_delta()
+    assert second.startswith('\033[2;6H'), repr(second)
+    assert second.count('▀') == 1, "Only the changed cell is rewritten"
+    assert second.endswith(TerminalRenderer.RESET)
+
+    renderer.invalidate()
+    assert '\033[2J' in renderer.render_delta(), "invalidate() forces a full frame"
+
+    print("✓ Delta renderer only rewrites changed cells")
+
+
+def test_delta_renderer_coalesces_runs():
+    """Test that adjacent changed cells share one cursor move."""
+    print("\nTEST: Delta renderer run coalescing")
+
+    display = Display(16, 4, color_mode='rgb')
+    renderer = TerminalRenderer(display, delta=True)
+    renderer.render_delta()
+
+    for x in range(3, 8):
+        display.set_pixel(x, 0, (0, 255, 0))
+    out = renderer.render_delta()
+    assert out.count('H') == 1, "One cursor move for the whole run"
+    assert out.count('\033[38;5;46m') == 1, "One colour escape for the whole run"
+
+    # Turning cells off restores the default background
+    display.clear()
+    out = renderer.render_delta()
+    assert out.count('▀') == 0 and out.count(' ') == 5, repr(out)
+
+    print("✓ Runs are coalesced")
+
+
+def test_truecolor_and_sgr_coalescing():
+    """Test truecolor escapes and one SGR per colour change in render()."""
+    print("\nTEST: Truecolor output and SGR coalescing")
+
+    display = Display(8, 2, color_mode='rgb')
+    for x in range(4):
+        display.set_pixel(x, 0, (10, 20, 30))
+        display.set_pixel(x, 1, (10, 20, 30))
+
+    truecolor = TerminalRenderer(display, color_depth='truecolor').render()
+    assert truecolor.count('\033[38;2;10;20;30;48;2;10;20;30m') == 1, repr(truecolor)
+    assert truecolor.count('▀') == 4
+    assert '\033[39;49m' in truecolor, "Back to default colours for off cells"
+
+    palette = TerminalRenderer(display).render()
+    assert palette.count('\033[38;5;16;48;5;16m') == 1, repr(palette)
+    assert TerminalRenderer.rgb_to_ansi(255, 0, 0) == '\033[38;5;196m'
+
+    try:
+        TerminalRenderer(display, color_depth='16')
+        assert False, "Unknown colour depth should raise"
+    except ValueError:
+        pass
+
+    print("✓ Truecolor and coalesced SGR output")
+
+
+# ============================================================================
+# Frame Presenter Tests
+# ============================================================================
+
+def test_presenter_latest_frame_wins():
+    """Test that a slow sink drops stale frames and presents the newest."""
+    print("\nTEST: FramePresenter latest-frame-wins")
+
+    gate = threading.Event()
+    seen = []
+
+    def slow_sink(frame):
+        gate.wait(1.0)
+        seen.append(frame)
+
+    presenter = FramePresenter(slow_sink)
+    presenter.start()
+    presenter.submit(1)
+    # Give the thread time to pick up frame 1 and block in the sink
+    for _ in range(100):
+        if presenter.queued == 0:
+            break
+        threading.Event().wait(0.01)
+    presenter.submit(2)
+    presenter.submit(3)  # Replaces 2 before it is presented
+    assert presenter.queued == 1
+
+    gate.set()
+    assert presenter.wait_idle(1.0), "Presenter should drain"
+    presenter.stop()
+
+    assert seen == [1, 3], seen
+    stats = presenter.get_stats()
+    assert stats['presented'] == 2 and stats['dropped'] == 1 and stats['queued'] == 0, stats
+
+    print("✓ Stale frames are dropped")
+
+
+def test_presenter_survives_sink_errors():
+    """Test that a failing sink doesn't kill the output thread."""
+    print("\nTEST: FramePresenter sink errors")
+
+    seen = []
+
+    def sink(frame):
+        if frame == 'bad':
+            raise RuntimeError("boom")
+        seen.append(frame)
+
+    presenter = FramePresenter(sink)
+    presenter.start()
+    presenter.submit('bad')
+    presenter.wait_idle(1.0)
+    presenter.submit('good')
+    presenter.stop()  # Flushes the pending frame
+
+    assert seen == ['good'], seen
+    assert presenter.presented == 1
+
+    print("✓ Output thread keeps running after sink errors")
+
+
+def test_bulk_region_ops():
+    """Test fill_rect, hspan, vspan and blit on a packed display."""
+    print("\nTEST: Bulk region operations")
+
+    display = Display(8, 6, color_mode='rgb')
+    display.fill_rect(-2, -1, 4, 3, (255, 0, 0))  # Clipped to (0,0)-(1,1)
+    assert display.get_pixel(0, 0) == (255, 0, 0)
+    assert display.get_pixel(1, 1) == (255, 0, 0)
+    assert display.get_pixel(2, 0) == (0, 0, 0), "Fill should stop at the rect edge"
+    assert display.get_pixel(0, 2) == (0, 0, 0)
+
+    display.hspan(5, 3, 10, (0, 255, 0))  # Runs off the right edge
+    assert [display.get_pixel(x, 3) for x in range(5, 8)] == [(0, 255, 0)] * 3
+    display.vspan(7, -3, 5, (0, 0, 255))
+    assert [display.get_pixel(7, y) for y in range(2)] == [(0, 0, 255)] * 2
+    assert display.get_pixel(7, 2) == (0, 0, 0)
+
+    # Blit a 3x2 sprite with a transparent background
+    A, T = (9, 9, 9), (1, 2, 3)
+    display.clear()
+    display.blit([A, T, A, T, A, T], 6, 4, 3, 2, transparent=T)
+    assert display.get_pixel(6, 4) == A
+    assert display.get_pixel(7, 4) == (0, 0, 0), "Transparent pixels are skipped"
+    assert display.get_pixel(7, 5) == A
+
+    # Packed bytes copy rows directly
+    display.blit(bytes([5, 6, 7]) * 4, -1, 0, 2, 2)
+    assert display.get_pixel(0, 0) == (5, 6, 7)
+    assert display.get_pixel(0, 1) == (5, 6, 7)
+    assert display.get_pixel(1, 0) == (0, 0, 0)
+
+    print("✓ Bulk operations clip and copy correctly")
+
+
+def test_primitives_match_per_pixel_path():
+    """Test span-based primitives draw what the per-pixel fallback draws."""
+    print("\nTEST: Span primitives vs per-pixel fallback")
+
+    from matrixos import graphics
+    from matrixos.font import Font
+
+    packed = Display(32, 24, color_mode='rgb')
+    plain = HeadlessDisplay(32, 24)  # No bulk API, uses set_pixel
+    font = Font()
+
+    for target in (packed, plain):
+        graphics.draw_rect(target, 1, 1, 10, 6, (255, 0, 0))
+        graphics.draw_rect(target, 3, 3, 5, 2, (0, 255, 0), fill=True)
+        graphics.draw_circle(target, 20, 8, 6, (0, 0, 255), fill=True)
+        graphics.draw_ellipse(target, 12, 16, 9, 4, (255, 255, 0), fill=True)
+        graphics.draw_polygon(target, [(0, 23), (8, 12), (16, 23), (6, 20)],
+                              (0, 255, 255), fill=True)
+        font.draw_char(target, 'A', 24, 14, (255, 255, 255), (40, 40, 40))
+        font.draw_char(target, 'g', -3, 18, (200, 100, 0))
+
+    for y in range(24):
+        for x in range(32):
+            assert packed.get_pixel(x, y) == tuple(plain.get_pixel(x, y)), (x, y)
+
+    print("✓ Spans draw the same pixels as set_pixel loops")
+
+
+def run_all_tests():
+    """Run all display tests."""
+    print("=" * 70)
+    print("MATRIXOS DISPLAY UNIT TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_packed_set_get_pixel,
+        test_packed_color_normalization,
+        test_packed_fill_and_clear,
+        test_buffer_compatibility_shim,
+        test_unpacked_mode,
+        test_renderer_reads_packed_display,
+        test_clear_is_in_place,
+        test_swap_keeps_previous_frame,
+        test_delta_renderer_full_then_changes,
+        test_delta_renderer_coalesces_runs,
+        test_truecolor_and_sgr_coalescing,
+        test_presenter_latest_frame_wins,
+        test_presenter_survives_sink_errors,
+        test_damage_merging,
+        test_damage_clear_carries_drawn_regions,
+        test_matrix_primitives_report_damage,
+        test_driver_drawing_is_shown,
+        test_bulk_region_ops,
+        test_primitives_match_per_pixel_path,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
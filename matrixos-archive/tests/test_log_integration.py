@@ -11,10 +11,28 @@ Shows how to:
 
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from matrixos.testing import TestRunner
 from matrixos.input import InputEvent
+from matrixos.logger import LOG_DIR_ENV, flush_logs
+
+
+_log_dir = None
+
+
+def setup_module(module=None):
+    """Log to a temporary directory instead of settings/logs/."""
+    global _log_dir
+    _log_dir = tempfile.TemporaryDirectory()
+    os.environ[LOG_DIR_ENV] = _log_dir.name
+
+
+def teardown_module(module=None):
+    flush_logs()
+    os.environ.pop(LOG_DIR_ENV, None)
+    _log_dir.cleanup()
 
 
 def test_log_integration():
@@ -224,18 +242,22 @@ def main():
     passed = 0
     failed = 0
     
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except Exception as e:
-            print(f"✗ FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
-    
-    # Run demonstration
-    demonstrate_log_debugging_on_failure()
+    setup_module()
+    try:
+        for test in tests:
+            try:
+                test()
+                passed += 1
+            except Exception as e:
+                print(f"✗ FAILED: {e}")
+                import traceback
+                traceback.print_exc()
+                failed += 1
+        
+        # Run demonstration
+        demonstrate_log_debugging_on_failure()
+    finally:
+        teardown_module()
     
     print("=" * 70)
     print(f"Results: {passed} passed, {failed} failed")
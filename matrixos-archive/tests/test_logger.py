@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS logging pipeline
+
+Tests that log messages are batched into few writes, that errors are
+written immediately, that files rotate and drain on close, and the
+in-memory sink's indexed queries.
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.logger import LogWriter, LogSink, MatrixLogger, get_log_sink
+
+
+def read(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
+def test_messages_are_batched():
+    """Test many messages become a handful of writes."""
+    print("TEST: Batched writes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        writer = LogWriter(flush_interval=1.0)
+        for i in range(1000):
+            writer.write(path, f"line {i}\n")
+        assert writer.flush(), "Flush timed out"
+        lines = read(path).splitlines()
+        assert lines == [f"line {i}" for i in range(1000)], "Lines lost or reordered"
+        assert writer.writes <= 5, f"{writer.writes} writes for 1000 messages"
+        writer.close()
+
+    print(f"✓ 1000 messages in {writer.writes} writes")
+
+
+def test_urgent_messages_skip_the_interval():
+    """Test errors are written without waiting for the flush interval."""
+    print("\nTEST: Urgent writes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        writer = LogWriter(flush_interval=10.0)
+        writer.write(path, "info\n")
+        time.sleep(0.1)
+        assert read(path) == "", "Normal messages wait for the interval"
+
+        writer.write(path, "error\n", urgent=True)
+        deadline = time.monotonic() + 1.0
+        while read(path) != "info\nerror\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert read(path) == "info\nerror\n", read(path)
+        writer.close()
+
+    print("✓ Errors written immediately, with what was queued before them")
+
+
+def test_rotation():
+    """Test files rotate at max_bytes and keep backup_count copies."""
+    print("\nTEST: Size-based rotation")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        writer = LogWriter(max_bytes=100, backup_count=2)
+        for i in range(5):
+            writer.write(path, f"{i}" * 60 + "\n")
+            writer.flush()
+        writer.close()
+
+        # 61-byte lines: every second one crosses 100 bytes and rotates
+        assert read(path + ".1") == "2" * 60 + "\n" + "3" * 60 + "\n", "Newest copy is .1"
+        assert read(path + ".2").startswith("0")
+        assert not os.path.exists(path + ".3"), "Only backup_count copies kept"
+        assert read(path).startswith("4")
+
+    print("✓ Rotated to .1/.2, oldest dropped")
+
+
+def test_close_drains_queue():
+    """Test close() writes everything queued, and later writes still land."""
+    print("\nTEST: Drain on close")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = MatrixLogger("Drain", log_dir=tmp)
+        path = str(logger.log_file)
+        writer = LogWriter(flush_interval=10.0)
+        writer.write(path, "queued\n")
+        writer.close()
+        assert read(path).endswith("queued\n"), "Queued message lost"
+
+        writer.write(path, "late\n")
+        assert read(path).endswith("late\n"), "Writes after close go straight to disk"
+
+        logger.info("via logger")
+        logger.flush()
+        assert "INFO: via logger" in read(path)
+
+    print("✓ Nothing lost at shutdown")
+
+
+def test_sink_queries_and_eviction():
+    """Test indexed lookups by app and level, marks and eviction."""
+    print("\nTEST: Log sink queries")
+
+    sink = LogSink(capacity=5)
+    sink.add("Snake", "INFO", "started")
+    sink.add("Tetris", "ERROR", "boom")
+    mark = sink.mark()
+    sink.add("Snake", "ERROR", "crashed")
+    sink.add("snake", "INFO", "restarted")  # Same log as "Snake"
+
+    assert [r.message for r in sink.query("Snake")] == ["started", "crashed", "restarted"]
+    assert [r.message for r in sink.query("Snake", "ERROR")] == ["crashed"]
+    assert [r.app for r in sink.query(level="ERROR")] == ["Tetris", "Snake"]
+    assert [r.message for r in sink.query("Snake", since=mark)] == ["crashed", "restarted"]
+    assert sink.count("ed", "Snake") == 3 and sink.contains("boom", "Tetris")
+
+    for i in range(3):
+        sink.add("Clock", "DEBUG", f"tick {i}")
+    assert [r.message for r in sink.query("Snake")] == ["crashed", "restarted"], \
+        "Oldest records are evicted from the indexes too"
+    assert sink.query("Tetris") == [] and len(sink.query()) == 5
+    assert sink.query(level="ERROR")[0].format().endswith("ERROR: crashed")
+
+    print("✓ App/level indexes, marks and eviction agree")
+
+
+def test_logger_feeds_sink():
+    """Test MatrixLogger messages are queryable without touching the file."""
+    print("\nTEST: MatrixLogger records")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = get_log_sink()
+        mark = sink.mark()
+        logger = MatrixLogger("Sink Test", log_dir=tmp)
+        logger.warning("low battery")
+        logger.log("custom", level="TRACE")
+
+        records = sink.query("Sink Test", since=mark)
+        assert [r.level for r in records] == ["SESSION", "WARNING", "TRACE"], records
+        assert records[0].message.startswith("Session started")
+        assert sink.query("sink test", "WARNING")[-1].message == "low battery"
+        logger.flush()
+        assert records[1].format() in read(logger.log_file), \
+            "Sink and file lines match"
+
+    print("✓ Structured records match the file")
+
+
+def run_all_tests():
+    """Run all logger tests."""
+    print("=" * 70)
+    print("MATRIXOS LOGGER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_messages_are_batched,
+        test_urgent_messages_skip_the_interval,
+        test_rotation,
+        test_close_drains_queue,
+        test_sink_queries_and_eviction,
+        test_logger_feeds_sink,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
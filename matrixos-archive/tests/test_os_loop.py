@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS main loop
+
+Tests that OSContext.run sleeps while the active app is idle and wakes
+promptly for input, async task results, timers and animation frames,
+that fixed-timestep apps simulate at a steady rate, and that background
+ticks follow each app's interval within the per-frame budget.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.app_framework import App, OSContext, run_fixed_steps
+from matrixos.input import InputEvent
+from matrixos import async_tasks
+from matrixos.testing.display_adapter import HeadlessDisplay
+
+
+class PipeInput:
+    """Input handler fed through a pipe, like stdin."""
+
+    def __init__(self):
+        self.r, self.w = os.pipe()
+        os.set_blocking(self.r, False)
+
+    def fileno(self):
+        return self.r
+
+    def get_key(self, timeout=0.0):
+        try:
+            data = os.read(self.r, 64)
+        except BlockingIOError:
+            return None
+        return InputEvent(data.decode()[-1]) if data else None
+
+    def press(self, key):
+        os.write(self.w, key.encode())
+
+    def close(self):
+        os.close(self.r)
+        os.close(self.w)
+
+
+class IdleApp(App):
+    """Renders once, then only on events."""
+
+    def __init__(self, animate=False):
+        super().__init__("Idle")
+        self.animate = animate
+        self.updates = 0
+        self.events = []
+
+    def on_update(self, delta_time):
+        self.updates += 1
+        if self.animate:
+            self.dirty = True
+
+    def on_event(self, event):
+        self.events.append((event.key, time.monotonic()))
+        self.os.running = False
+        return True
+
+
+def make_os(app, input_handler):
+    """Create an OS with the app active and no animation hold."""
+    os_context = OSContext(HeadlessDisplay(32, 16), input_handler)
+    os_context.ANIMATION_HOLD = 0
+    os_context.register_app(app)
+    os_context.switch_to_app(app)
+    return os_context
+
+
+def test_idle_app_sleeps():
+    """Test the loop barely wakes while nothing is animating."""
+    print("TEST: Idle loop sleeps")
+
+    app = IdleApp()
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    os_context.call_later(0.3, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    # Initial render plus the timer - not 18 frames' worth of polling
+    assert os_context.wakeups < 8, f"Idle loop woke {os_context.wakeups} times"
+    print(f"✓ {os_context.wakeups} wakeups in 0.3s idle")
+
+
+def test_animating_app_gets_frames():
+    """Test an app that keeps redrawing still runs at the frame rate."""
+    print("\nTEST: Animating app gets frame deadlines")
+
+    app = IdleApp(animate=True)
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    os_context.call_later(0.3, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert app.updates >= 10, f"Only {app.updates} updates in 0.3s"
+    assert app.updates <= 25, f"{app.updates} updates - frame limit ignored"
+    print(f"✓ {app.updates} updates in 0.3s")
+
+
+def test_input_wakes_loop():
+    """Test a key press is delivered without waiting for a tick."""
+    print("\nTEST: Input wakes the loop")
+
+    app = IdleApp()
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    pressed = []
+
+    def press():
+        time.sleep(0.1)
+        pressed.append(time.monotonic())
+        keys.press('x')
+
+    threading.Thread(target=press, daemon=True).start()
+    os_context.call_later(2.0, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert app.events, "Key press should reach the app"
+    latency = app.events[0][1] - pressed[0]
+    assert latency < 0.05, f"Input took {latency * 1000:.1f}ms"
+    print(f"✓ Key delivered after {latency * 1000:.1f}ms")
+
+
+def test_task_completion_wakes_loop():
+    """Test a finished background task wakes the loop for its callback."""
+    print("\nTEST: Task completion wakes the loop")
+
+    app = IdleApp()
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    done = []
+
+    def work():
+        time.sleep(0.1)
+        return time.monotonic()
+
+    def on_complete(result):
+        done.append(time.monotonic() - result.result)
+        os_context.running = False
+
+    async_tasks.get_task_manager().start()
+    async_tasks.schedule_task(work, on_complete, "Test")
+    os_context.call_later(2.0, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert done, "Callback should run"
+    assert done[0] < 0.05, f"Callback ran {done[0] * 1000:.1f}ms after the task finished"
+    print(f"✓ Callback ran {done[0] * 1000:.1f}ms after completion")
+
+
+def test_cancelled_timer_does_not_fire():
+    """Test cancel_timer() stops a pending callback."""
+    print("\nTEST: Timer cancellation")
+
+    app = IdleApp()
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    fired = []
+    timer = os_context.call_later(0.05, lambda: fired.append(True))
+    os_context.cancel_timer(timer)
+    os_context.call_later(0.1, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert not fired, "Cancelled timer fired"
+    print("✓ Cancelled timers are skipped")
+
+
+def test_target_fps():
+    """Test an app's target_fps sets the frame rate."""
+    print("\nTEST: Per-app target_fps")
+
+    app = IdleApp(animate=True)
+    app.target_fps = 10
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    os_context.call_later(0.5, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert 3 <= app.updates <= 8, f"{app.updates} updates in 0.5s at 10fps"
+    print(f"✓ {app.updates} updates in 0.5s at 10fps")
+
+
+def test_on_demand_app():
+    """Test ON_DEMAND apps get no frames just for being dirty."""
+    print("\nTEST: On-demand app")
+
+    app = IdleApp(animate=True)
+    app.target_fps = App.ON_DEMAND
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    os_context.call_later(0.3, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert app.updates < 5, f"{app.updates} updates for an on-demand app"
+    print(f"✓ {app.updates} updates in 0.3s")
+
+
+def test_idle_frame_rate_drop():
+    """Test the frame rate drops without input and snaps back on a key."""
+    print("\nTEST: Idle frame-rate drop")
+
+    app = IdleApp(animate=True)
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    os_context.IDLE_TIMEOUT = 0.1
+    os_context.IDLE_FPS = 5
+    rates = []
+
+    os_context.call_later(0.05, lambda: rates.append(os_context.scheduled_fps))
+    os_context.call_later(0.4, lambda: rates.append(os_context.scheduled_fps))
+    os_context.call_later(0.5, lambda: keys.press('x'))
+    app.on_event = lambda event: rates.append('key') or True
+    os_context.call_later(0.55, lambda: rates.append(os_context.scheduled_fps))
+    os_context.call_later(0.6, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert rates == [60, 5, 'key', 60], rates
+
+    # Explicit rates and fixed-timestep games keep running at full speed
+    game = IdleApp(animate=True)
+    game.fixed_timestep = 1.0 / 60.0
+    keys = PipeInput()
+    os_context = make_os(game, keys)
+    os_context.IDLE_TIMEOUT = 0.0
+    assert os_context.get_frame_rate() == 60
+    game.fixed_timestep = None
+    game.target_fps = 30
+    assert os_context.get_frame_rate() == 30
+    game.idle_throttle = True
+    assert os_context.get_frame_rate() == os_context.IDLE_FPS
+    keys.close()
+    print("✓ 60fps -> 5fps when idle -> 60fps after input; games exempt")
+
+
+class FixedApp(App):
+    """Counts fixed steps and the alpha passed to render()."""
+
+    fixed_timestep = 0.01
+
+    def __init__(self):
+        super().__init__("Fixed")
+        self.steps = 0
+        self.alphas = []
+
+    def on_fixed_update(self, dt):
+        self.steps += 1
+        self.dirty = True
+
+    def render(self, matrix, alpha=None):
+        self.alphas.append(alpha)
+        super().render(matrix)
+
+
+def test_fixed_steps():
+    """Test the accumulator runs whole steps and keeps the remainder."""
+    print("\nTEST: Fixed timestep accumulator")
+
+    app = FixedApp()
+    assert run_fixed_steps(app, 0.025) == 2
+    assert abs(app.interpolation_alpha - 0.5) < 1e-6, app.interpolation_alpha
+    assert run_fixed_steps(app, 0.004) == 0, "Not a whole step yet"
+    assert run_fixed_steps(app, 0.001) == 1, "Remainder carried over"
+
+    # A long stall runs at most max_fixed_steps and drops the rest
+    app.steps = 0
+    assert run_fixed_steps(app, 1.0) == app.max_fixed_steps
+    assert app.fixed_accumulator < app.fixed_timestep
+    print("✓ Whole steps run, remainder kept, backlog capped")
+
+
+def test_fixed_timestep_app_in_loop():
+    """Test the OS steps a fixed-timestep app at its own rate."""
+    print("\nTEST: Fixed timestep app in the main loop")
+
+    app = FixedApp()
+    keys = PipeInput()
+    os_context = make_os(app, keys)
+    app.fixed_accumulator = 0.5  # Stale time from before activation...
+    os_context.switch_to_app(app)  # ...is discarded
+    os_context.call_later(0.3, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    # 100Hz simulation for 0.3s, whatever the frame rate
+    assert 20 <= app.steps <= 40, f"{app.steps} steps in 0.3s at 100Hz"
+    assert app.alphas and all(0.0 <= a < 1.0 for a in app.alphas), app.alphas
+    print(f"✓ {app.steps} steps, {len(app.alphas)} renders with alpha")
+
+
+class BackgroundApp(App):
+    """Records when its background ticks run."""
+
+    def __init__(self, name, interval=1.0, cost=0.0):
+        super().__init__(name)
+        self.background_interval = interval
+        self.cost = cost
+        self.ticks = []
+
+    def on_background_tick(self):
+        self.ticks.append(self.os.wakeups)
+        if self.cost:
+            time.sleep(self.cost)
+
+
+def test_background_intervals():
+    """Test each app is ticked at its own background_interval."""
+    print("\nTEST: Per-app background intervals")
+
+    fast = BackgroundApp("Fast", interval=0.05)
+    slow = BackgroundApp("Slow", interval=0.2)
+    keys = PipeInput()
+    os_context = make_os(IdleApp(), keys)
+    os_context.register_app(fast)
+    os_context.register_app(slow)
+    os_context.register_app(fast)  # Again, as a resumed cached app is - no double ticks
+    os_context.register_app(App("Plain"))  # No on_background_tick - not scheduled
+    os_context.call_later(0.5, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    assert 6 <= len(fast.ticks) <= 11, f"Fast ticked {len(fast.ticks)} times"
+    assert 1 <= len(slow.ticks) <= 3, f"Slow ticked {len(slow.ticks)} times"
+    assert len(os_context._background) == 2, "Only apps with ticks are scheduled"
+    assert os_context.apps.count(fast) == 1
+    print(f"✓ Fast ticked {len(fast.ticks)}x, slow {len(slow.ticks)}x in 0.5s")
+
+
+def test_background_budget_spreads_ticks():
+    """Test due ticks beyond the frame budget move to later frames."""
+    print("\nTEST: Background frame budget")
+
+    keys = PipeInput()
+    os_context = make_os(IdleApp(), keys)
+    os_context.BACKGROUND_FRAME_BUDGET = 0.005
+    os_context.BACKGROUND_TICK_BUDGET = 1.0  # Not testing throttling here
+    apps = [BackgroundApp(f"Bg{i}", interval=0.1, cost=0.004) for i in range(4)]
+    for app in apps:
+        os_context.register_app(app)
+    os_context.call_later(0.15, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    first_ticks = [app.ticks[0] for app in apps if app.ticks]
+    assert len(first_ticks) == 4, "Every app should tick"
+    assert len(set(first_ticks)) >= 2, f"All ticks ran in one frame: {first_ticks}"
+    print(f"✓ Ticks spread over loop iterations {sorted(set(first_ticks))}")
+
+
+def test_background_overrun_throttles():
+    """Test an app that keeps overrunning its budget is ticked less often."""
+    print("\nTEST: Background overrun throttling")
+
+    keys = PipeInput()
+    os_context = make_os(IdleApp(), keys)
+    os_context.BACKGROUND_TICK_BUDGET = 0.001
+    hog = BackgroundApp("Hog", interval=0.02, cost=0.003)
+    os_context.register_app(hog)
+    os_context.call_later(0.5, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+    keys.close()
+
+    stats = os_context.get_background_stats("Hog")
+    assert stats['overruns'] == stats['ticks'], stats
+    assert stats['throttle'] > 1, f"Hog not throttled: {stats}"
+    # Unthrottled it would tick ~25 times
+    assert stats['ticks'] < 20, f"{stats['ticks']} ticks despite throttling"
+    print(f"✓ {stats['ticks']} ticks, throttled to {stats['throttle']}x interval")
+
+
+def run_all_tests():
+    """Run all main loop tests."""
+    print("=" * 70)
+    print("MATRIXOS MAIN LOOP TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_idle_app_sleeps,
+        test_animating_app_gets_frames,
+        test_input_wakes_loop,
+        test_task_completion_wakes_loop,
+        test_cancelled_timer_does_not_fire,
+        test_target_fps,
+        test_on_demand_app,
+        test_idle_frame_rate_drop,
+        test_fixed_steps,
+        test_fixed_timestep_app_in_loop,
+        test_background_intervals,
+        test_background_budget_spreads_ticks,
+        test_background_overrun_throttles,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
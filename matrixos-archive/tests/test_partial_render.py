@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Unit tests for invalidation regions and partial rendering
+
+Tests display clipping, how invalidated regions are merged, that the OS
+repaints only those regions for partial_render apps, and that UI widgets
+stored on an app invalidate themselves exactly enough for a partial
+repaint to match a full redraw.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.app_framework import App, OSContext, render_app, take_invalid_regions
+from matrixos.display import Display
+from matrixos.led_api import LEDMatrix
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.ui import Button, Dialog, Label, ListWidget, ProgressBar
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+class PanelApp(App):
+    """Two coloured panels; records the clip of every render call."""
+
+    partial_render = True
+
+    def __init__(self):
+        super().__init__("Panels")
+        self.left = RED
+        self.right = BLUE
+        self.clips = []
+
+    def render(self, matrix, clip=None):
+        self.clips.append(clip)
+        matrix.rect(0, 0, 8, 8, self.left, fill=True)
+        matrix.rect(8, 0, 8, 8, self.right, fill=True)
+        super().render(matrix)
+
+
+class FormApp(App):
+    """Widgets held as attributes, drawn with partial rendering."""
+
+    partial_render = True
+
+    def __init__(self):
+        super().__init__("Form")
+        self.title = Label("HELLO", x=1, y=1, color=RED)
+        self.buttons = [Button("OK", x=1, y=12), Button("NO", x=30, y=12)]
+        self.menu = ListWidget(["ALPHA", "BETA"], x=0, y=26, width=64, height=22)
+
+    def render(self, matrix, clip=None):
+        self.title.render(matrix)
+        for button in self.buttons:
+            button.render(matrix)
+        self.menu.render(matrix)
+        super().render(matrix)
+
+
+def assert_matches_full_redraw(app, matrix):
+    """Compare matrix pixel for pixel with a fresh full render of app."""
+    full = LEDMatrix(matrix.width, matrix.height, 'rgb')
+    render_app(app, full, None)
+    diff = [(x, y) for y in range(matrix.height) for x in range(matrix.width)
+            if matrix.get_pixel(x, y) != full.get_pixel(x, y)]
+    assert not diff, f"{len(diff)} pixels differ from a full redraw, e.g. {diff[:4]}"
+
+
+def test_display_clip():
+    """Test drawing calls leave pixels outside the clip rect alone."""
+    print("TEST: Display clipping")
+
+    display = Display(16, 8, color_mode='rgb')
+    display.fill(BLUE)
+    assert display.set_clip((4, 2, 4, 4))
+    display.clear()
+    display.set_pixel(0, 0, RED)
+    display.fill_rect(0, 0, 16, 8, RED)
+    assert display.set_clip(None)
+
+    assert display.get_pixel(0, 0) == BLUE, "set_pixel/fill_rect outside the clip"
+    assert display.get_pixel(3, 2) == BLUE and display.get_pixel(8, 5) == BLUE
+    assert display.get_pixel(4, 2) == RED and display.get_pixel(7, 5) == RED
+
+    display.set_clip((100, 100, 5, 5))  # Off-screen: nothing is drawable
+    display.fill(RED)
+    display.set_clip(None)
+    assert display.get_pixel(15, 7) == BLUE
+
+    print("✓ set_pixel, fill_rect, clear and fill are clipped")
+
+
+def test_flood_fill_stops_at_clip():
+    """Test flood_fill terminates when the area extends past the clip rect."""
+    print("\nTEST: Flood fill inside a clip rect")
+
+    matrix = LEDMatrix(16, 8, 'rgb')
+    matrix.set_clip((2, 2, 4, 4))
+    matrix.flood_fill(3, 3, RED)
+    matrix.set_clip(None)
+    assert matrix.get_pixel(3, 3) == RED
+    assert matrix.get_pixel(0, 0) == (0, 0, 0)
+
+    print("✓ Fill limited to the clip rect")
+
+
+def test_invalid_regions_are_merged():
+    """Test overlapping rects merge and full invalidation wins."""
+    print("\nTEST: Invalid region merging")
+
+    app = PanelApp()
+    app.invalid_rects = []
+    app.invalidate((0, 0, 4, 4))
+    app.invalidate((2, 2, 4, 4))
+    app.invalidate((12, 0, 10, 10))  # Clipped to the screen
+    regions = take_invalid_regions(app, 16, 8)
+    assert sorted(regions) == [(0, 0, 6, 6), (12, 0, 4, 8)], regions
+    assert app.invalid_rects == [], "Regions are reset once taken"
+
+    app.invalidate((0, 0, 4, 4))
+    app.invalidate()
+    app.invalidate((8, 0, 4, 4))
+    assert take_invalid_regions(app, 16, 8) is None, "invalidate() means full redraw"
+
+    app.partial_render = False
+    app.invalidate((0, 0, 4, 4))
+    assert take_invalid_regions(app, 16, 8) is None
+
+    print("✓ Regions merged, clipped and reset")
+
+
+def test_partial_render_repaints_only_regions():
+    """Test only the invalidated region is cleared and rendered."""
+    print("\nTEST: Partial render")
+
+    matrix = HeadlessDisplay(16, 8)
+    app = PanelApp()
+    render_app(app, matrix, take_invalid_regions(app, 16, 8))
+    assert app.clips == [None], app.clips
+
+    matrix.set_pixel(0, 0, (9, 9, 9))  # Would be wiped by a full redraw
+    app.right = RED
+    app.invalidate((8, 0, 8, 8))
+    render_app(app, matrix, take_invalid_regions(app, 16, 8))
+
+    assert app.clips[-1] == (8, 0, 8, 8), app.clips
+    assert matrix.get_pixel(0, 0) == (9, 9, 9), "Left panel was repainted"
+    assert matrix.get_pixel(12, 4) == RED
+    assert matrix.clip_rect is None, "Clip must be reset after rendering"
+    assert not app.dirty
+
+    print("✓ Left panel untouched, right panel repainted under a clip")
+
+
+def test_widgets_invalidate_bound_app():
+    """Test widgets invalidate their bounds when their state changes."""
+    print("\nTEST: Widget invalidation")
+
+    app = PanelApp()
+    app.invalid_rects = []
+    app.dirty = False
+    button = Button("OK", x=2, y=3).bind(app)
+    bar = ProgressBar(x=0, y=20, width=30, height=4).bind(app)
+
+    button.focused = False  # Unchanged - no redraw
+    assert not app.dirty and app.invalid_rects == []
+
+    button.focused = True
+    assert app.dirty
+    assert app.invalid_rects[-1] == button.bounds == (2, 3, 24, 11), app.invalid_rects
+
+    app.invalid_rects = []
+    button.x = 10  # Moving repaints the old and new area
+    assert app.invalid_rects == [(10, 3, 24, 11), (2, 3, 24, 11)], app.invalid_rects
+
+    app.invalid_rects = []
+    bar.set_value(0.5)
+    assert app.invalid_rects == [(0, 20, 30, 4)]
+
+    dialog = Dialog("Hi", "There").bind(app)
+    dialog.selected_button = 0  # Unchanged
+    assert app.invalid_rects is not None
+    dialog.visible = False
+    assert app.invalid_rects is None, "Dialogs cover the whole screen"
+
+    print("✓ Focus, moves and values invalidate the right areas")
+
+
+def test_widget_changes_repaint_exactly():
+    """Test widget-driven partial repaints match a full redraw."""
+    print("\nTEST: Partial repaint matches full redraw")
+
+    matrix = LEDMatrix(64, 48, 'rgb')
+    app = FormApp()
+    assert app.title.app is None, "Bound before the OS saw the app"
+    OSContext(HeadlessDisplay(64, 48), None).register_app(app)
+    assert app.title.app is app and app.buttons[1].app is app, "Not bound on registration"
+    render_app(app, matrix, take_invalid_regions(app, 64, 48))
+
+    app.title.text = "WORLD"  # Same length: only the label's own region
+    render_app(app, matrix, take_invalid_regions(app, 64, 48))
+    assert_matches_full_redraw(app, matrix)
+
+    app.buttons[1].focused = True
+    app.menu.items[0] = "GAMMA"  # Edited in place
+    regions = take_invalid_regions(app, 64, 48)
+    assert regions is not None and len(regions) == 2, regions
+    render_app(app, matrix, regions)
+    assert_matches_full_redraw(app, matrix)
+
+    app.title.text = "HI"  # Shrinks: the old text area must be cleared
+    app.menu.items.append("DELTA")
+    render_app(app, matrix, take_invalid_regions(app, 64, 48))
+    assert_matches_full_redraw(app, matrix)
+
+    print("✓ Label, button and list edits repaint pixel-exact")
+
+
+def run_all_tests():
+    """Run all partial render tests."""
+    print("=" * 70)
+    print("MATRIXOS PARTIAL RENDER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_display_clip,
+        test_flood_fill_stops_at_clip,
+        test_invalid_regions_are_merged,
+        test_partial_render_repaints_only_regions,
+        test_widgets_invalidate_bound_app,
+        test_widget_changes_repaint_exactly,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Unit tests for process-isolated apps
+
+Tests that an app running in a child process draws into the OS's matrix
+through shared memory, receives forwarded input, is restarted after a
+crash and can be killed when it hangs.
+"""
+
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.app_framework import OSContext
+from matrixos.input import InputEvent
+from matrixos.logger import LOG_DIR_ENV, flush_logs
+from matrixos.process_runner import ProcessApp
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.testing.input_simulator import InputSimulator
+
+# Fills the screen red, green after OK; exits on BACK
+DRAWING_APP = '''
+from matrixos.app_framework import App
+from matrixos.input import InputEvent
+
+class FillApp(App):
+    color = (255, 0, 0)
+
+    def on_event(self, event):
+        if event.key == InputEvent.OK:
+            self.color = (0, 255, 0)
+            self.dirty = True
+            return True
+        return False
+
+    def render(self, matrix):
+        matrix.fill(self.color)
+        super().render(matrix)
+
+def run(os_context):
+    app = FillApp("Fill")
+    os_context.register_app(app)
+    os_context.switch_to_app(app)
+    os_context.run()
+'''
+
+CRASHING_APP = '''
+import os
+
+def run(os_context):
+    os._exit(3)
+'''
+
+HANGING_APP = '''
+def run(os_context):
+    while True:
+        pass
+'''
+
+
+_log_dir = None
+
+
+def setup_module(module=None):
+    """Log to a temporary directory (the children inherit it), not settings/logs/."""
+    global _log_dir
+    _log_dir = tempfile.TemporaryDirectory()
+    os.environ[LOG_DIR_ENV] = _log_dir.name
+
+
+def teardown_module(module=None):
+    flush_logs()
+    os.environ.pop(LOG_DIR_ENV, None)
+    _log_dir.cleanup()
+
+
+def make_app(tmp, source, **kwargs):
+    """Write main.py and create a ProcessApp for it on a headless OS."""
+    main_py = Path(tmp) / "main.py"
+    main_py.write_text(source)
+    os_context = OSContext(HeadlessDisplay(16, 8), InputSimulator())
+    app = ProcessApp("Child", main_py, **kwargs)
+    os_context.register_app(app)
+    return os_context, app
+
+
+def pump(app, matrix, until, timeout=10.0):
+    """Run the app's OS-side update/render until until() is true."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.on_update(0.0)
+        if app.dirty:
+            app.render(matrix)
+        if until():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_frames_and_input_cross_processes():
+    """Test the child's frames reach the OS matrix and input reaches the child."""
+    print("TEST: Frames and input cross the process boundary")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context, app = make_app(tmp, DRAWING_APP)
+        matrix = os_context.matrix
+        try:
+            os_context.switch_to_app(app)
+            assert app.is_running()
+            assert app.process.pid != os.getpid()
+
+            assert pump(app, matrix, lambda: matrix.get_pixel(3, 3) == (255, 0, 0)), \
+                "First frame never arrived"
+
+            app.on_event(InputEvent(InputEvent.OK))
+            assert pump(app, matrix, lambda: matrix.get_pixel(15, 7) == (0, 255, 0)), \
+                "Child didn't react to forwarded input"
+
+            app.on_event(InputEvent(InputEvent.BACK))  # Child leaves its app
+            assert pump(app, matrix, lambda: not os_context.running), \
+                "OS wasn't told the app exited"
+            assert app.exitcode == 0 and app.restarts == 0
+        finally:
+            app.stop()
+
+    print("✓ Frames copied to the matrix, OK forwarded, clean exit noticed")
+
+
+def test_crashing_child_is_restarted():
+    """Test a crashing child is restarted up to max_restarts times."""
+    print("\nTEST: Crash restarts")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context, app = make_app(tmp, CRASHING_APP, max_restarts=2)
+        try:
+            os_context.switch_to_app(app)
+            assert pump(app, os_context.matrix, lambda: not os_context.running), \
+                "OS never gave up on the crashing app"
+            assert app.restarts == 2, app.restarts
+            assert app.exitcode == 3, app.exitcode
+            assert not app.is_running()
+        finally:
+            app.stop()
+
+    print("✓ Restarted twice, then returned")
+
+
+def test_hung_child_can_be_killed():
+    """Test kill() stops a child stuck in a busy loop."""
+    print("\nTEST: Kill a hung child")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context, app = make_app(tmp, HANGING_APP)
+        try:
+            os_context.switch_to_app(app)
+            time.sleep(0.2)
+            assert app.is_running()
+
+            start = time.monotonic()
+            app.kill()
+            assert time.monotonic() - start < 2.5
+            assert not app.is_running()
+            assert app.exitcode is not None and app.exitcode != 0
+        finally:
+            app.stop()
+
+    print("✓ Hung child killed without blocking the OS")
+
+
+def run_all_tests():
+    """Run all process runner tests."""
+    print("=" * 70)
+    print("MATRIXOS PROCESS RUNNER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_frames_and_input_cross_processes,
+        test_crashing_child_is_restarted,
+        test_hung_child_can_be_killed,
+    ]
+
+    passed = 0
+    failed = 0
+
+    setup_module()
+    try:
+        for test in tests:
+            try:
+                test()
+                passed += 1
+            except AssertionError as e:
+                print(f"❌ FAILED: {e}")
+                failed += 1
+            except Exception as e:
+                print(f"❌ ERROR: {e}")
+                failed += 1
+    finally:
+        teardown_module()
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS frame profiler
+
+Tests the ring buffers and percentile summaries, the JSON dump, and the
+phase timings and overlay wired into OSContext.run.
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.profiler import RingBuffer, FrameProfiler, summarize
+from matrixos.app_framework import App, OSContext
+from matrixos.input import InputEvent
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.testing.input_simulator import InputSimulator
+
+
+def test_ring_buffer_wraps():
+    """Test the ring keeps only the newest samples."""
+    print("TEST: Ring buffer wraps")
+
+    ring = RingBuffer(4)
+    for value in range(6):
+        ring.add(float(value))
+    assert ring.values() == [2.0, 3.0, 4.0, 5.0], ring.values()
+    assert ring.count == 4 and ring.total == 6
+
+    ring.clear()
+    assert ring.values() == []
+
+    print("✓ Oldest samples are overwritten")
+
+
+def test_percentiles():
+    """Test the summary statistics."""
+    print("\nTEST: Percentile summary")
+
+    summary = summarize([float(v) for v in range(1, 101)])
+    assert summary['count'] == 100
+    assert summary['p50'] == 51.0, summary['p50']
+    assert summary['p95'] == 95.0, summary['p95']
+    assert summary['p99'] == 99.0, summary['p99']
+    assert summary['max'] == 100.0
+    assert summarize([])['p99'] == 0.0
+
+    print("✓ p50/p95/p99/max computed")
+
+
+def test_stats_and_dump():
+    """Test per-app stats and the JSON dump."""
+    print("\nTEST: Stats and JSON dump")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.json")
+        profiler = FrameProfiler(window=8, dump_path=path, dump_interval=10.0)
+        for ms in (1, 2, 3):
+            profiler.record("Tetris", "update", ms / 1000)
+        profiler.record("Clock", "background", 0.004)
+
+        stats = profiler.get_stats()
+        assert set(stats) == {"Tetris", "Clock"}
+        assert stats["Tetris"]["update"]["max"] == 0.003
+
+        assert not profiler.maybe_dump(), "Interval hasn't passed"
+        assert profiler.maybe_dump(profiler._last_dump + 11)
+        with open(path) as f:
+            report = json.load(f)
+        assert report["apps"]["Clock"]["background"]["count"] == 1
+
+    print("✓ Stats grouped by app and dumped as JSON")
+
+
+class BusyApp(App):
+    """Redraws every frame."""
+
+    def __init__(self):
+        super().__init__("Busy")
+
+    def on_update(self, delta_time):
+        self.dirty = True
+
+
+def test_os_records_phases_and_overlay():
+    """Test OSContext.run times each phase and F3 toggles the overlay."""
+    print("\nTEST: OS phase timings and overlay")
+
+    display = HeadlessDisplay(128, 64)
+    keys = InputSimulator()
+    os_context = OSContext(display, keys)
+    os_context.profiler.dump_path = None
+    app = BusyApp()
+    os_context.register_app(app)
+    os_context.switch_to_app(app)
+
+    keys.schedule_event(InputEvent.PROFILER, at_frame=0)
+    os_context.call_later(0.2, lambda: setattr(os_context, 'running', False))
+    os_context.run()
+
+    stats = os_context.get_profile("Busy")
+    for phase in ('input', 'tasks', 'update', 'render', 'show'):
+        assert phase in stats and stats[phase]['count'] > 0, f"No {phase} samples"
+    assert os_context.showing_profiler
+    assert any(text.startswith("FPS") for text in display.get_text_calls()), \
+        "Overlay should draw"
+
+    print("✓ Phases recorded per app and overlay drawn")
+
+
+def run_all_tests():
+    """Run all profiler tests."""
+    print("=" * 70)
+    print("MATRIXOS PROFILER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_ring_buffer_wraps,
+        test_percentiles,
+        test_stats_and_dump,
+        test_os_records_phases_and_overlay,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
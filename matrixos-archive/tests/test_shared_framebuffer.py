@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared-memory framebuffer display driver
+
+Tests frame publishing through shared memory and mmap'd files, the
+double-buffered front slot and the reader's seqlock validation.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.devices.display.shared_memory import (
+    SharedFramebufferDriver, SharedFramebufferReader
+)
+
+
+def test_shared_memory_round_trip():
+    """Test a published frame reaches a reader through shared memory."""
+    print("TEST: Shared memory round trip")
+
+    name = f"matrixos_test_{os.getpid()}"
+    driver = SharedFramebufferDriver(8, 4, name=name)
+    assert driver.initialize(), "Driver should create the segment"
+    try:
+        with SharedFramebufferReader(name=name) as reader:
+            assert (reader.width, reader.height) == (8, 4)
+            assert reader.frame_number() == 0, "Nothing published yet"
+
+            driver.set_pixel(2, 1, (10, 20, 30))
+            driver.mark_dirty(2, 1, 1, 1)
+            driver.show()
+
+            frame, pixels = reader.read_frame()
+            assert frame == 1
+            i = (1 * 8 + 2) * 3
+            assert bytes(pixels[i:i + 3]) == bytes((10, 20, 30))
+    finally:
+        driver.cleanup()
+
+    print("✓ Reader sees the published frame")
+
+
+def test_mmap_file_and_double_buffering():
+    """Test the mmap'd file backend flips between the two slots."""
+    print("\nTEST: mmap file double buffering")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fb")
+        driver = SharedFramebufferDriver(4, 4, path=path)
+        assert driver.initialize()
+        reader = SharedFramebufferReader(path=path)
+        try:
+            driver.fill((255, 0, 0))
+            driver.show()
+            frame, seq, view = reader.begin()
+            assert frame == 1 and bytes(view[:3]) == bytes((255, 0, 0))
+            view.release()
+
+            # No drawing since the last show: nothing is published
+            driver.show()
+            assert reader.frame_number() == 1
+
+            driver.fill((0, 0, 255))
+            driver.show()
+            frame, pixels = reader.read_frame()
+            assert frame == 2 and bytes(pixels[:3]) == bytes((0, 0, 255))
+            assert reader.wait_for_frame(1, timeout=0.1)
+            assert not reader.wait_for_frame(2, timeout=0.01)
+        finally:
+            reader.close()
+            driver.cleanup()
+
+    print("✓ Frames alternate slots and empty frames are skipped")
+
+
+def test_reader_detects_lapped_slot():
+    """Test validate() fails if the writer reuses the slot being read."""
+    print("\nTEST: Seqlock validation")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fb")
+        driver = SharedFramebufferDriver(4, 4, path=path)
+        assert driver.initialize()
+        reader = SharedFramebufferReader(path=path)
+        try:
+            driver.fill((1, 1, 1))
+            driver.show()
+            frame, seq, view = reader.begin()
+            view.release()
+            assert reader.validate(seq)
+
+            # Two more frames: the second one rewrites the slot we read
+            driver.fill((2, 2, 2))
+            driver.show()
+            assert reader.validate(seq), "The other slot was written"
+            driver.fill((3, 3, 3))
+            driver.show()
+            assert not reader.validate(seq), "Reader must notice it was lapped"
+        finally:
+            reader.close()
+            driver.cleanup()
+
+    print("✓ Torn reads are detected")
+
+
+def test_reader_rejects_foreign_file():
+    """Test the reader refuses files without the framebuffer header."""
+    print("\nTEST: Foreign file rejected")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "junk")
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 128)
+        try:
+            SharedFramebufferReader(path=path)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+    print("✓ Bad magic raises ValueError")
+
+
+def run_all_tests():
+    """Run all shared framebuffer tests."""
+    print("=" * 70)
+    print("MATRIXOS SHARED FRAMEBUFFER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_shared_memory_round_trip,
+        test_mmap_file_and_double_buffering,
+        test_reader_detects_lapped_slot,
+        test_reader_rejects_foreign_file,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS overrun watchdog
+
+Tests stack sampling past the soft threshold, flagging (and optionally
+interrupting) callbacks past the hard threshold, and the OS sending a hung
+app back to the launcher.
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.watchdog import Watchdog, AppHangError
+from matrixos.logger import MatrixLogger
+from matrixos.app_framework import App, OSContext
+from matrixos.testing.display_adapter import HeadlessDisplay
+from matrixos.testing.input_simulator import InputSimulator
+
+
+def use_temp_logger(watchdog, name, log_dir):
+    """Point the watchdog's logger for an app at a temp directory."""
+    logger = MatrixLogger(name, log_dir=log_dir)
+    watchdog._loggers[name] = logger
+    return logger
+
+
+def spin_until(deadline):
+    """Busy loop standing in for a hung on_update()."""
+    while time.monotonic() < deadline:
+        pass
+
+
+def test_soft_overrun_samples_stack():
+    """Test a slow callback gets one stack sample in the app's log."""
+    print("TEST: Soft overrun stack sample")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        watchdog = Watchdog(soft_threshold=0.1, hard_threshold=10.0)
+        logger = use_temp_logger(watchdog, "Slow", tmp)
+        app = App("Slow")
+
+        watchdog.enter(app, 'update')
+        start = watchdog._current[3]
+        watchdog.check(now=start + 0.05)
+        assert watchdog.get_stats("Slow") is None, "Under the soft threshold"
+        watchdog.check(now=start + 0.2)
+        watchdog.check(now=start + 0.3)  # Same callback - no second sample
+        watchdog.exit()
+
+        stats = watchdog.get_stats("Slow")
+        assert stats['soft'] == 1 and stats['hard'] == 0, stats
+        logger.flush()
+        with open(logger.log_file) as f:
+            log = f.read()
+        assert "update has run for" in log, log
+        assert "test_soft_overrun_samples_stack" in log, "Stack should be logged"
+        assert not watchdog.consume_flag(app)
+
+    print("✓ One sample with the caller's stack")
+
+
+def test_hard_overrun_flags_without_interrupting():
+    """Test by default a callback past the hard threshold is only flagged."""
+    print("\nTEST: Hard overrun flags the app")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        watchdog = Watchdog(soft_threshold=0.05, hard_threshold=0.1)
+        use_temp_logger(watchdog, "Slow", tmp)
+        app = App("Slow")
+        watchdog.start()
+        try:
+            watchdog.enter(app, 'update')
+            try:
+                spin_until(time.monotonic() + 0.4)  # Not interrupted
+            finally:
+                watchdog.exit()
+        finally:
+            watchdog.stop()
+
+        assert watchdog.get_stats("Slow")['hard'] == 1
+        assert watchdog.consume_flag(app)
+
+    print("✓ Ran to the end, flagged for the launcher")
+
+
+def test_hard_overrun_interrupts():
+    """Test with interrupt=True a hung callback gets AppHangError."""
+    print("\nTEST: Hard overrun interrupts the callback")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        watchdog = Watchdog(soft_threshold=0.05, hard_threshold=0.2, interrupt=True)
+        use_temp_logger(watchdog, "Hung", tmp)
+        app = App("Hung")
+        watchdog.start()
+        start = time.monotonic()
+        try:
+            watchdog.enter(app, 'update')
+            try:
+                spin_until(start + 3.0)
+            finally:
+                watchdog.exit()
+            assert False, "Should have been interrupted"
+        except AppHangError:
+            pass
+        finally:
+            watchdog.stop()
+
+        elapsed = time.monotonic() - start
+        assert elapsed < 1.0, f"Interrupted after {elapsed:.2f}s"
+        assert watchdog.get_stats("Hung")['hard'] == 1
+        assert watchdog.consume_flag(app)
+        assert not watchdog.consume_flag(app), "Flag is consumed once"
+
+    print(f"✓ Interrupted after {elapsed:.2f}s")
+
+
+class HangApp(App):
+    """Hangs in on_update() the first time it runs."""
+
+    def __init__(self):
+        super().__init__("Hang")
+        self.hangs = 0
+
+    def on_update(self, delta_time):
+        if self.hangs == 0:
+            self.hangs += 1
+            spin_until(time.monotonic() + 10.0)
+
+
+def test_os_returns_hung_app_to_launcher():
+    """Test OSContext.run recovers from an app stuck in on_update()."""
+    print("\nTEST: Hung app returned to launcher")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os_context = OSContext(HeadlessDisplay(32, 16), InputSimulator())
+        os_context.watchdog = Watchdog(soft_threshold=0.05, hard_threshold=0.3,
+                                       interrupt=True)
+        use_temp_logger(os_context.watchdog, "Hang", tmp)
+        launcher = App("Launcher")
+        os_context.set_launcher(launcher)
+        app = HangApp()
+        os_context.register_app(app)
+        os_context.switch_to_app(app)
+
+        start = time.monotonic()
+        os_context.call_later(0.1, lambda: setattr(os_context, 'running', False))
+        os_context.run()
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 2.0, f"Loop was stuck for {elapsed:.2f}s"
+    assert os_context.active_app is launcher, "Should be back at the launcher"
+    assert os_context.watchdog.get_stats("Hang")['hard'] == 1
+    print(f"✓ Back at the launcher after {elapsed:.2f}s")
+
+
+def run_all_tests():
+    """Run all watchdog tests."""
+    print("=" * 70)
+    print("MATRIXOS WATCHDOG TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_soft_overrun_samples_stack,
+        test_hard_overrun_flags_without_interrupting,
+        test_hard_overrun_interrupts,
+        test_os_returns_hung_app_to_launcher,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
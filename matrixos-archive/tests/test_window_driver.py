@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Pygame window display driver
+
+Runs headless on SDL's dummy video driver. Tests how LED pixels are
+scaled into the window with and without the LED gap, the cached gap
+mask, and that a partial change only repaints its dirty rects.
+Skipped when pygame isn't installed (it is an optional dependency).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+try:
+    import pygame
+    from matrixos.devices.display.macos_window import MacOSWindowDriver
+except ImportError:
+    pygame = None
+
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+BLACK = (0, 0, 0)
+
+
+def make_driver(pixel_gap):
+    """A 4x3 window at 3x scale (initialize() shows one black frame)."""
+    driver = MacOSWindowDriver(4, 3, scale=3, pixel_gap=pixel_gap)
+    assert driver.initialize(), "Dummy video driver should open a window"
+    return driver
+
+
+def screen_color(driver, x, y):
+    return tuple(driver.screen.get_at((x, y)))[:3]
+
+
+def test_scaled_pixels_without_gap():
+    """Test each LED becomes a solid scale x scale block."""
+    print("TEST: Scaling without a gap")
+    if pygame is None:
+        print("⊘ pygame not installed - skipped")
+        return
+
+    driver = make_driver(pixel_gap=0)
+    try:
+        driver.set_pixel(1, 1, RED)
+        driver.show()
+        for sy in range(3, 6):
+            for sx in range(3, 6):
+                assert screen_color(driver, sx, sy) == RED, (sx, sy)
+        assert screen_color(driver, 2, 3) == BLACK and screen_color(driver, 6, 5) == BLACK
+        assert screen_color(driver, 3, 6) == BLACK
+    finally:
+        driver.cleanup()
+
+    print("✓ 1 LED -> 3x3 window pixels")
+
+
+def test_scaled_pixels_with_gap():
+    """Test the gap mask blacks out the last row and column of each LED."""
+    print("\nTEST: Scaling with a 1px LED gap")
+    if pygame is None:
+        print("⊘ pygame not installed - skipped")
+        return
+
+    driver = make_driver(pixel_gap=1)
+    try:
+        driver.fill(GREEN)
+        driver.show()
+        for sx, sy in [(3, 3), (4, 3), (3, 4), (4, 4)]:
+            assert screen_color(driver, sx, sy) == GREEN, (sx, sy)
+        for sx, sy in [(5, 3), (5, 4), (3, 5), (5, 5)]:
+            assert screen_color(driver, sx, sy) == BLACK, f"Gap at {(sx, sy)} not drawn"
+
+        mask = driver._get_gap_mask(3)
+        assert mask.get_size() == (12, 9)
+        assert mask.get_at((0, 0)).a == 0 and mask.get_at((1, 1)).a == 0
+        assert mask.get_at((2, 0)) == (0, 0, 0, 255) and mask.get_at((0, 2)).a == 255
+        assert mask.get_at((11, 8)).a == 255
+        assert driver._get_gap_mask(3) is mask, "Gap mask rebuilt for the same scale"
+    finally:
+        driver.cleanup()
+
+    print("✓ 2x2 lit pixels per LED, gap rows/columns black, mask cached")
+
+
+def test_partial_change_updates_dirty_rects_only():
+    """Test a small change repaints and updates only its own rect."""
+    print("\nTEST: Partial window updates")
+    if pygame is None:
+        print("⊘ pygame not installed - skipped")
+        return
+
+    driver = make_driver(pixel_gap=0)
+    updates = []
+    real_update = pygame.display.update
+
+    def record_update(rects=None):
+        updates.append(rects)
+        real_update(rects)
+
+    pygame.display.update = record_update
+    try:
+        driver.frame.set_pixel(0, 2, GREEN)  # Behind the driver's back: no damage
+        driver.set_pixel(2, 0, BLUE)
+        driver.show()
+
+        assert updates == [[pygame.Rect(6, 0, 3, 3)]], updates
+        assert screen_color(driver, 6, 0) == BLUE and screen_color(driver, 8, 2) == BLUE
+        assert screen_color(driver, 0, 6) == BLACK, "Undamaged pixel was repainted"
+
+        driver.show()
+        assert len(updates) == 1, "Unchanged frame updated the window"
+    finally:
+        pygame.display.update = real_update
+        driver.cleanup()
+
+    print("✓ Only the damaged LED's rect was scaled and updated")
+
+
+def run_all_tests():
+    """Run all window driver tests."""
+    print("=" * 70)
+    print("MATRIXOS WINDOW DRIVER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_scaled_pixels_without_gap,
+        test_scaled_pixels_with_gap,
+        test_partial_change_updates_dirty_rects_only,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)